@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Callable
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+Data = dict[str, list[Any]]
+
+SIZES = {"tiny": 10, "medium": 100_000}
+
+
+def make_data(n_rows: int) -> Data:
+    return {
+        "a": list(range(n_rows)),
+        "b": [float(i % 7) for i in range(n_rows)],
+        "c": [f"key_{i % 3}" for i in range(n_rows)],
+    }
+
+
+def _constructors() -> Mapping[str, Callable[[Data], Any]]:
+    constructors: dict[str, Callable[[Data], Any]] = {}
+    if find_spec("pandas"):
+        import pandas as pd
+
+        constructors["pandas"] = pd.DataFrame
+    if find_spec("polars"):
+        import polars as pl
+
+        constructors["polars[eager]"] = pl.DataFrame
+        constructors["polars[lazy]"] = pl.LazyFrame
+    if find_spec("pyarrow"):
+        import pyarrow as pa
+
+        constructors["pyarrow"] = pa.table
+        if find_spec("duckdb"):
+            import duckdb
+
+            constructors["duckdb"] = lambda data: duckdb.from_arrow(pa.table(data))
+    if find_spec("pandas") and find_spec("dask") and find_spec("dask.dataframe"):
+        import dask.dataframe as dd
+        import pandas as pd
+
+        constructors["dask"] = lambda data: dd.from_pandas(
+            pd.DataFrame(data), npartitions=1
+        )
+    return constructors
+
+
+CONSTRUCTORS = _constructors()
+EAGER = frozenset(("pandas", "polars[eager]", "pyarrow"))
+
+
+@pytest.fixture(params=list(SIZES))
+def size(request: pytest.FixtureRequest) -> str:
+    return request.param  # type: ignore[no-any-return]
+
+
+@pytest.fixture(params=list(CONSTRUCTORS))
+def backend(request: pytest.FixtureRequest) -> str:
+    return request.param  # type: ignore[no-any-return]
+
+
+@pytest.fixture
+def native_frame(backend: str, size: str) -> Any:
+    return CONSTRUCTORS[backend](make_data(SIZES[size]))
+
+
+@pytest.fixture
+def native_eager_frame(backend: str, size: str) -> Any:
+    if backend not in EAGER:
+        pytest.skip(f"{backend} is not an eager backend")
+    return CONSTRUCTORS[backend](make_data(SIZES[size]))
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import narwhals as nw
+from narwhals._expression_parsing import compile_exprs, evaluate_nodes
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def build_exprs() -> list[nw.Expr]:
+    return [
+        nw.col("a"),
+        (nw.col("a") + nw.col("b") * 2).alias("sum"),
+        nw.col("b").sum().over("c").alias("total"),
+        nw.col("a").cum_sum().over(order_by="b").alias("running"),
+        nw.col("c").str.len_chars().alias("len"),
+    ]
+
+
+def test_build_exprs(benchmark: BenchmarkFixture) -> None:
+    benchmark(build_exprs)
+
+
+def test_evaluate_nodes(benchmark: BenchmarkFixture, native_frame: Any) -> None:
+    # Builds each compliant expression along with its `ExprMetadata`.
+    ns = nw.from_native(native_frame)._compliant_frame.__narwhals_namespace__()
+    exprs = build_exprs()
+    benchmark(lambda: [evaluate_nodes(expr._nodes, ns) for expr in exprs])
+
+
+def test_flatten_and_extract_cold(benchmark: BenchmarkFixture, native_frame: Any) -> None:
+    df = nw.from_native(native_frame)
+    exprs = build_exprs()
+    benchmark.pedantic(
+        df._flatten_and_extract,
+        args=(exprs,),
+        setup=compile_exprs.cache_clear,
+        rounds=200,
+    )
+
+
+def test_flatten_and_extract_cached(
+    benchmark: BenchmarkFixture, native_frame: Any
+) -> None:
+    df = nw.from_native(native_frame)
+    exprs = build_exprs()
+    benchmark(df._flatten_and_extract, exprs)
+
+
+def test_select_column_names(benchmark: BenchmarkFixture, native_frame: Any) -> None:
+    df = nw.from_native(native_frame)
+    benchmark(df.select, "a", "b")
+
+
+def test_with_columns(benchmark: BenchmarkFixture, native_frame: Any) -> None:
+    df = nw.from_native(native_frame)
+    benchmark(df.with_columns, (nw.col("a") + nw.col("b")).alias("d"))
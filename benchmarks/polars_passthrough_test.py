@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import narwhals as nw
+from benchmarks.conftest import SIZES, make_data
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("polars")
+import polars as pl
+
+
+@pytest.fixture
+def polars_frame(size: str) -> pl.DataFrame:
+    return pl.DataFrame(make_data(SIZES[size]))
+
+
+@pytest.mark.parametrize(
+    ("method", "args"),
+    [("head", (5,)), ("rename", ({"a": "d"},)), ("sort", ("b",)), ("clone", ())],
+)
+def test_getattr_passthrough(
+    benchmark: BenchmarkFixture,
+    polars_frame: pl.DataFrame,
+    method: str,
+    args: tuple[object, ...],
+) -> None:
+    # Methods which `PolarsDataFrame.__getattr__` forwards to the native frame.
+    compliant = nw.from_native(polars_frame)._compliant_frame
+    benchmark(lambda: getattr(compliant, method)(*args))
+
+
+@pytest.mark.parametrize(
+    ("method", "args"),
+    [("head", (5,)), ("rename", ({"a": "d"},)), ("sort", ("b",)), ("clone", ())],
+)
+def test_native(
+    benchmark: BenchmarkFixture,
+    polars_frame: pl.DataFrame,
+    method: str,
+    args: tuple[object, ...],
+) -> None:
+    # Reference for `test_getattr_passthrough`, without Narwhals.
+    benchmark(lambda: getattr(polars_frame, method)(*args))
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import narwhals as nw
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+np = pytest.importorskip("numpy")
+pa = pytest.importorskip("pyarrow")
+
+N_ROWS = 10_000_000
+
+
+@pytest.fixture(scope="module")
+def long_series() -> nw.Series[pa.ChunkedArray]:
+    rng = np.random.default_rng(0)
+    values = pa.array(rng.normal(size=N_ROWS), mask=rng.random(N_ROWS) < 0.05)
+    return nw.from_native(pa.chunked_array([values]), series_only=True)
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "rolling_sum",
+        "rolling_mean",
+        "rolling_var",
+        "rolling_std",
+        "rolling_min",
+        "rolling_max",
+        "rolling_median",
+    ],
+)
+@pytest.mark.parametrize("center", [False, True])
+def test_rolling_pyarrow(
+    benchmark: BenchmarkFixture,
+    long_series: nw.Series[pa.ChunkedArray],
+    method: str,
+    *,
+    center: bool,
+) -> None:
+    benchmark.pedantic(
+        getattr(long_series, method),
+        args=(100,),
+        kwargs={"min_samples": 50, "center": center},
+        rounds=5,
+    )
+
+
+@pytest.mark.parametrize("interpolation", ["nearest", "linear"])
+def test_rolling_quantile_pyarrow(
+    benchmark: BenchmarkFixture,
+    long_series: nw.Series[pa.ChunkedArray],
+    interpolation: str,
+) -> None:
+    benchmark.pedantic(
+        long_series.rolling_quantile,
+        args=(0.9, interpolation, 100),
+        kwargs={"min_samples": 50},
+        rounds=5,
+    )
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import narwhals as nw
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def test_schema_init(benchmark: BenchmarkFixture) -> None:
+    dtypes = [nw.Int64(), nw.Float64(), nw.String(), nw.Datetime("us")]
+    schema = {f"column_{i}": dtypes[i % len(dtypes)] for i in range(100)}
+    benchmark(nw.Schema, schema)
+
+
+def test_collect_schema(benchmark: BenchmarkFixture, native_frame: Any) -> None:
+    benchmark(nw.from_native(native_frame).collect_schema)
+
+
+def test_columns(benchmark: BenchmarkFixture, native_eager_frame: Any) -> None:
+    df = nw.from_native(native_eager_frame, eager_only=True)
+    benchmark(lambda: df.columns)
+
+
+def test_schema_to_native(benchmark: BenchmarkFixture, native_eager_frame: Any) -> None:
+    schema = nw.from_native(native_eager_frame, eager_only=True).schema
+    benchmark(schema.to_arrow)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import narwhals as nw
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def test_from_native(benchmark: BenchmarkFixture, native_frame: Any) -> None:
+    benchmark(nw.from_native, native_frame)
+
+
+def test_from_native_eager_only(
+    benchmark: BenchmarkFixture, native_eager_frame: Any
+) -> None:
+    benchmark(nw.from_native, native_eager_frame, eager_only=True)
+
+
+def test_from_native_narwhals_frame(
+    benchmark: BenchmarkFixture, native_frame: Any
+) -> None:
+    benchmark(nw.from_native, nw.from_native(native_frame))
+
+
+def test_to_native(benchmark: BenchmarkFixture, native_frame: Any) -> None:
+    benchmark(nw.from_native(native_frame).to_native)
+
+
+def test_to_native_function(benchmark: BenchmarkFixture, native_frame: Any) -> None:
+    benchmark(nw.to_native, nw.from_native(native_frame))
+
+
+def test_round_trip(benchmark: BenchmarkFixture, native_frame: Any) -> None:
+    benchmark(lambda: nw.from_native(native_frame).to_native())
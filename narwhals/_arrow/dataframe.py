@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Collection, Iterator, Mapping, Sequence
-from typing import TYPE_CHECKING, Any, Literal, cast, overload
+from itertools import chain, product
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, cast, overload
 
 import pyarrow as pa
 import pyarrow.compute as pc
@@ -9,7 +10,12 @@ import pyarrow.compute as pc
 from narwhals._arrow.series import ArrowSeries
 from narwhals._arrow.utils import (
     arange,
+    asof_indices,
     concat_tables,
+    first_occurrences,
+    group_codes,
+    group_median,
+    lit,
     narwhals_to_native_dtype,
     native_to_narwhals_dtype,
     repeat,
@@ -21,14 +27,13 @@ from narwhals._utils import (
     check_column_names_are_unique,
     convert_str_slice_to_int_slice,
     generate_temporary_column_name,
-    not_implemented,
     parse_columns_to_drop,
     scale_bytes,
     supports_arrow_c_stream,
     zip_strict,
 )
 from narwhals.dependencies import is_numpy_array_1d
-from narwhals.exceptions import ShapeError
+from narwhals.exceptions import ComputeError, InvalidOperationError, ShapeError
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -44,6 +49,8 @@ if TYPE_CHECKING:
     from narwhals._arrow.group_by import ArrowGroupBy
     from narwhals._arrow.namespace import ArrowNamespace
     from narwhals._arrow.typing import (  # type: ignore[attr-defined]
+        AggregateOptions,
+        Aggregation,
         ChunkedArrayAny,
         Order,
     )
@@ -54,8 +61,10 @@ if TYPE_CHECKING:
     from narwhals._utils import Version, _LimitedContext
     from narwhals.dtypes import DType
     from narwhals.typing import (
+        AsofJoinStrategy,
         IntoSchema,
         JoinStrategy,
+        PivotAgg,
         SizedMultiIndexSelector,
         SizedMultiNameSelector,
         SizeUnit,
@@ -82,6 +91,13 @@ class ArrowDataFrame(
     EagerDataFrame["ArrowSeries", "ArrowExpr", "pa.Table", "ChunkedArrayAny"]
 ):
     _implementation = Implementation.PYARROW
+    _PIVOT_AGGS: ClassVar[Mapping[str, tuple[Aggregation, AggregateOptions | None]]] = {
+        "min": ("min", None),
+        "max": ("max", None),
+        "sum": ("sum", pc.ScalarAggregateOptions(min_count=0)),
+        "mean": ("mean", None),
+        "len": ("count", pc.CountOptions(mode="all")),
+    }
 
     def __init__(
         self,
@@ -350,7 +366,46 @@ class ArrowDataFrame(
         sz = self.native.nbytes
         return scale_bytes(sz, unit)
 
-    explode = not_implemented()
+    def explode(self, columns: Sequence[str]) -> Self:
+        dtypes = self._version.dtypes
+
+        schema = self.collect_schema()
+        for col_to_explode in columns:
+            dtype = schema[col_to_explode]
+
+            if dtype != dtypes.List:
+                msg = (
+                    f"`explode` operation not supported for dtype `{dtype}`, "
+                    "expected List type"
+                )
+                raise InvalidOperationError(msg)
+
+        native = self.native
+        counts = pc.fill_null(pc.list_value_length(native[columns[0]]), 0)
+        if not all(
+            pc.all(
+                pc.equal(pc.fill_null(pc.list_value_length(native[name]), 0), counts)
+            ).as_py()
+            for name in columns[1:]
+        ):
+            msg = "exploded columns must have matching element counts"
+            raise ShapeError(msg)
+
+        # Null and empty lists explode to a single null, like in polars, so they are
+        # swapped for a list holding one null before flattening.
+        is_empty = pc.equal(counts, 0)
+        to_explode = {
+            name: pc.if_else(is_empty, pa.scalar([None], native[name].type), native[name])
+            for name in columns
+        }
+        indices = pc.list_parent_indices(to_explode[columns[0]])
+        result = {
+            name: pc.list_flatten(to_explode[name])
+            if name in to_explode
+            else native[name].take(indices)
+            for name in self.columns
+        }
+        return self._with_native(pa.table(result), validate_column_names=False)
 
     @property
     def columns(self) -> list[str]:
@@ -374,6 +429,51 @@ class ArrowDataFrame(
         df = pa.Table.from_arrays([s.native for s in reshaped], names=names)
         return self._with_native(df, validate_column_names=True)
 
+    def _evaluate_exprs(self, *exprs: ArrowExpr) -> Sequence[ArrowSeries]:
+        # Fusable expressions are all evaluated together, in a single Acero projection.
+        evaluate_unfused = super()._evaluate_expr
+        fused = {
+            i: expression
+            for i, expr in enumerate(exprs)
+            if (expression := expr._to_pc_expression()) is not None
+        }
+        fused_series: dict[int, list[ArrowSeries]] = {}
+        if fused:
+            names = [exprs[i]._evaluate_aliases(self)[0] for i in fused]
+            try:
+                projected = self._project(list(fused.values()), names)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                # Let the unfused path raise (or not) as usual.
+                pass
+            else:
+                fused_series = {
+                    i: [ArrowSeries(column, name=name, version=self._version)]
+                    for i, column, name in zip_strict(fused, projected.columns, names)
+                }
+        return tuple(
+            chain.from_iterable(
+                fused_series.get(i) or evaluate_unfused(expr)
+                for i, expr in enumerate(exprs)
+            )
+        )
+
+    def _evaluate_expr(self, expr: ArrowExpr, /) -> Sequence[ArrowSeries]:
+        if expr._to_pc_expression() is not None:
+            return self._evaluate_exprs(expr)
+        return super()._evaluate_expr(expr)
+
+    def _project(self, expressions: list[pc.Expression], names: list[str]) -> pa.Table:
+        from pyarrow import acero
+
+        source = acero.TableSourceNodeOptions(self.native)
+        project = acero.ProjectNodeOptions(expressions, names)
+        return acero.Declaration.from_sequence(
+            [
+                acero.Declaration("table_source", source),
+                acero.Declaration("project", project),
+            ]
+        ).to_table()
+
     def _extract_comparand(self, other: ArrowSeries) -> ChunkedArrayAny:
         length = len(self)
         if not other._broadcast:
@@ -459,7 +559,36 @@ class ArrowDataFrame(
             )
         )
 
-    join_asof = not_implemented()
+    def join_asof(
+        self,
+        other: Self,
+        *,
+        left_on: str,
+        right_on: str,
+        by_left: Sequence[str] | None,
+        by_right: Sequence[str] | None,
+        strategy: AsofJoinStrategy,
+        suffix: str,
+    ) -> Self:
+        by_left, by_right = by_left or [], by_right or []
+        left, right = self.native, other.native
+        indices = asof_indices(
+            left[left_on],
+            right[right_on],
+            [left[name] for name in by_left],
+            [right[name] for name in by_right],
+            strategy,
+        )
+        # Like Polars, keep `right_on` unless it's the same column as `left_on`.
+        drop = {*by_right, right_on} if right_on == left_on else set(by_right)
+        native = left
+        for name in right.column_names:
+            if name not in drop:
+                native = native.append_column(
+                    f"{name}{suffix}" if name in left.column_names else name,
+                    right[name].take(indices),
+                )
+        return self._with_native(native)
 
     def drop(self, columns: Sequence[str], *, strict: bool) -> Self:
         to_drop = parse_columns_to_drop(self, columns, strict=strict)
@@ -547,6 +676,8 @@ class ArrowDataFrame(
         return self._with_native(self.native.add_column(0, name, new_col))
 
     def filter(self, predicate: ArrowExpr) -> Self:
+        # NOTE: If `predicate` can be fused, we compute the mask with Acero, but we don't
+        # filter with it (`Table.filter(expression)`) as that is typically slower.
         mask_native = self._evaluate_single_output_expr(predicate).native
         return self._with_native(
             self.native.filter(mask_native), validate_column_names=False
@@ -832,4 +963,116 @@ class ArrowDataFrame(
         )
         return self._with_native(concat_tables(tables, "permissive"))
 
-    pivot = not_implemented()
+    def _pivot_aggregate(
+        self,
+        values: Sequence[str],
+        positions: _1DArray,
+        aggregate_function: PivotAgg | None,
+        /,
+    ) -> tuple[ChunkedArrayAny, pa.Table]:
+        """Aggregate `values` by `positions`, returning the distinct positions and one row for each."""
+        native = self.native.select(values)
+        key = generate_temporary_column_name(n_bytes=8, columns=values)
+        if aggregate_function == "median":
+            # `approximate_median` isn't exact, even for tiny groups.
+            encoded = pc.dictionary_encode(pa.array(positions))
+            groups, distinct = encoded.indices.to_numpy(), encoded.dictionary
+            return pa.chunked_array([distinct]), pa.table(
+                {
+                    name: group_median(native[name], groups, len(distinct))
+                    for name in values
+                }
+            )
+        if aggregate_function in {None, "first", "last"}:
+            # Like `unique(keep=...)`, pick a row from each group by its row number.
+            row = generate_temporary_column_name(n_bytes=8, columns=[key])
+            function = "max" if aggregate_function == "last" else "min"
+            aggregated = (
+                pa.table({key: positions, row: arange(0, len(native), 1)})
+                .group_by([key])
+                .aggregate([(row, function), (row, "count")])
+            )
+            if (
+                aggregate_function is None
+                and pc.any(pc.greater(aggregated[f"{row}_count"], 1)).as_py()
+            ):
+                msg = "Found multiple elements in the same group. Please pass an `aggregate_function`."
+                raise ComputeError(msg)
+            return aggregated[key], native.take(aggregated[f"{row}_{function}"])
+        function, options = self._PIVOT_AGGS[aggregate_function]
+        aggregated = (
+            native.append_column(key, pa.array(positions))
+            .group_by([key])
+            .aggregate([(name, function, options) for name in values])
+        )
+        return aggregated[key], aggregated.select(
+            [f"{name}_{function}" for name in values]
+        ).rename_columns(values)
+
+    def pivot(  # noqa: PLR0914
+        self,
+        on: Sequence[str],
+        *,
+        index: Sequence[str] | None,
+        values: Sequence[str] | None,
+        aggregate_function: PivotAgg | None,
+        sort_columns: bool,
+        separator: str,
+    ) -> Self:
+        import numpy as np  # ignore-banned-import
+
+        index, values = self._pivot_into_index_values(on, index, values)
+        native = self.native
+        # Number the output rows (`index` groups) and columns (`on` combinations) in
+        # the order in which they first appear, and find where each input row lands.
+        row_codes = group_codes(*(native[name] for name in index)).to_numpy()
+        col_codes = group_codes(*(native[name] for name in on)).to_numpy()
+        first_rows, first_cols = (
+            first_occurrences(row_codes),
+            first_occurrences(col_codes),
+        )
+        n_rows, n_cols = len(first_rows), len(first_cols)
+        positions = row_codes * n_cols + col_codes
+        positions, aggregated = self._pivot_aggregate(
+            values, positions, aggregate_function
+        )
+        # Scatter the aggregated rows into a grid of output rows by output columns.
+        grid = np.full(n_rows * n_cols, -1, dtype=np.int64)
+        grid[positions.to_numpy()] = np.arange(len(positions))
+        grid = grid.reshape(n_rows, n_cols)
+
+        on_values = native.select(on).take(first_cols)
+        col_order = (
+            pc.sort_indices(
+                on_values,
+                sort_keys=[(name, "ascending") for name in on],
+                null_placement="at_start",
+            ).to_numpy()
+            if sort_columns
+            else np.arange(n_cols)
+        )
+        on_names = [
+            pc.fill_null(on_values[name].cast(pa.string()), "null").to_pylist()
+            for name in on
+        ]
+        column_names = self._pivot_remap_column_names(
+            [
+                (value, *(names[i] for names in on_names))
+                for value in values
+                for i in col_order
+            ],
+            n_on=len(on),
+            n_values=len(values),
+            separator=separator,
+        )
+        result = native.select(index).take(first_rows)
+        for name, (value, i) in zip(column_names, product(values, col_order)):
+            is_missing = grid[:, i] < 0
+            column = aggregated[value].take(pa.array(grid[:, i], mask=is_missing))
+            if aggregate_function in {"len", "sum"} and is_missing.any():
+                # Like in Polars, missing combinations sum/count to zero. Groups of
+                # nulls already sum to zero too, as `min_count=0`.
+                zero = lit(0, column.type)
+                column = pc.if_else(pa.array(is_missing), zero, column)
+            result = result.append_column(name, column)
+        return self._with_native(result)
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import datetime as dt
 from typing import TYPE_CHECKING, Any, cast
 
 import pyarrow as pa
 import pyarrow.compute as pc
 
 from narwhals._arrow.series import ArrowSeries
+from narwhals._arrow.utils import Segments, narwhals_to_native_dtype
 from narwhals._compliant import EagerExpr
-from narwhals._expression_parsing import evaluate_nodes, evaluate_output_names_and_aliases
+from narwhals._expression_parsing import (
+    ExprKind,
+    evaluate_nodes,
+    evaluate_output_names_and_aliases,
+    is_expr,
+)
 from narwhals._utils import (
     Implementation,
     generate_temporary_column_name,
@@ -23,11 +30,71 @@ if TYPE_CHECKING:
     from narwhals._arrow.dataframe import ArrowDataFrame
     from narwhals._arrow.namespace import ArrowNamespace
     from narwhals._compliant.typing import AliasNames, EvalNames, EvalSeries
+    from narwhals._expression_parsing import ExprNode
     from narwhals._utils import Version, _LimitedContext
 
+# Elementwise operations which can be fused into a single `pc.Expression`, mapped
+# to the compute functions which `ArrowSeries` uses for them.
+_FUSABLE_BINARY_OPS: dict[str, Any] = {
+    "__eq__": pc.equal,
+    "__ne__": pc.not_equal,
+    "__lt__": pc.less,
+    "__le__": pc.less_equal,
+    "__gt__": pc.greater,
+    "__ge__": pc.greater_equal,
+    "__and__": pc.and_kleene,
+    "__or__": pc.or_kleene,
+    "__add__": pc.add,
+    "__sub__": pc.subtract,
+    "__rsub__": lambda x, y: pc.subtract(y, x),
+    "__mul__": pc.multiply,
+}
+_FUSABLE_UNARY_OPS: dict[str, Any] = {
+    "__invert__": pc.invert,
+    "abs": pc.abs,
+    "is_null": pc.is_null,
+    "is_nan": pc.is_nan,
+}
+_IS_BETWEEN_OPS: dict[str, tuple[Any, Any]] = {
+    "left": (pc.greater_equal, pc.less),
+    "right": (pc.greater, pc.less_equal),
+    "none": (pc.greater, pc.less),
+    "both": (pc.greater_equal, pc.less_equal),
+}
+_FUSABLE_LITERALS = (bool, int, float, str, dt.date, dt.time, dt.timedelta)
+
+_WINDOW_KINDS = frozenset((ExprKind.WINDOW, ExprKind.ORDERABLE_WINDOW))
+# Window functions which can be evaluated over partitions by `Segments`.
+_SEGMENTED_WINDOW_FUNCTIONS = frozenset(
+    (
+        "cum_count",
+        "cum_max",
+        "cum_min",
+        "cum_prod",
+        "cum_sum",
+        "diff",
+        "fill_null",
+        "rank",
+        "rolling_max",
+        "rolling_mean",
+        "rolling_median",
+        "rolling_min",
+        "rolling_quantile",
+        "rolling_std",
+        "rolling_sum",
+        "rolling_var",
+        "shift",
+    )
+)
+
 
 class ArrowExpr(EagerExpr["ArrowDataFrame", ArrowSeries]):
     _implementation: Implementation = Implementation.PYARROW
+    # Set by `ArrowNamespace` for expressions (such as `all_horizontal`) which don't
+    # get any metadata attached, but which can still be fused. Otherwise, it is
+    # computed (at most once) by `_to_pc_expression`.
+    _opt_pc_expression: pc.Expression | None = None
+    _is_fusable: bool | None = None
 
     def __init__(
         self,
@@ -93,6 +160,35 @@ class ArrowExpr(EagerExpr["ArrowDataFrame", ArrowSeries]):
 
         return ArrowNamespace(version=self._version)
 
+    def _to_pc_expression(self) -> pc.Expression | None:
+        """Fuse this expression into a single `pc.Expression`, if possible.
+
+        This is only possible for single-output, length-preserving chains of
+        elementwise operations on columns and literals (e.g. arithmetic, comparisons,
+        `is_between`, `is_in`). Evaluating those with Acero streams intermediate
+        results per batch, rather than materializing a `ChunkedArray` for each node.
+
+        Returns `None` if the expression can't be fused, or if fusing it wouldn't
+        save any work (e.g. `nw.col('a')`).
+        """
+        if self._opt_pc_expression is None and self._is_fusable is None:
+            self._opt_pc_expression = self._fuse()
+        self._is_fusable = self._opt_pc_expression is not None
+        return self._opt_pc_expression
+
+    def _fuse(self) -> pc.Expression | None:
+        if (md := self._opt_metadata) is None or not (
+            md.is_elementwise
+            and md.preserves_length
+            and not md.is_scalar_like
+            and not md.expansion_kind.is_multi_output()
+        ):
+            return None
+        nodes = tuple(reversed(tuple(md.iter_nodes_reversed())))
+        if all(_is_alias(node) for node in nodes[1:]):
+            return None
+        return _nodes_to_pc_expression(nodes, self._version)
+
     def _reuse_series_extra_kwargs(
         self, *, returns_scalar: bool = False
     ) -> dict[str, Any]:
@@ -129,7 +225,67 @@ class ArrowExpr(EagerExpr["ArrowDataFrame", ArrowSeries]):
             version=self._version,
         )
 
-    def over(self, partition_by: Sequence[str], order_by: Sequence[str]) -> Self:
+    def _over_segments(
+        self, partition_by: Sequence[str], order_by: Sequence[str]
+    ) -> Self:
+        # e.g. `nw.col('a').cum_sum().over('b', order_by='i')`.
+        # We sort by the partition keys (and then by `order_by`) once, evaluate the
+        # window function over all partitions at once, and then undo the sort.
+        meta = self._metadata
+        nodes = list(reversed(list(meta.iter_nodes_reversed())))
+        leaf = nodes[-1]
+        if (meta.prev is not None and not meta.prev.is_elementwise) or (
+            leaf.name not in _SEGMENTED_WINDOW_FUNCTIONS
+        ):
+            msg = (
+                f"`{leaf.name}` is not supported for `.over` with `partition_by` in "
+                "PyArrow backend, only elementary aggregations and "
+                f"{', '.join(sorted(_SEGMENTED_WINDOW_FUNCTIONS))}."
+            )
+            raise NotImplementedError(msg)
+
+        def func(df: ArrowDataFrame) -> Sequence[ArrowSeries]:
+            import numpy as np  # ignore-banned-import
+
+            plx = self.__narwhals_namespace__()
+            if meta.prev is not None:
+                df = df.with_columns(cast("ArrowExpr", evaluate_nodes(nodes[:-1], plx)))
+            _, aliases = evaluate_output_names_and_aliases(self, df, [])
+            native = df.native
+            # Partition keys are dictionary-encoded, so that nulls form their own group.
+            keys = [
+                native.column(name).dictionary_encode("encode").combine_chunks().indices
+                for name in partition_by
+            ]
+            sort_table = pa.Table.from_arrays(
+                [*keys, *(native.column(name) for name in order_by)],
+                names=[str(i) for i in range(len(keys) + len(order_by))],
+            )
+            sort_keys = [(name, "ascending") for name in sort_table.column_names]
+            indices = pc.sort_indices(
+                sort_table, sort_keys=sort_keys, null_placement="at_start"
+            )
+            segments = Segments.from_sorted_keys(
+                [key.take(indices) for key in keys], len(native)
+            )
+            inverse = np.empty(len(native), dtype=np.int64)
+            inverse[indices.to_numpy()] = np.arange(len(native))
+            results = []
+            for alias in aliases:
+                series = df.get_column(alias)
+                series = series._with_native(series.native.take(indices))
+                result = getattr(segments, leaf.name)(series, **leaf.kwargs)
+                results.append(result._with_native(result.native.take(inverse)))
+            return results
+
+        return self.__class__(
+            func,
+            evaluate_output_names=self._evaluate_output_names,
+            alias_output_names=self._alias_output_names,
+            version=self._version,
+        )
+
+    def over(self, partition_by: Sequence[str], order_by: Sequence[str]) -> Self:  # noqa: C901
         if not partition_by:
             assert order_by  # noqa: S101
             return self._over_without_partition_by(order_by)
@@ -140,9 +296,10 @@ class ArrowExpr(EagerExpr["ArrowDataFrame", ArrowSeries]):
         #
         # We first evaluate `prev` as-is, and then evaluate `leaf().over(...)`` by doing a `group_by`.
         meta = self._metadata
-        if partition_by and (
-            not meta.current_node.kind.is_scalar_like
-            or (meta.prev is not None and not meta.prev.is_elementwise)
+        if meta.current_node.kind in _WINDOW_KINDS:
+            return self._over_segments(partition_by, order_by)
+        if not meta.current_node.kind.is_scalar_like or (
+            meta.prev is not None and not meta.prev.is_elementwise
         ):
             msg = (
                 "Only elementary aggregations are supported for `.over` in PyArrow backend "
@@ -237,3 +394,71 @@ class ArrowExpr(EagerExpr["ArrowDataFrame", ArrowSeries]):
         )
 
     ewm_mean = not_implemented()
+
+
+def _is_alias(node: ExprNode) -> bool:
+    return node.name == "alias" or node.name.startswith("name.")
+
+
+def _nodes_to_pc_expression(  # noqa: C901, PLR0912
+    nodes: Sequence[ExprNode], version: Version
+) -> pc.Expression | None:
+    root, *rest = nodes
+    if root.name == "col" and len(names := root.kwargs["names"]) == 1:
+        expr = pc.field(names[0])
+    elif root.name == "lit" and isinstance(root.kwargs["value"], _FUSABLE_LITERALS):
+        value, dtype = root.kwargs["value"], root.kwargs["dtype"]
+        # Same as `ArrowNamespace.lit`, so that we infer the same data type.
+        native = pa.array([value])
+        if dtype is not None:
+            native = pc.cast(native, narwhals_to_native_dtype(dtype, version))
+        expr = _pc_literal(native[0])
+    else:
+        return None
+    for node in rest:
+        if _is_alias(node):
+            continue
+        if node.kind is not ExprKind.ELEMENTWISE:
+            return None
+        args = []
+        for arg in node.exprs:
+            if (arg_expr := _into_pc_expression(arg, node, version)) is None:
+                return None
+            args.append(arg_expr)
+        if (op := _FUSABLE_BINARY_OPS.get(node.name)) is not None:
+            expr = op(expr, *args)
+        elif (op := _FUSABLE_UNARY_OPS.get(node.name)) is not None:
+            expr = op(expr)
+        elif node.name == "is_between":
+            lower_op, upper_op = _IS_BETWEEN_OPS[node.kwargs["closed"]]
+            lower, upper = args
+            expr = pc.and_kleene(lower_op(expr, lower), upper_op(expr, upper))
+        elif node.name == "is_in":
+            other = node.kwargs["other"]
+            value_set = other if isinstance(other, pa.ChunkedArray) else pa.array(other)
+            expr = pc.is_in(expr, value_set=value_set)
+        elif node.name == "cast":
+            expr = expr.cast(narwhals_to_native_dtype(node.kwargs["dtype"], version))
+        else:
+            return None
+    return expr
+
+
+def _into_pc_expression(
+    arg: Any, node: ExprNode, version: Version
+) -> pc.Expression | None:
+    if isinstance(arg, str) and not node.str_as_lit:
+        return pc.field(arg)
+    if is_expr(arg):
+        return _nodes_to_pc_expression(arg._nodes, version)
+    if isinstance(arg, _FUSABLE_LITERALS):
+        # Same as `extract_native` does for broadcast literals.
+        return _pc_literal(pa.array([arg])[0])
+    return None
+
+
+def _pc_literal(scalar: pa.Scalar[Any]) -> pc.Expression:
+    # Acero narrows bare literals to the type of the other operand (e.g. `int32 + 1`
+    # would stay `int32`), whereas compute functions upcast to the literal's type.
+    # An explicit cast keeps the result the same as when evaluating unfused.
+    return pc.scalar(scalar).cast(scalar.type)
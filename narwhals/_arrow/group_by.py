@@ -6,10 +6,10 @@ from typing import TYPE_CHECKING, Any, ClassVar
 import pyarrow as pa
 import pyarrow.compute as pc
 
-from narwhals._arrow.utils import cast_to_comparable_string_types, extract_py_scalar
+from narwhals._arrow.utils import group_codes
 from narwhals._compliant import EagerGroupBy
 from narwhals._expression_parsing import evaluate_output_names_and_aliases
-from narwhals._utils import generate_temporary_column_name, requires
+from narwhals._utils import requires
 
 if TYPE_CHECKING:
     from collections.abc import Iterator, Mapping, Sequence
@@ -19,7 +19,6 @@ if TYPE_CHECKING:
     from narwhals._arrow.typing import (  # type: ignore[attr-defined]
         AggregateOptions,
         Aggregation,
-        Incomplete,
     )
     from narwhals._compliant.typing import NarwhalsAggregation
     from narwhals.typing import UniqueKeepStrategy
@@ -129,6 +128,8 @@ class ArrowGroupBy(EagerGroupBy["ArrowDataFrame", "ArrowExpr", "Aggregation"]):
         return grouped, pc.ScalarAggregateOptions(skip_nulls=ignore_nulls)
 
     def agg(self, *exprs: ArrowExpr) -> ArrowDataFrame:
+        if (result := self._agg_decomposed(exprs)) is not None:
+            return result
         self._ensure_all_simple(exprs)
         aggs: list[tuple[str, Aggregation, AggregateOptions | None]] = []
         expected_pyarrow_column_names: list[str] = self._keys.copy()
@@ -188,29 +189,20 @@ class ArrowGroupBy(EagerGroupBy["ArrowDataFrame", "ArrowExpr", "Aggregation"]):
         )
 
     def __iter__(self) -> Iterator[tuple[Any, ArrowDataFrame]]:
-        col_token = generate_temporary_column_name(
-            n_bytes=8, columns=self.compliant.columns
-        )
-        null_token: str = "__null_token_value__"  # noqa: S105
+        import numpy as np  # ignore-banned-import
 
         table = self.compliant.native
-        it, separator_scalar = cast_to_comparable_string_types(
-            *(table[key] for key in self._keys), separator=""
-        )
-        # NOTE: stubs indicate `separator` must also be a `ChunkedArray`
-        # Reality: `str` is fine
-        concat_str: Incomplete = pc.binary_join_element_wise
-        key_values = concat_str(
-            *it, separator_scalar, null_handling="replace", null_replacement=null_token
-        )
-        table = table.add_column(i=0, field_=col_token, column=key_values)
-
-        for v in pc.unique(key_values):
-            t = self.compliant._with_native(
-                table.filter(pc.equal(table[col_token], v)).drop([col_token])
-            )
-            row = t.simple_select(*self._keys).row(0)
-            yield (
-                tuple(extract_py_scalar(el) for el in row),
-                t.simple_select(*self._df.columns),
-            )
+        codes = group_codes(*(table[key] for key in self._keys))
+        # A stable sort by group keeps each group's rows in their original order,
+        # and the groups in the order in which they first appear.
+        order = pc.sort_indices(codes)
+        lengths = np.bincount(codes.to_numpy())
+        starts = np.cumsum(lengths) - lengths
+        first_rows = order.take(pa.array(starts, pa.int64()))
+        keys = table.select(self._keys).take(first_rows)
+        native = table.select(self._df.columns).take(order)
+        with_native = self.compliant._with_native
+        for key, start, length in zip(
+            zip(*(column.to_pylist() for column in keys.columns)), starts, lengths
+        ):
+            yield key, with_native(native.slice(start, length))
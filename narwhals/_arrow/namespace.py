@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import operator
 from functools import reduce
-from itertools import chain
+from itertools import chain, groupby
 from typing import TYPE_CHECKING, Literal
 
 import pyarrow as pa
@@ -21,7 +21,7 @@ from narwhals._expression_parsing import (
 from narwhals._utils import Implementation
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
     from narwhals._arrow.typing import ChunkedArrayAny, Incomplete, ScalarAny
     from narwhals._utils import Version
@@ -87,12 +87,20 @@ class ArrowNamespace(
                 series = (s.fill_null(True, None, None) for s in series)
             return [reduce(operator.and_, series)]
 
-        return self._expr._from_callable(
+        expr = self._expr._from_callable(
             func=func,
             evaluate_output_names=combine_evaluate_output_names(*exprs),
             alias_output_names=combine_alias_output_names(*exprs),
             context=self,
         )
+        # e.g. `df.filter(predicate_1, predicate_2)` ends up here, and doesn't get
+        # any metadata, so we fuse it now.
+        fused = [e._to_pc_expression() for e in exprs]
+        if all(x is not None for x in fused):
+            if ignore_nulls:
+                fused = [pc.coalesce(x, pc.scalar(True)) for x in fused]
+            expr._opt_pc_expression = reduce(pc.and_kleene, fused)
+        return expr
 
     def any_horizontal(self, *exprs: ArrowExpr, ignore_nulls: bool) -> ArrowExpr:
         def func(df: ArrowDataFrame) -> list[ArrowSeries]:
@@ -171,28 +179,41 @@ class ArrowNamespace(
             context=self,
         )
 
-    def _concat_diagonal(self, dfs: Sequence[pa.Table], /) -> pa.Table:
+    def _concat_diagonal(self, dfs: Iterable[pa.Table], /) -> pa.Table:
+        # Consecutive frames which share a schema are combined as they come, so that
+        # only one table per run needs promoting.
+        tables = [
+            _from_tables(group, schema)
+            for schema, group in groupby(dfs, key=lambda df: df.schema)
+        ]
         if self._backend_version >= (14,):
-            return pa.concat_tables(dfs, promote_options="default")
-        return pa.concat_tables(dfs, promote=True)  # pragma: no cover
+            return pa.concat_tables(tables, promote_options="default")
+        return pa.concat_tables(tables, promote=True)  # pragma: no cover
 
     def _concat_horizontal(self, dfs: Sequence[pa.Table], /) -> pa.Table:
         names = list(chain.from_iterable(df.column_names for df in dfs))
         arrays = tuple(chain.from_iterable(df.itercolumns() for df in dfs))
         return pa.Table.from_arrays(arrays, names=names)
 
-    def _concat_vertical(self, dfs: Sequence[pa.Table], /) -> pa.Table:
-        cols_0 = dfs[0].column_names
-        for i, df in enumerate(dfs[1:], start=1):
-            cols_current = df.column_names
-            if cols_current != cols_0:
-                msg = (
-                    "unable to vstack, column names don't match:\n"
-                    f"   - dataframe 0: {cols_0}\n"
-                    f"   - dataframe {i}: {cols_current}\n"
-                )
-                raise TypeError(msg)
-        return pa.concat_tables(dfs)
+    def _concat_vertical(self, dfs: Iterable[pa.Table], /) -> pa.Table:
+        it = iter(dfs)
+        df_0 = next(it)
+        cols_0 = df_0.column_names
+
+        def iter_checked() -> Iterator[pa.Table]:
+            yield df_0
+            for i, df in enumerate(it, start=1):
+                cols_current = df.column_names
+                if cols_current != cols_0:
+                    msg = (
+                        "unable to vstack, column names don't match:\n"
+                        f"   - dataframe 0: {cols_0}\n"
+                        f"   - dataframe {i}: {cols_current}\n"
+                    )
+                    raise TypeError(msg)
+                yield df
+
+        return _from_tables(iter_checked(), df_0.schema)
 
     @property
     def selectors(self) -> ArrowSelectorNamespace:
@@ -254,3 +275,13 @@ class ArrowNamespace(
     ) -> ChunkedArrayAny:
         otherwise = pa.nulls(len(when), then.type) if otherwise is None else otherwise
         return pc.if_else(when, then, otherwise)
+
+
+def _from_tables(tables: Iterable[pa.Table], schema: pa.Schema) -> pa.Table:
+    """Concatenate `tables` sharing `schema` from their record batches, without copying.
+
+    Unlike `pa.concat_tables`, `tables` is consumed one at a time.
+    """
+    return pa.Table.from_batches(
+        chain.from_iterable(table.to_batches() for table in tables), schema=schema
+    )
@@ -11,6 +11,7 @@ from narwhals._arrow.series_list import ArrowSeriesListNamespace
 from narwhals._arrow.series_str import ArrowSeriesStringNamespace
 from narwhals._arrow.series_struct import ArrowSeriesStructNamespace
 from narwhals._arrow.utils import (
+    RollingWindows,
     arange,
     cast_for_truediv,
     chunked_array,
@@ -21,7 +22,6 @@ from narwhals._arrow.utils import (
     narwhals_to_native_dtype,
     native_to_narwhals_dtype,
     nulls_like,
-    pad_series,
     zeros,
 )
 from narwhals._compliant import EagerSeries, EagerSeriesHist
@@ -928,110 +928,48 @@ class ArrowSeries(EagerSeries["ChunkedArrayAny"]):
         return self._with_native(result)
 
     def rolling_sum(self, window_size: int, *, min_samples: int, center: bool) -> Self:
-        min_samples = min_samples if min_samples is not None else window_size
-        padded_series, offset = pad_series(self, window_size=window_size, center=center)
-
-        cum_sum = padded_series.cum_sum(reverse=False).fill_null(
-            value=None, strategy="forward", limit=None
-        )
-        rolling_sum = (
-            cum_sum
-            - cum_sum.shift(window_size).fill_null(value=0, strategy=None, limit=None)
-            if window_size != 0
-            else cum_sum
-        )
-
-        valid_count = padded_series.cum_count(reverse=False)
-        count_in_window = valid_count - valid_count.shift(window_size).fill_null(
-            value=0, strategy=None, limit=None
-        )
-
-        result = self._with_native(
-            pc.if_else((count_in_window >= min_samples).native, rolling_sum.native, None)
-        )
-        return result._gather_slice(slice(offset, None))
+        windows = RollingWindows.from_window_size(len(self), window_size, center=center)
+        return windows.aggregate(self, "sum", min_samples=min_samples)
 
     def rolling_mean(self, window_size: int, *, min_samples: int, center: bool) -> Self:
-        min_samples = min_samples if min_samples is not None else window_size
-        padded_series, offset = pad_series(self, window_size=window_size, center=center)
-
-        cum_sum = padded_series.cum_sum(reverse=False).fill_null(
-            value=None, strategy="forward", limit=None
-        )
-        rolling_sum = (
-            cum_sum
-            - cum_sum.shift(window_size).fill_null(value=0, strategy=None, limit=None)
-            if window_size != 0
-            else cum_sum
-        )
-
-        valid_count = padded_series.cum_count(reverse=False)
-        count_in_window = valid_count - valid_count.shift(window_size).fill_null(
-            value=0, strategy=None, limit=None
-        )
-
-        result = (
-            self._with_native(
-                pc.if_else(
-                    (count_in_window >= min_samples).native, rolling_sum.native, None
-                )
-            )
-            / count_in_window
-        )
-        return result._gather_slice(slice(offset, None))
+        windows = RollingWindows.from_window_size(len(self), window_size, center=center)
+        return windows.aggregate(self, "mean", min_samples=min_samples)
 
     def rolling_var(
         self, window_size: int, *, min_samples: int, center: bool, ddof: int
     ) -> Self:
-        min_samples = min_samples if min_samples is not None else window_size
-        padded_series, offset = pad_series(self, window_size=window_size, center=center)
-
-        cum_sum = padded_series.cum_sum(reverse=False).fill_null(
-            value=None, strategy="forward", limit=None
-        )
-        rolling_sum = (
-            cum_sum
-            - cum_sum.shift(window_size).fill_null(value=0, strategy=None, limit=None)
-            if window_size != 0
-            else cum_sum
-        )
+        windows = RollingWindows.from_window_size(len(self), window_size, center=center)
+        return windows.aggregate(self, "var", min_samples=min_samples, ddof=ddof)
 
-        cum_sum_sq = (
-            pow(padded_series, 2)
-            .cum_sum(reverse=False)
-            .fill_null(value=None, strategy="forward", limit=None)
-        )
-        rolling_sum_sq = (
-            cum_sum_sq
-            - cum_sum_sq.shift(window_size).fill_null(value=0, strategy=None, limit=None)
-            if window_size != 0
-            else cum_sum_sq
-        )
+    def rolling_std(
+        self, window_size: int, *, min_samples: int, center: bool, ddof: int
+    ) -> Self:
+        windows = RollingWindows.from_window_size(len(self), window_size, center=center)
+        return windows.aggregate(self, "std", min_samples=min_samples, ddof=ddof)
 
-        valid_count = padded_series.cum_count(reverse=False)
-        count_in_window = valid_count - valid_count.shift(window_size).fill_null(
-            value=0, strategy=None, limit=None
-        )
+    def rolling_min(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        windows = RollingWindows.from_window_size(len(self), window_size, center=center)
+        return windows.extremum(self, "min", min_samples=min_samples)
 
-        result = self._with_native(
-            pc.if_else(
-                (count_in_window >= min_samples).native,
-                (rolling_sum_sq - (rolling_sum**2 / count_in_window)).native,
-                None,
-            )
-        ) / self._with_native(pc.max_element_wise((count_in_window - ddof).native, 0))
+    def rolling_max(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        windows = RollingWindows.from_window_size(len(self), window_size, center=center)
+        return windows.extremum(self, "max", min_samples=min_samples)
 
-        return result._gather_slice(slice(offset, None, None))
+    def rolling_median(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        windows = RollingWindows.from_window_size(len(self), window_size, center=center)
+        return windows.quantile(self, 0.5, "linear", min_samples=min_samples)
 
-    def rolling_std(
-        self, window_size: int, *, min_samples: int, center: bool, ddof: int
+    def rolling_quantile(
+        self,
+        quantile: float,
+        interpolation: RollingInterpolationMethod,
+        window_size: int,
+        *,
+        min_samples: int,
+        center: bool,
     ) -> Self:
-        return (
-            self.rolling_var(
-                window_size=window_size, min_samples=min_samples, center=center, ddof=ddof
-            )
-            ** 0.5
-        )
+        windows = RollingWindows.from_window_size(len(self), window_size, center=center)
+        return windows.quantile(self, quantile, interpolation, min_samples=min_samples)
 
     def rank(self, method: RankMethod, *, descending: bool) -> Self:
         if method == "average":
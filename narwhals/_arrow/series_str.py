@@ -15,13 +15,37 @@ from narwhals._arrow.utils import (
 from narwhals._compliant.any_namespace import StringNamespace
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from narwhals._arrow.series import ArrowSeries
-    from narwhals._arrow.typing import Incomplete
+    from narwhals._arrow.typing import ChunkedArrayAny, Incomplete
 
 
 class ArrowSeriesStringNamespace(ArrowSeriesNamespace, StringNamespace["ArrowSeries"]):
+    def _map_values(
+        self, function: Callable[[ChunkedArrayAny], ChunkedArrayAny]
+    ) -> ArrowSeries:
+        """Apply `function` to the strings.
+
+        Dictionary-encoded strings only have their (distinct) values transformed, and
+        the results are then expanded back to one value per row, so that (like in
+        Polars) string results are plain strings either way.
+        """
+        native = self.native
+        if not pa.types.is_dictionary(native.type):
+            return self.with_native(function(native))
+        native = native.unify_dictionaries()
+        dictionary = (
+            native.chunk(0).dictionary
+            if native.num_chunks
+            else pa.array([], native.type.value_type)
+        )
+        values = function(pa.chunked_array([dictionary])).combine_chunks()
+        chunks = [values.take(chunk.indices) for chunk in native.chunks]
+        return self.with_native(pa.chunked_array(chunks, type=values.type))
+
     def len_chars(self) -> ArrowSeries:
-        return self.with_native(pc.utf8_length(self.native))
+        return self._map_values(pc.utf8_length)
 
     def replace(
         self, value: ArrowSeries, pattern: str, *, literal: bool, n: int
@@ -31,10 +55,10 @@ class ArrowSeriesStringNamespace(ArrowSeriesNamespace, StringNamespace["ArrowSer
         if not isinstance(value_native, pa.StringScalar):
             msg = "PyArrow backed `.str.replace` only supports str replacement values"
             raise TypeError(msg)
-        arr = fn(
-            self.native, pattern, replacement=value_native.as_py(), max_replacements=n
+        replacement = value_native.as_py()
+        return self._map_values(
+            lambda arr: fn(arr, pattern, replacement=replacement, max_replacements=n)
         )
-        return self.with_native(arr)
 
     def replace_all(
         self, value: ArrowSeries, pattern: str, *, literal: bool
@@ -42,81 +66,85 @@ class ArrowSeriesStringNamespace(ArrowSeriesNamespace, StringNamespace["ArrowSer
         return self.replace(value, pattern, literal=literal, n=-1)
 
     def strip_chars(self, characters: str | None) -> ArrowSeries:
-        return self.with_native(
-            pc.utf8_trim(self.native, characters or string.whitespace)
+        return self._map_values(
+            lambda arr: pc.utf8_trim(arr, characters or string.whitespace)
         )
 
     def starts_with(self, prefix: str) -> ArrowSeries:
-        return self.with_native(pc.equal(self.slice(0, len(prefix)).native, lit(prefix)))
+        return self._map_values(
+            lambda arr: pc.equal(_slice(arr, 0, len(prefix)), lit(prefix))
+        )
 
     def ends_with(self, suffix: str) -> ArrowSeries:
-        return self.with_native(
-            pc.equal(self.slice(-len(suffix), None).native, lit(suffix))
+        return self._map_values(
+            lambda arr: pc.equal(_slice(arr, -len(suffix), None), lit(suffix))
         )
 
     def contains(self, pattern: str, *, literal: bool) -> ArrowSeries:
         check_func = pc.match_substring if literal else pc.match_substring_regex
-        return self.with_native(check_func(self.native, pattern))
+        return self._map_values(lambda arr: check_func(arr, pattern))
 
     def slice(self, offset: int, length: int | None) -> ArrowSeries:
-        stop = offset + length if length is not None else None
-        return self.with_native(
-            pc.utf8_slice_codeunits(self.native, start=offset, stop=stop)
-        )
+        return self._map_values(lambda arr: _slice(arr, offset, length))
 
     def split(self, by: str) -> ArrowSeries:
-        split_series = pc.split_pattern(self.native, by)  # type: ignore[call-overload]
-        return self.with_native(split_series)
+        return self._map_values(lambda arr: pc.split_pattern(arr, by))  # type: ignore[call-overload]
 
     def to_datetime(self, format: str | None) -> ArrowSeries:
-        format = parse_datetime_format(self.native) if format is None else format
-        timestamp_array = pc.strptime(self.native, format=format, unit="us")
-        return self.with_native(timestamp_array)
+        def fn(arr: ChunkedArrayAny) -> ChunkedArrayAny:
+            fmt = parse_datetime_format(arr) if format is None else format
+            return pc.strptime(arr, format=fmt, unit="us")
+
+        return self._map_values(fn)
 
     def to_date(self, format: str | None) -> ArrowSeries:
         return self.to_datetime(format=format).dt.date()
 
     def to_uppercase(self) -> ArrowSeries:
-        return self.with_native(pc.utf8_upper(self.native))
+        return self._map_values(pc.utf8_upper)
 
     def to_lowercase(self) -> ArrowSeries:
-        return self.with_native(pc.utf8_lower(self.native))
+        return self._map_values(pc.utf8_lower)
 
     def to_titlecase(self) -> ArrowSeries:
-        return self.with_native(pc.utf8_title(self.native))
+        return self._map_values(pc.utf8_title)
 
     def zfill(self, width: int) -> ArrowSeries:
-        binary_join: Incomplete = pc.binary_join_element_wise
-        native = self.native
-        hyphen, plus = lit("-"), lit("+")
-        first_char, remaining_chars = (
-            self.slice(0, 1).native,
-            self.slice(1, None).native,
-        )
-
-        # Conditions
-        less_than_width = pc.less(pc.utf8_length(native), lit(width))
-        starts_with_hyphen = pc.equal(first_char, hyphen)
-        starts_with_plus = pc.equal(first_char, plus)
-
-        conditions = pc.make_struct(
-            pc.and_(starts_with_hyphen, less_than_width),
-            pc.and_(starts_with_plus, less_than_width),
-            less_than_width,
-        )
-
-        # Cases
-        padded_remaining_chars = pc.utf8_lpad(remaining_chars, width - 1, padding="0")
-
-        result = pc.case_when(
-            conditions,
-            binary_join(
-                pa.repeat(hyphen, len(native)), padded_remaining_chars, ""
-            ),  # starts with hyphen and less than width
-            binary_join(
-                pa.repeat(plus, len(native)), padded_remaining_chars, ""
-            ),  # starts with plus and less than width
-            pc.utf8_lpad(native, width=width, padding="0"),  # less than width
-            native,
-        )
-        return self.with_native(result)
+        return self._map_values(lambda arr: _zfill(arr, width))
+
+
+def _slice(native: ChunkedArrayAny, offset: int, length: int | None) -> ChunkedArrayAny:
+    stop = offset + length if length is not None else None
+    return pc.utf8_slice_codeunits(native, start=offset, stop=stop)
+
+
+def _zfill(native: ChunkedArrayAny, width: int) -> ChunkedArrayAny:
+    binary_join: Incomplete = pc.binary_join_element_wise
+    hyphen, plus = lit("-"), lit("+")
+    first_char, remaining_chars = _slice(native, 0, 1), _slice(native, 1, None)
+
+    # Conditions
+    less_than_width = pc.less(pc.utf8_length(native), lit(width))
+    starts_with_hyphen = pc.equal(first_char, hyphen)
+    starts_with_plus = pc.equal(first_char, plus)
+
+    conditions = pc.make_struct(
+        pc.and_(starts_with_hyphen, less_than_width),
+        pc.and_(starts_with_plus, less_than_width),
+        less_than_width,
+    )
+
+    # Cases
+    padded_remaining_chars = pc.utf8_lpad(remaining_chars, width - 1, padding="0")
+
+    return pc.case_when(
+        conditions,
+        binary_join(
+            pa.repeat(hyphen, len(native)), padded_remaining_chars, ""
+        ),  # starts with hyphen and less than width
+        binary_join(
+            pa.repeat(plus, len(native)), padded_remaining_chars, ""
+        ),  # starts with plus and less than width
+        pc.utf8_lpad(native, width=width, padding="0"),  # less than width
+        native,
+    )
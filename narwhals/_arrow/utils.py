@@ -7,13 +7,14 @@ import pyarrow as pa
 import pyarrow.compute as pc
 
 from narwhals._compliant import EagerSeriesNamespace
+from narwhals._datetime_format import SAMPLE_SIZE, infer_datetime_format
 from narwhals._utils import Implementation, Version, isinstance_or_issubclass
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator, Mapping
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
     from typing import Literal
 
-    from typing_extensions import TypeAlias, TypeIs
+    from typing_extensions import TypeIs
 
     from narwhals._arrow.series import ArrowSeries
     from narwhals._arrow.typing import (
@@ -24,16 +25,20 @@ if TYPE_CHECKING:
         ChunkedArrayAny,
         Incomplete,
         NativeIntervalUnit,
+        Order,
         PromoteOptions,
         ScalarAny,
     )
     from narwhals._duration import IntervalUnit
     from narwhals.dtypes import DType
-    from narwhals.typing import IntoDType, PythonLiteral
-
-    # NOTE: stubs don't allow for `ChunkedArray[StructArray]`
-    # Intended to represent the `.chunks` property storing `list[pa.StructArray]`
-    ChunkedArrayStructArray: TypeAlias = ChunkedArrayAny
+    from narwhals.typing import (
+        FillNullStrategy,
+        IntoDType,
+        PythonLiteral,
+        RankMethod,
+        RollingInterpolationMethod,
+        _1DArray,
+    )
 
     def is_timestamp(t: Any) -> TypeIs[pa.TimestampType[Any, Any]]: ...
     def is_duration(t: Any) -> TypeIs[pa.DurationType[Any]]: ...
@@ -41,16 +46,7 @@ if TYPE_CHECKING:
     def is_large_list(t: Any) -> TypeIs[pa.LargeListType[Any]]: ...
     def is_fixed_size_list(t: Any) -> TypeIs[pa.FixedSizeListType[Any, Any]]: ...
     def is_dictionary(t: Any) -> TypeIs[pa.DictionaryType[Any, Any, Any]]: ...
-    def extract_regex(
-        strings: ChunkedArrayAny,
-        /,
-        pattern: str,
-        *,
-        options: Any = None,
-        memory_pool: Any = None,
-    ) -> ChunkedArrayStructArray: ...
 else:
-    from pyarrow.compute import extract_regex
     from pyarrow.types import (
         is_dictionary,  # noqa: F401
         is_duration,
@@ -330,137 +326,198 @@ def cast_for_truediv(
     return arrow_array, pa_object
 
 
-# Regex for date, time, separator and timezone components
-DATE_RE = r"(?P<date>\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}|\d{8})"
-SEP_RE = r"(?P<sep>\s|T)"
-TIME_RE = r"(?P<time>\d{2}:\d{2}(?::\d{2})?|\d{6}?)"  # \s*(?P<period>[AP]M)?)?
-HMS_RE = r"^(?P<hms>\d{2}:\d{2}:\d{2})$"
-HM_RE = r"^(?P<hm>\d{2}:\d{2})$"
-HMS_RE_NO_SEP = r"^(?P<hms_no_sep>\d{6})$"
-TZ_RE = r"(?P<tz>Z|[+-]\d{2}:?\d{2})"  # Matches 'Z', '+02:00', '+0200', '+02', etc.
-FULL_RE = rf"{DATE_RE}{SEP_RE}?{TIME_RE}?{TZ_RE}?$"
-
-# Separate regexes for different date formats
-YMD_RE = r"^(?P<year>(?:[12][0-9])?[0-9]{2})(?P<sep1>[-/.])(?P<month>0[1-9]|1[0-2])(?P<sep2>[-/.])(?P<day>0[1-9]|[12][0-9]|3[01])$"
-DMY_RE = r"^(?P<day>0[1-9]|[12][0-9]|3[01])(?P<sep1>[-/.])(?P<month>0[1-9]|1[0-2])(?P<sep2>[-/.])(?P<year>(?:[12][0-9])?[0-9]{2})$"
-MDY_RE = r"^(?P<month>0[1-9]|1[0-2])(?P<sep1>[-/.])(?P<day>0[1-9]|[12][0-9]|3[01])(?P<sep2>[-/.])(?P<year>(?:[12][0-9])?[0-9]{2})$"
-YMD_RE_NO_SEP = r"^(?P<year>(?:[12][0-9])?[0-9]{2})(?P<month>0[1-9]|1[0-2])(?P<day>0[1-9]|[12][0-9]|3[01])$"
-
-DATE_FORMATS = (
-    (YMD_RE_NO_SEP, "%Y%m%d"),
-    (YMD_RE, "%Y-%m-%d"),
-    (DMY_RE, "%d-%m-%Y"),
-    (MDY_RE, "%m-%d-%Y"),
-)
-TIME_FORMATS = ((HMS_RE, "%H:%M:%S"), (HM_RE, "%H:%M"), (HMS_RE_NO_SEP, "%H%M%S"))
-
-
-def _extract_regex_concat_arrays(
-    strings: ChunkedArrayAny,
-    /,
-    pattern: str,
-    *,
-    options: Any = None,
-    memory_pool: Any = None,
-) -> pa.StructArray:
-    r = pa.concat_arrays(
-        extract_regex(strings, pattern, options=options, memory_pool=memory_pool).chunks
-    )
-    return cast("pa.StructArray", r)
-
-
-def parse_datetime_format(arr: ChunkedArrayAny) -> str:
-    """Try to infer datetime format from StringArray."""
-    matches = _extract_regex_concat_arrays(arr.drop_null().slice(0, 10), pattern=FULL_RE)
-    if not pc.all(matches.is_valid()).as_py():
-        msg = (
-            "Unable to infer datetime format, provided format is not supported. "
-            "Please report a bug to https://github.com/narwhals-dev/narwhals/issues"
-        )
-        raise NotImplementedError(msg)
-
-    separators = matches.field("sep")
-    tz = matches.field("tz")
+def parse_datetime_format(arr: ChunkedArrayAny, sample_size: int = SAMPLE_SIZE) -> str:
+    """Try to infer datetime format from the first `sample_size` non-null strings."""
+    return infer_datetime_format(arr.drop_null().slice(0, sample_size).to_pylist())
 
-    # separators and time zones must be unique
-    if pc.count(pc.unique(separators)).as_py() > 1:
-        msg = "Found multiple separator values while inferring datetime format."
-        raise ValueError(msg)
 
-    if pc.count(pc.unique(tz)).as_py() > 1:
-        msg = "Found multiple timezone values while inferring datetime format."
-        raise ValueError(msg)
-
-    date_value = _parse_date_format(cast("pc.StringArray", matches.field("date")))
-    time_value = _parse_time_format(cast("pc.StringArray", matches.field("time")))
+def cast_to_comparable_string_types(
+    *chunked_arrays: ChunkedArrayAny | ScalarAny, separator: str
+) -> tuple[Iterator[ChunkedArrayAny | ScalarAny], ScalarAny]:
+    # Ensure `chunked_arrays` are either all `string` or all `large_string`.
+    dtype = (
+        pa.string()  # (PyArrow default)
+        if not any(pa.types.is_large_string(ca.type) for ca in chunked_arrays)
+        else pa.large_string()
+    )
+    return (ca.cast(dtype) for ca in chunked_arrays), lit(separator, dtype)
 
-    sep_value = separators[0].as_py()
-    tz_value = "%z" if tz[0].as_py() else ""
 
-    return f"{date_value}{sep_value}{time_value}{tz_value}"
+def group_codes(*chunked_arrays: ChunkedArrayAny) -> pa.Int64Array:
+    """Number each distinct combination of values across `chunked_arrays`.
 
+    Nulls are a value like any other, and the codes follow the order in which each
+    combination first appears. Nested values (lists, arrays and structs) are supported.
+    """
+    codes: pa.Int64Array | None = None
+    for ca in chunked_arrays:
+        # Dictionaries may have unused or repeated values, and differ across chunks.
+        decoded = ca.cast(ca.type.value_type) if pa.types.is_dictionary(ca.type) else ca
+        indices, n_values = _value_codes(decoded.combine_chunks())
+        codes = indices if codes is None else _combine_codes(codes, indices, n_values)[0]
+    assert codes is not None  # noqa: S101
+    return codes
+
+
+def _combine_codes(
+    codes: pa.Int64Array, indices: pa.Int64Array, n_values: int
+) -> tuple[pa.Int64Array, int]:
+    # Both are below the number of rows, so this can't overflow.
+    encoded = pc.dictionary_encode(pc.add(pc.multiply(codes, n_values), indices))
+    return encoded.indices.cast(pa.int64()), len(encoded.dictionary)
+
+
+def _value_codes(arr: ArrayAny) -> tuple[pa.Int64Array, int]:
+    """Number each distinct value of `arr`, and return how many there are."""
+    dtype = arr.type
+    if pa.types.is_dictionary(dtype):
+        arr = arr.cast(dtype.value_type)
+    elif pa.types.is_struct(dtype):
+        fields = (pc.struct_field(arr, [i]) for i in range(dtype.num_fields))
+        return _nested_codes(arr, *fields)
+    elif (
+        pa.types.is_list(dtype)
+        or pa.types.is_large_list(dtype)
+        or pa.types.is_fixed_size_list(dtype)
+    ):
+        # Each list is turned into the bytes of its values' codes, which are equal
+        # exactly when the lists are.
+        values, _ = _value_codes(pc.list_flatten(arr))
+        lengths = pc.fill_null(pc.list_value_length(arr), 0).cast(pa.int64())
+        offsets = pa.concat_arrays([zeros(1), pc.multiply(pc.cumulative_sum(lengths), 8)])
+        data = values.buffers()[1] if len(values) else pa.py_buffer(b"")
+        as_bytes = pa.Array.from_buffers(
+            pa.large_binary(), len(arr), [None, offsets.buffers()[1], data]
+        )
+        return _nested_codes(arr, as_bytes)
+    encoded = pc.dictionary_encode(arr, null_encoding="encode")
+    return encoded.indices.cast(pa.int64()), len(encoded.dictionary)
 
-def _parse_date_format(arr: pc.StringArray) -> str:
-    for date_rgx, date_fmt in DATE_FORMATS:
-        matches = pc.extract_regex(arr, pattern=date_rgx)
-        if date_fmt == "%Y%m%d" and pc.all(matches.is_valid()).as_py():
-            return date_fmt
-        if (
-            pc.all(matches.is_valid()).as_py()
-            and pc.count(pc.unique(sep1 := matches.field("sep1"))).as_py() == 1
-            and pc.count(pc.unique(sep2 := matches.field("sep2"))).as_py() == 1
-            and (date_sep_value := sep1[0].as_py()) == sep2[0].as_py()
-        ):
-            return date_fmt.replace("-", date_sep_value)
 
-    msg = (
-        "Unable to infer datetime format. "
-        "Please report a bug to https://github.com/narwhals-dev/narwhals/issues"
-    )
-    raise ValueError(msg)
+def _nested_codes(arr: ArrayAny, *children: ArrayAny) -> tuple[pa.Int64Array, int]:
+    codes, n_codes = _value_codes(pc.is_null(arr))
+    for child in children:
+        codes, n_codes = _combine_codes(codes, *_value_codes(child))
+    return codes, n_codes
 
 
-def _parse_time_format(arr: pc.StringArray) -> str:
-    for time_rgx, time_fmt in TIME_FORMATS:
-        matches = pc.extract_regex(arr, pattern=time_rgx)
-        if pc.all(matches.is_valid()).as_py():
-            return time_fmt
-    return ""
+def first_occurrences(codes: _1DArray) -> _1DArray:
+    """Return the row at which each of the codes from `group_codes` first appears."""
+    import numpy as np  # ignore-banned-import
 
+    if not len(codes):
+        return np.array([], dtype=np.int64)
+    is_new = np.empty(len(codes), dtype=bool)
+    is_new[0] = True
+    # Codes follow the order of first appearance, so a code is new exactly when it
+    # exceeds all of the previous ones.
+    np.greater(codes[1:], np.maximum.accumulate(codes)[:-1], out=is_new[1:])
+    return np.flatnonzero(is_new)
 
-def pad_series(
-    series: ArrowSeries, *, window_size: int, center: bool
-) -> tuple[ArrowSeries, int]:
-    """Pad series with None values on the left and/or right side, depending on the specified parameters.
 
-    Arguments:
-        series: The input ArrowSeries to be padded.
-        window_size: The desired size of the window.
-        center: Specifies whether to center the padding or not.
+def group_median(
+    values: ChunkedArrayAny, groups: _1DArray, n_groups: int
+) -> pa.DoubleArray:
+    """Compute the exact median of `values` within each of `n_groups` groups.
 
-    Returns:
-        A tuple containing the padded ArrowSeries and the offset value.
+    Nulls are ignored, and groups without any valid value get a null.
     """
-    if not center:
-        return series, 0
-    offset_left = window_size // 2
-    # subtract one if window_size is even
-    offset_right = offset_left - (window_size % 2 == 0)
-    chunks = series.native.chunks
-    arrays = nulls_like(offset_left, series), *chunks, nulls_like(offset_right, series)
-    return series._with_native(pa.concat_arrays(arrays)), offset_left + offset_right
-
+    import numpy as np  # ignore-banned-import
+
+    valid = values.is_valid().to_numpy(zero_copy_only=False)
+    native = values.filter(valid).cast(pa.float64()).to_numpy()
+    groups = groups[valid]
+    native = native[np.lexsort((native, groups))]
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    lower = np.minimum(starts + (counts - 1) // 2, max(len(native) - 1, 0))
+    upper = np.minimum(starts + counts // 2, max(len(native) - 1, 0))
+    empty = counts == 0
+    if empty.all():
+        return pa.nulls(n_groups, pa.float64())
+    return pa.array((native[lower] + native[upper]) / 2, mask=empty)
+
+
+def asof_indices(  # noqa: PLR0914
+    left_on: ChunkedArrayAny,
+    right_on: ChunkedArrayAny,
+    left_by: Sequence[ChunkedArrayAny],
+    right_by: Sequence[ChunkedArrayAny],
+    strategy: Literal["backward", "forward", "nearest"],
+) -> pa.Int64Array:
+    """Find, for each row on the left, the index of its as-of match on the right.
+
+    Both sides are sorted together by (`by` group, `on` value) with two stable sorts,
+    so that each left row's backward (resp. forward) match is the closest right row
+    before (resp. after) it in the same group. Rows without a match get a null.
+    Neither side needs to be sorted beforehand, but sorted input is the fastest.
+    """
+    import numpy as np  # ignore-banned-import
+
+    n_left, n = len(left_on), len(left_on) + len(right_on)
+    # The stable sorts keep the side which comes first ahead on equal keys: right
+    # rows should count as "before" a left row with the same value, unless looking
+    # forward.
+    right_first = strategy != "forward"
+
+    def concat(left: ChunkedArrayAny, right: ChunkedArrayAny) -> ChunkedArrayAny:
+        dtype = right.type if pa.types.is_null(left.type) else left.type
+        first, second = (right, left) if right_first else (left, right)
+        return pa.chunked_array(
+            [*first.cast(dtype).chunks, *second.cast(dtype).chunks], type=dtype
+        )
 
-def cast_to_comparable_string_types(
-    *chunked_arrays: ChunkedArrayAny | ScalarAny, separator: str
-) -> tuple[Iterator[ChunkedArrayAny | ScalarAny], ScalarAny]:
-    # Ensure `chunked_arrays` are either all `string` or all `large_string`.
-    dtype = (
-        pa.string()  # (PyArrow default)
-        if not any(pa.types.is_large_string(ca.type) for ca in chunked_arrays)
-        else pa.large_string()
-    )
-    return (ca.cast(dtype) for ca in chunked_arrays), lit(separator, dtype)
+    on = concat(left_on, right_on)
+    by = [concat(left, right) for left, right in zip(left_by, right_by)]
+    # Rows with a null key never match.
+    valid = pc.is_valid(on)
+    for key in by:
+        valid = pc.and_(valid, pc.is_valid(key))
+    order = pc.sort_indices(on)
+    if by:
+        codes = group_codes(*by).take(order)
+        regroup = pc.sort_indices(codes)
+        order, codes = order.take(regroup), codes.take(regroup)
+    else:
+        codes = zeros(n)
+    sorted_codes = codes.to_numpy()
+    valid = valid.take(order).to_numpy(zero_copy_only=False)
+    order = order.cast(pa.int64()).to_numpy()
+    left_offset, right_offset = (n - n_left, 0) if right_first else (0, n_left)
+    is_left = (order >= left_offset) & (order < left_offset + n_left)
+    # The index of each sorted row within its own side.
+    index = order - np.where(is_left, left_offset, right_offset)
+    lefts = np.flatnonzero(is_left)
+    candidates = np.where(~is_left & valid, np.arange(n), -1)
+
+    def matches(at: _1DArray) -> tuple[_1DArray, _1DArray]:
+        at = at[lefts]
+        found = (at >= 0) & (at < n) & valid[lefts]
+        at = np.clip(at, 0, n - 1)
+        return at, found & (sorted_codes[at] == sorted_codes[lefts])
+
+    at, found = matches(np.maximum.accumulate(candidates))
+    if strategy != "backward":
+        candidates[candidates < 0] = n
+        at_forward, found_forward = matches(np.minimum.accumulate(candidates[::-1])[::-1])
+        if strategy == "forward":
+            at, found = at_forward, found_forward
+        else:
+            values = on.take(order[lefts])
+            distance = pc.subtract(values, on.take(pa.array(order[at], mask=~found)))
+            distance_forward = pc.subtract(
+                on.take(pa.array(order[at_forward], mask=~found_forward)), values
+            )
+            # Ties go to the backward match, like in `pandas.merge_asof`.
+            closer = pc.fill_null(pc.less(distance_forward, distance), fill_value=False)
+            use_forward = found_forward & (~found | closer.to_numpy(zero_copy_only=False))
+            at, found = np.where(use_forward, at_forward, at), found | found_forward
+    # Scatter the matches back into the original order of the left rows.
+    result = np.zeros(n_left, dtype=np.int64)
+    mask = np.ones(n_left, dtype=bool)
+    result[index[lefts]] = index[at]
+    mask[index[lefts]] = ~found
+    return pa.array(result, mask=mask)
 
 
 if BACKEND_VERSION >= (14,):
@@ -564,3 +621,684 @@ def list_sort(
         [not_sorted_part.column(idx), sorted_imploded], names=[idx, v]
     )
     return pa.concat_tables([imploded_by_idx, pass_through]).sort_by(idx).column(v)
+
+
+class RollingWindows:
+    """Rolling window of each row, i.e. the rows `lo` up to and including `last`.
+
+    Rather than taking differences of prefix sums over the whole series (which loses
+    precision on long series), sums of floats restart every block of rows, so that
+    rounding errors are bounded by the length of a block. Blocks are at least as long
+    as the longest window, so a window spans at most two blocks.
+
+    `start` is the first row of the partition of each row (if any), which windows
+    never extend past. Neither `lo` nor `last` may decrease from one row to the next.
+    If the windows slide over the whole series, `offsets` are the number of rows they
+    extend to the left and to the right.
+    """
+
+    def __init__(
+        self,
+        lo: _1DArray,
+        last: _1DArray,
+        start: _1DArray | int = 0,
+        offsets: tuple[int, int] | None = None,
+    ) -> None:
+        self.lo = lo
+        self.last = last
+        self.start = start
+        self.offsets = offsets
+        self.size = last - lo + 1
+
+    @classmethod
+    def from_window_size(
+        cls,
+        length: int,
+        window_size: int,
+        *,
+        center: bool,
+        start: _1DArray | int = 0,
+        end: _1DArray | int | None = None,
+    ) -> RollingWindows:
+        """Windows of (at most) `window_size` rows, clipped to the rows `[start, end)`.
+
+        If `center`, the window extends `window_size // 2` rows to the left, and as
+        many rows as are left to the right.
+        """
+        import numpy as np  # ignore-banned-import
+
+        if center:
+            left = window_size // 2
+            right = left - (window_size % 2 == 0)
+        else:
+            left, right = window_size - 1, 0
+        lo = np.arange(-left, length - left)
+        np.maximum(lo, start, out=lo)
+        last = np.arange(right, length + right)
+        np.minimum(last, (length if end is None else end) - 1, out=last)
+        sliding = isinstance(start, int) and start == 0 and end is None
+        return cls(lo, last, start, (left, right) if sliding else None)
+
+    def _at(self, values: _1DArray, bound: Literal["lo", "last"]) -> _1DArray:
+        """`values` at the `lo` or `last` row of each window."""
+        import numpy as np  # ignore-banned-import
+
+        if self.offsets is None or not len(values):
+            return values[self.lo if bound == "lo" else self.last]  # type: ignore[no-any-return]
+        # Sliding windows are shifted rows, which slices copy faster than gathers.
+        left, right = self.offsets
+        length = len(values)
+        result = np.empty_like(values)
+        if bound == "lo":
+            n_clipped = min(left, length)
+            result[:n_clipped] = values[0]
+            result[n_clipped:] = values[: length - n_clipped]
+        else:
+            n_shifted = max(length - right, 0)
+            result[:n_shifted] = values[right:]
+            result[n_shifted:] = values[-1]
+        return result
+
+    def sum(self, values: _1DArray) -> _1DArray:
+        """Sum of `values` in each window."""
+        import numpy as np  # ignore-banned-import
+
+        length = len(values)
+        if values.dtype.kind in {"b", "i", "u"}:
+            # Integer sums are exact, no need for blocks.
+            dtype = np.int64 if values.dtype == np.bool_ else values.dtype
+            prefix = np.zeros(length + 1, dtype=dtype)
+            np.cumsum(values, dtype=dtype, out=prefix[1:])
+            return self._at(prefix[1:], "last") - self._at(prefix[:-1], "lo")
+        shift = max(int(np.max(self.size, initial=1)) - 1, 1 << 15).bit_length()
+        block = 1 << shift
+        full = length - length % block
+        prefix = np.empty_like(values)
+        np.cumsum(
+            values[:full].reshape(-1, block), axis=1, out=prefix[:full].reshape(-1, block)
+        )
+        np.cumsum(values[full:], out=prefix[full:])
+        # `prefix - values` is the sum of the preceding rows in the same block.
+        result = self._at(prefix, "last") - self._at(prefix - values, "lo")
+        # Windows which span two blocks also need the rest of the block they start in.
+        # As bounds never decrease, those are contiguous rows for each boundary.
+        boundaries = np.arange(block, length, block)
+        first = np.searchsorted(self.last, boundaries)
+        counts = np.searchsorted(self.lo, boundaries) - first
+        offsets = np.repeat(first - np.cumsum(counts) + counts, counts)
+        crosses = offsets + np.arange(len(offsets))
+        result[crosses] += np.repeat(prefix[boundaries - 1], counts)
+        return result  # type: ignore[no-any-return]
+
+    def aggregate(
+        self,
+        series: ArrowSeries,
+        function: Literal["sum", "mean", "var", "std"],
+        *,
+        min_samples: int,
+        ddof: int = 1,
+    ) -> ArrowSeries:
+        """Aggregate the values of `series` in each window.
+
+        Nulls are skipped, and NaN / infinite values only affect the windows which
+        contain them.
+        """
+        import numpy as np  # ignore-banned-import
+
+        native = series.native
+        dtype = native.type
+        is_valid, count = self._count(native)
+        values = pc.fill_null(native, lit(0, dtype)).to_numpy()
+        if function == "sum" and pa.types.is_integer(dtype):
+            result = self.sum(values.astype(np.int64, copy=False))
+        else:
+            values = values.astype(np.float64, copy=False)
+            result = self._moments(values, is_valid, count, function, ddof)
+
+        output_type = (
+            dtype if function == "sum" or pa.types.is_floating(dtype) else pa.float64()
+        )
+        if function in {"var", "std"}:
+            # Too few values for the requested degrees of freedom.
+            min_samples = max(min_samples, ddof + 1)
+        return self._to_series(series, result, count, output_type, min_samples)
+
+    def extremum(
+        self, series: ArrowSeries, function: Literal["min", "max"], *, min_samples: int
+    ) -> ArrowSeries:
+        """Minimum or maximum of the values of `series` in each window, skipping nulls.
+
+        Each window is covered by two (overlapping) runs of `2**k` rows, whose extrema
+        are built by doubling `k`, so this takes `O(n log(window_size))`.
+        """
+        import numpy as np  # ignore-banned-import
+
+        native = series.native
+        dtype = native.type
+        count = self._count(native)[1]
+        ufunc = np.minimum if function == "min" else np.maximum
+        if native.null_count:
+            # Fill nulls with a value which can't change the result.
+            if pa.types.is_floating(dtype):
+                fill = np.inf if function == "min" else -np.inf
+            elif pa.types.is_integer(dtype):
+                info = np.iinfo(dtype.to_pandas_dtype())
+                fill = info.max if function == "min" else info.min
+            else:
+                fill = function == "min"
+            native = pc.fill_null(native, lit(fill, dtype))
+        values = native.to_numpy(zero_copy_only=False)
+
+        # Group the windows by `k`, the largest power of two which fits in them.
+        level = np.log2(self.size).astype(np.uint8)
+        rows_per_level = np.bincount(level)
+        rows = np.split(np.argsort(level, kind="stable"), np.cumsum(rows_per_level))
+        result = np.empty_like(values)
+        runs = values
+        for k in range(len(rows_per_level)):
+            width = 1 << k
+            if k:
+                # Extrema of runs of `width` rows, from those of runs of half as many.
+                runs = ufunc(runs[: -(width >> 1)], runs[width >> 1 :])
+            lo, last = self.lo[rows[k]], self.last[rows[k]]
+            result[rows[k]] = ufunc(runs[lo], runs[last - width + 1])
+        return self._to_series(series, result, count, dtype, min_samples)
+
+    def quantile(
+        self,
+        series: ArrowSeries,
+        quantile: float,
+        interpolation: RollingInterpolationMethod,
+        *,
+        min_samples: int,
+    ) -> ArrowSeries:
+        """Quantile of the values of `series` in each window, skipping nulls.
+
+        NaN is greater than any other value, like in Polars.
+        """
+        import numpy as np  # ignore-banned-import
+
+        native = series.native
+        count = self._count(native)[1]
+        # Nulls become NaN here. Both sort last, so a null only gets selected in place
+        # of a NaN (which gives the same result), or from a window which gets masked.
+        values = native.to_numpy(zero_copy_only=False).astype(np.float64, copy=False)
+        position = np.maximum(count - 1, 0) * quantile
+        if interpolation == "nearest":
+            index = np.floor(position + 0.5).astype(np.int64)
+        elif interpolation == "higher":
+            index = np.ceil(position).astype(np.int64)
+        else:
+            index = np.floor(position).astype(np.int64)
+        # Integers which sort like the values do (with NaN last), as sorting floats
+        # with NaN is much slower.
+        keys = np.where(np.isnan(values), np.nan, values).view(np.int64)
+        keys ^= (keys >> 63) & np.iinfo(np.int64).max
+        hi = self.last + 1
+        if interpolation in {"linear", "midpoint"}:
+            # Windows which fall between two values need the next one too.
+            between = np.flatnonzero(position > index)
+            selected = values[
+                self._kth_smallest(
+                    keys,
+                    np.concatenate([self.lo, self.lo[between]]),
+                    np.concatenate([hi, hi[between]]),
+                    np.concatenate([index, index[between] + 1]),
+                )
+            ]
+            result, upper = selected[: len(index)], selected[len(index) :]
+            lower = result[between]
+            if interpolation == "linear":
+                result[between] = lower + (position - index)[between] * (upper - lower)
+            else:
+                result[between] = (lower + upper) / 2
+        else:
+            result = values[self._kth_smallest(keys, self.lo, hi, index)]
+        return self._to_series(series, result, count, pa.float64(), min_samples)
+
+    @staticmethod
+    def _kth_smallest(
+        keys: _1DArray, lo: _1DArray, hi: _1DArray, k: _1DArray
+    ) -> _1DArray:
+        """Position of the `k`-th smallest (from 0) of `keys[lo:hi]`, for each query.
+
+        The keys are split into blocks of at least twice the longest range, so that
+        each range fits in a block, or in a block shifted by half a block. Within each
+        block, the keys are replaced by their rank in the block, so the selection only
+        needs to look at as many bits as there are in the block size.
+        """
+        import numpy as np  # ignore-banned-import
+
+        length = len(keys)
+        dtype = np.int32 if length < 2**30 else np.int64
+        bits = max(int(np.max(hi - lo, initial=1)) - 1, 1).bit_length() + 1
+        block = 1 << bits
+        in_block = (lo >> bits) == ((hi - 1) >> bits)
+        positions = np.empty(len(k), dtype=np.int64)
+        for offset, rows in (
+            (0, np.flatnonzero(in_block)),
+            (block // 2, np.flatnonzero(~in_block)),
+        ):
+            if not len(rows):
+                continue
+            padded = np.zeros(-(-(length + offset) // block) * block, keys.dtype)
+            padded[offset : offset + length] = keys
+            order = np.argsort(padded.reshape(-1, block), axis=1).astype(dtype)
+            ranks = np.empty_like(order)
+            np.put_along_axis(ranks, order, np.arange(block, dtype=dtype)[None], axis=1)
+            start = (lo[rows] + offset).astype(dtype)
+            rank = _wavelet_select(
+                ranks.ravel(),
+                start,
+                (hi[rows] + offset).astype(dtype),
+                k[rows].astype(dtype),
+                bits,
+            )
+            start &= ~(block - 1)
+            positions[rows] = start + order.ravel()[start + rank] - offset
+        return positions
+
+    def _count(self, native: ChunkedArrayAny) -> tuple[_1DArray | None, _1DArray]:
+        # Which values are valid (if any aren't), and the number of them per window.
+        if native.null_count:
+            is_valid = native.is_valid().to_numpy(zero_copy_only=False)
+            return is_valid, self.sum(is_valid)
+        return None, self.size
+
+    @staticmethod
+    def _to_series(
+        series: ArrowSeries,
+        result: _1DArray,
+        count: _1DArray,
+        output_type: pa.DataType,
+        min_samples: int,
+    ) -> ArrowSeries:
+        has_nulls = series.native.null_count > 0
+        mask = count < min_samples if min_samples > 1 or has_nulls else None
+        arr = pa.array(result, mask=mask).cast(output_type, safe=False)
+        return series._with_native(pa.chunked_array([arr]))
+
+    def _moments(
+        self,
+        values: _1DArray,
+        is_valid: _1DArray | None,
+        count: _1DArray,
+        function: Literal["sum", "mean", "var", "std"],
+        ddof: int,
+    ) -> _1DArray:
+        import numpy as np  # ignore-banned-import
+
+        # Nulls were filled with zeros, which don't change sums.
+        is_finite = np.isfinite(values)
+        all_finite = bool(is_finite.all())
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if function in {"sum", "mean"}:
+                result = self.sum(
+                    values if all_finite else np.where(is_finite, values, 0)
+                )
+                if function == "mean":
+                    result /= count
+            else:
+                is_usable = is_finite if is_valid is None else is_valid & is_finite
+                # Sums are taken over values centred on the mean of their partition,
+                # so that variances don't suffer from catastrophic cancellation.
+                centred = np.subtract(
+                    values,
+                    self._partition_mean(values, is_usable),
+                    out=np.zeros_like(values),
+                    where=is_usable,
+                )
+                n_usable = count if all_finite else self.sum(is_usable)
+                sum_centred = self.sum(centred)
+                sum_sq = self.sum(np.square(centred, out=centred))
+                squared_deviations = np.maximum(sum_sq - sum_centred**2 / n_usable, 0.0)
+                # A single value doesn't deviate at all, don't let rounding say otherwise.
+                squared_deviations[n_usable == 1] = 0.0
+                result = squared_deviations / (count - ddof)
+                if function == "std":
+                    result = np.sqrt(result)
+        if not all_finite:
+            result = self._with_non_finite(result, values, function)
+        return result
+
+    def _partition_mean(self, values: _1DArray, is_usable: _1DArray) -> _1DArray | float:
+        # Mean of the usable values of the partition of each row (or of the series).
+        import numpy as np  # ignore-banned-import
+
+        if isinstance(self.start, int):
+            return float(np.mean(values, where=is_usable)) if is_usable.any() else 0.0
+        length = len(values)
+        totals = np.bincount(
+            self.start, weights=np.where(is_usable, values, 0.0), minlength=length
+        )
+        counts = np.bincount(self.start, weights=is_usable, minlength=length)
+        means = np.divide(totals, counts, out=np.zeros(length), where=counts > 0)
+        return means[self.start]  # type: ignore[no-any-return]
+
+    def _with_non_finite(
+        self,
+        result: _1DArray,
+        values: _1DArray,
+        function: Literal["sum", "mean", "var", "std"],
+    ) -> _1DArray:
+        # Only the windows which contain NaN or infinite values are affected by them.
+        import numpy as np  # ignore-banned-import
+
+        n_nan = self.sum(np.isnan(values))
+        n_pos_inf = self.sum(values == np.inf)
+        n_neg_inf = self.sum(values == -np.inf)
+        if function in {"sum", "mean"}:
+            result = np.where(n_pos_inf > 0, np.inf, result)
+            result = np.where(n_neg_inf > 0, -np.inf, result)
+            is_nan = (n_nan > 0) | ((n_pos_inf > 0) & (n_neg_inf > 0))
+        else:
+            is_nan = (n_nan + n_pos_inf + n_neg_inf) > 0
+        return np.where(is_nan, np.nan, result)
+
+
+def _wavelet_select(  # noqa: PLR0914
+    ranks: _1DArray, lo: _1DArray, hi: _1DArray, k: _1DArray, bits: int
+) -> _1DArray:
+    """The `k`-th smallest (from 0) of `ranks[lo:hi]`, for each query.
+
+    Ranges mustn't contain duplicate ranks, which must be less than `2**bits`. This is
+    a wavelet matrix: for each bit (from the highest), the ranks are stably partitioned
+    into those without and those with the bit set, and every query follows its `k`-th
+    smallest rank into one of the two parts. Each bit takes `O(n)` for all queries.
+    """
+    import numpy as np  # ignore-banned-import
+
+    dtype = ranks.dtype
+    k = k.copy()
+    result = np.zeros_like(k)
+    index = np.arange(len(ranks), dtype=dtype)
+    # `zeros[i]` is the number of ranks before `i` without the bit set.
+    zeros = np.zeros(len(ranks) + 1, dtype=dtype)
+    partitioned = np.empty_like(ranks)
+    # Integer arithmetic rather than `np.where` / masks, which are much slower here.
+    for bit in reversed(range(bits)):
+        is_set = (ranks >> bit) & 1
+        np.cumsum(1 - is_set, out=zeros[1:])
+        zeros_lo, zeros_hi = zeros[lo], zeros[hi]
+        n_zeros = zeros_hi - zeros_lo
+        is_one = (k >= n_zeros).astype(dtype)
+        k -= n_zeros * is_one
+        result |= is_one << bit
+        total = zeros[-1]
+        lo = zeros_lo + is_one * (total + lo - 2 * zeros_lo)
+        hi = zeros_hi + is_one * (total + hi - 2 * zeros_hi)
+        if bit:
+            before = zeros[:-1]
+            partitioned[before + is_set * (total + index - 2 * before)] = ranks
+            ranks, partitioned = partitioned, ranks
+    return result
+
+
+class Segments:
+    """Contiguous segments of rows, e.g. partitions of a frame sorted by its partition keys.
+
+    This lets us evaluate window functions over all partitions at once, by computing
+    them over the whole (sorted) series and then correcting the rows at the boundaries
+    of each segment, rather than looping over partitions.
+    """
+
+    def __init__(self, starts: _1DArray, length: int) -> None:
+        import numpy as np  # ignore-banned-import
+
+        ends = np.append(starts[1:], length)
+        sizes = ends - starts
+        self.length = length
+        self.starts = starts
+        # For each row: the index of the first row of its segment, the index after
+        # the last row of its segment, and its position within its segment.
+        self.start = np.repeat(starts, sizes)
+        self.end = np.repeat(ends, sizes)
+        self.position = np.arange(length) - self.start
+
+    @classmethod
+    def from_sorted_keys(cls, keys: Sequence[ChunkedArrayAny], length: int) -> Segments:
+        """Segments of consecutive equal values in `keys`, which mustn't contain nulls."""
+        import numpy as np  # ignore-banned-import
+
+        is_start = np.zeros(length, dtype=bool)
+        is_start[:1] = True
+        for key in keys:
+            arr = key.to_numpy()
+            is_start[1:] |= arr[1:] != arr[:-1]
+        return cls(np.flatnonzero(is_start), length)
+
+    def _mask(self, series: ArrowSeries, mask: _1DArray) -> ArrowSeries:
+        return series._with_native(pc.if_else(pa.array(mask), None, series.native))
+
+    def shift(self, series: ArrowSeries, n: int) -> ArrowSeries:
+        if n == 0:
+            return series
+        mask = (
+            self.position < n if n > 0 else self.position >= (self.end - self.start) + n
+        )
+        return self._mask(series.shift(n), mask)
+
+    def diff(self, series: ArrowSeries) -> ArrowSeries:
+        return self._mask(series.diff(), self.position == 0)
+
+    def cum_sum(self, series: ArrowSeries, *, reverse: bool) -> ArrowSeries:
+        import numpy as np  # ignore-banned-import
+
+        native = series.native
+        dtype = native.type
+        if not pa.types.is_integer(dtype):
+            return self._accumulate(series, "sum", reverse=reverse)
+        # Integer sums are exact, so differences of prefix sums are too.
+        index = np.arange(self.length)
+        cum_sum = pc.cumulative_sum(pc.fill_null(native, lit(0, dtype)))
+        prefix = pa.chunked_array(
+            [pa.array([0], cum_sum.type), *cum_sum.chunks], cum_sum.type
+        )
+        lo, hi = (index, self.end) if reverse else (self.start, index + 1)
+        result = pc.subtract(prefix.take(pa.array(hi)), prefix.take(pa.array(lo)))
+        return series._with_native(pc.if_else(native.is_null(), None, result))
+
+    def cum_min(self, series: ArrowSeries, *, reverse: bool) -> ArrowSeries:
+        return self._accumulate(series, "min", reverse=reverse)
+
+    def cum_max(self, series: ArrowSeries, *, reverse: bool) -> ArrowSeries:
+        return self._accumulate(series, "max", reverse=reverse)
+
+    def cum_prod(self, series: ArrowSeries, *, reverse: bool) -> ArrowSeries:
+        return self._accumulate(series, "prod", reverse=reverse)
+
+    def _accumulate(
+        self,
+        series: ArrowSeries,
+        function: Literal["sum", "min", "max", "prod"],
+        *,
+        reverse: bool,
+    ) -> ArrowSeries:
+        """Cumulative `function` of `series` within each segment, skipping nulls.
+
+        Each row is combined with the result `2**k` rows before it (if that's in the
+        same segment), doubling `k`. This takes `O(n log(longest segment))`, for all
+        segments at once, and never mixes values from different segments.
+        """
+        import numpy as np  # ignore-banned-import
+
+        native = series.native
+        dtype = native.type
+        if not (pa.types.is_integer(dtype) or pa.types.is_floating(dtype)):
+            # PyArrow doesn't support these either, let it raise.
+            return getattr(series, f"cum_{function}")(reverse=reverse)
+        ufunc = {"sum": np.add, "min": np.fmin, "max": np.fmax, "prod": np.multiply}
+        if function in {"sum", "prod"}:
+            fill = int(function == "prod")
+        elif pa.types.is_floating(dtype):
+            # NaN is ignored by `fmin` and `fmax`, like by `pc.cumulative_min/max`.
+            fill = float("nan")
+        else:
+            info = np.iinfo(dtype.to_pandas_dtype())
+            fill = info.max if function == "min" else info.min
+        values = pc.fill_null(native, lit(fill, dtype)).to_numpy()
+        position = self.end - 1 - np.arange(self.length) if reverse else self.position
+        if reverse:
+            values, position = values[::-1], position[::-1]
+        result = values.copy()
+        longest = int(np.max(position, initial=0))
+        shift = 1
+        while shift <= longest:
+            ufunc[function](
+                result[shift:],
+                result[:-shift],
+                out=result[shift:],
+                where=position[shift:] >= shift,
+            )
+            shift <<= 1
+        if reverse:
+            result = result[::-1]
+        return series._with_native(
+            pc.if_else(native.is_null(), None, pa.chunked_array([result], dtype))
+        )
+
+    def cum_count(self, series: ArrowSeries, *, reverse: bool) -> ArrowSeries:
+        dtypes = series._version.dtypes
+        is_valid = (~series.is_null()).cast(dtypes.UInt32())
+        return self.cum_sum(is_valid, reverse=reverse)
+
+    def _rolling_windows(self, window_size: int, *, center: bool) -> RollingWindows:
+        return RollingWindows.from_window_size(
+            self.length, window_size, center=center, start=self.start, end=self.end
+        )
+
+    def rolling_sum(
+        self, series: ArrowSeries, window_size: int, *, min_samples: int, center: bool
+    ) -> ArrowSeries:
+        windows = self._rolling_windows(window_size, center=center)
+        return windows.aggregate(series, "sum", min_samples=min_samples)
+
+    def rolling_mean(
+        self, series: ArrowSeries, window_size: int, *, min_samples: int, center: bool
+    ) -> ArrowSeries:
+        windows = self._rolling_windows(window_size, center=center)
+        return windows.aggregate(series, "mean", min_samples=min_samples)
+
+    def rolling_var(
+        self,
+        series: ArrowSeries,
+        window_size: int,
+        *,
+        min_samples: int,
+        center: bool,
+        ddof: int,
+    ) -> ArrowSeries:
+        windows = self._rolling_windows(window_size, center=center)
+        return windows.aggregate(series, "var", min_samples=min_samples, ddof=ddof)
+
+    def rolling_std(
+        self,
+        series: ArrowSeries,
+        window_size: int,
+        *,
+        min_samples: int,
+        center: bool,
+        ddof: int,
+    ) -> ArrowSeries:
+        windows = self._rolling_windows(window_size, center=center)
+        return windows.aggregate(series, "std", min_samples=min_samples, ddof=ddof)
+
+    def rolling_min(
+        self, series: ArrowSeries, window_size: int, *, min_samples: int, center: bool
+    ) -> ArrowSeries:
+        windows = self._rolling_windows(window_size, center=center)
+        return windows.extremum(series, "min", min_samples=min_samples)
+
+    def rolling_max(
+        self, series: ArrowSeries, window_size: int, *, min_samples: int, center: bool
+    ) -> ArrowSeries:
+        windows = self._rolling_windows(window_size, center=center)
+        return windows.extremum(series, "max", min_samples=min_samples)
+
+    def rolling_median(
+        self, series: ArrowSeries, window_size: int, *, min_samples: int, center: bool
+    ) -> ArrowSeries:
+        windows = self._rolling_windows(window_size, center=center)
+        return windows.quantile(series, 0.5, "linear", min_samples=min_samples)
+
+    def rolling_quantile(
+        self,
+        series: ArrowSeries,
+        quantile: float,
+        interpolation: RollingInterpolationMethod,
+        window_size: int,
+        *,
+        min_samples: int,
+        center: bool,
+    ) -> ArrowSeries:
+        windows = self._rolling_windows(window_size, center=center)
+        return windows.quantile(series, quantile, interpolation, min_samples=min_samples)
+
+    def fill_null(
+        self,
+        series: ArrowSeries,
+        value: Any,
+        strategy: FillNullStrategy | None,
+        limit: int | None,
+    ) -> ArrowSeries:
+        import numpy as np  # ignore-banned-import
+
+        if strategy is None:
+            return series.fill_null(value, strategy, limit)
+        index = np.arange(self.length)
+        is_valid = ~series.is_null().native.to_numpy(zero_copy_only=False)
+        if strategy == "forward":
+            # Index of the last valid value at or before each row.
+            source = np.maximum.accumulate(np.where(is_valid, index, -1))
+            out_of_bounds = source < self.start
+            distance = index - source
+        else:
+            # Index of the first valid value at or after each row.
+            candidates = np.where(is_valid, index, self.length)
+            source = np.minimum.accumulate(candidates[::-1])[::-1]
+            out_of_bounds = source >= self.end
+            distance = source - index
+        # Rows which can't be filled take their own (null) value.
+        mask = out_of_bounds if limit is None else out_of_bounds | (distance > limit)
+        return series._with_native(
+            series.native.take(pa.array(np.where(mask, index, source)))
+        )
+
+    def rank(
+        self, series: ArrowSeries, method: RankMethod, *, descending: bool
+    ) -> ArrowSeries:
+        import numpy as np  # ignore-banned-import
+
+        if method == "average":
+            # Not supported, let `ArrowSeries.rank` raise.
+            return series.rank(method, descending=descending)
+        segment = np.repeat(
+            np.arange(len(self.starts)), self.end[self.starts] - self.starts
+        )
+        # Sort by value within each segment (stable, so ties stay in their order).
+        order: Order = "descending" if descending else "ascending"
+        table = pa.table({"segment": segment, "value": series.native})
+        sort_keys = [("segment", "ascending"), ("value", order)]
+        indices = pc.sort_indices(table, sort_keys=sort_keys, null_placement="at_end")
+        values = series.native.take(indices)
+        index = np.arange(self.length)
+        is_run_start = self.position == 0
+        if self.length > 1:
+            is_new_value = pc.fill_null(pc.not_equal(values[1:], values[:-1]), True)
+            is_run_start[1:] |= is_new_value.to_numpy(zero_copy_only=False)
+        if method == "ordinal":
+            rank = self.position + 1
+        elif method == "min":
+            run_start = np.maximum.accumulate(np.where(is_run_start, index, 0))
+            rank = run_start - self.start + 1
+        elif method == "max":
+            run = np.cumsum(is_run_start) - 1
+            run_ends = np.append(np.flatnonzero(is_run_start)[1:], self.length)
+            rank = run_ends[run] - self.start
+        else:  # dense
+            run = np.cumsum(is_run_start)
+            rank = run - run[self.start] + 1
+        result = np.empty(self.length, dtype=np.uint64)
+        result[indices.to_numpy()] = rank
+        is_null = series.is_null().native.to_numpy(zero_copy_only=False)
+        return self._mask(series._with_native(pa.array(result)), is_null)
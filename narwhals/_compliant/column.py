@@ -23,6 +23,7 @@ if TYPE_CHECKING:
         IntoDType,
         ModeKeepStrategy,
         RankMethod,
+        RollingInterpolationMethod,
     )
 
 __all__ = ["CompliantColumn"]
@@ -131,6 +132,24 @@ class CompliantColumn(Protocol):
     def rolling_var(
         self, window_size: int, *, min_samples: int, center: bool, ddof: int
     ) -> Self: ...
+    def rolling_min(
+        self, window_size: int, *, min_samples: int, center: bool
+    ) -> Self: ...
+    def rolling_max(
+        self, window_size: int, *, min_samples: int, center: bool
+    ) -> Self: ...
+    def rolling_median(
+        self, window_size: int, *, min_samples: int, center: bool
+    ) -> Self: ...
+    def rolling_quantile(
+        self,
+        quantile: float,
+        interpolation: RollingInterpolationMethod,
+        window_size: int,
+        *,
+        min_samples: int,
+        center: bool,
+    ) -> Self: ...
     def round(self, decimals: int) -> Self: ...
     def floor(self) -> Self: ...
     def ceil(self) -> Self: ...
@@ -27,6 +27,7 @@ from narwhals._compliant.typing import (
     LazyExprT,
     NativeExprT,
 )
+from narwhals._expression_parsing import evaluate_common_subexpr
 from narwhals._utils import (
     _StoresCompliant,
     not_implemented,
@@ -92,6 +93,9 @@ class CompliantExpr(
     # This should be set with extreme care, only in `_expression_parsing.py`,
     # and never from within any compliant class.
     _opt_metadata: ExprMetadata | None = None
+    # Set in `_expression_parsing.py` when the same compliant expression is reused
+    # by several expressions evaluated together (common subexpression elimination).
+    _is_common_subexpr: bool = False
 
     @property
     def _metadata(self) -> ExprMetadata:
@@ -244,6 +248,8 @@ class EagerExpr(
     ) -> None: ...
 
     def __call__(self, df: EagerDataFrameT) -> Sequence[EagerSeriesT]:
+        if self._is_common_subexpr:
+            return evaluate_common_subexpr(self, df, self._call)
         return self._call(df)
 
     def __narwhals_namespace__(
@@ -736,6 +742,42 @@ class EagerExpr(
             ddof=ddof,
         )
 
+    def rolling_min(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        return self._reuse_series(
+            "rolling_min", window_size=window_size, min_samples=min_samples, center=center
+        )
+
+    def rolling_max(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        return self._reuse_series(
+            "rolling_max", window_size=window_size, min_samples=min_samples, center=center
+        )
+
+    def rolling_median(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        return self._reuse_series(
+            "rolling_median",
+            window_size=window_size,
+            min_samples=min_samples,
+            center=center,
+        )
+
+    def rolling_quantile(
+        self,
+        quantile: float,
+        interpolation: RollingInterpolationMethod,
+        window_size: int,
+        *,
+        min_samples: int,
+        center: bool,
+    ) -> Self:
+        return self._reuse_series(
+            "rolling_quantile",
+            quantile=quantile,
+            interpolation=interpolation,
+            window_size=window_size,
+            min_samples=min_samples,
+            center=center,
+        )
+
     def map_batches(
         self,
         function: Callable[[Any], Any],
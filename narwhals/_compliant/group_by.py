@@ -15,12 +15,21 @@ from narwhals._compliant.typing import (
     ImplExprT_contra,
     NarwhalsAggregation,
 )
-from narwhals._utils import is_sequence_of, zip_strict
+from narwhals._expression_parsing import (
+    ExprKind,
+    ExprNode,
+    evaluate_nodes,
+    evaluate_output_names_and_aliases,
+    is_expr,
+    is_scalar_like,
+)
+from narwhals._utils import generate_temporary_column_name, is_sequence_of, zip_strict
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator, Mapping, Sequence
+    from collections.abc import Container, Hashable, Iterable, Iterator, Mapping, Sequence
 
     from narwhals._compliant.expr import ImplExpr
+    from narwhals._expression_parsing import CSEMemo, ExprMetadata
 
 
 __all__ = ["CompliantGroupBy", "DepthTrackingGroupBy", "EagerGroupBy"]
@@ -37,6 +46,129 @@ def _evaluate_aliases(
     return list(chain.from_iterable(it))
 
 
+_SELECTOR_KINDS = frozenset(
+    (ExprKind.ALL, ExprKind.COL, ExprKind.EXCLUDE, ExprKind.NTH, ExprKind.SELECTOR)
+)
+
+
+def _col_node(name: str, /) -> ExprNode:
+    return ExprNode(ExprKind.COL, "col", names=[name])
+
+
+def _is_aliasing(node: ExprNode, /) -> bool:
+    return node.name.startswith(("name.", "alias"))
+
+
+class _AggregationPlan:
+    """Rewrites non-elementary aggregations into three vectorized stages.
+
+    For example, `((nw.col("a") * nw.col("b")).sum() / nw.col("b").sum()).alias("c")`
+    becomes:
+
+    1. A pre-projection of the elementwise inputs, `(nw.col("a") * nw.col("b")).alias(t0)`.
+    2. Elementary aggregations, `nw.col(t0).sum().alias(t1)` and `nw.col("b").sum().alias(t2)`.
+    3. A post-projection of the aggregates, `(nw.col(t1) / nw.col(t2)).alias("c")`.
+
+    Each of which is a single native call, rather than a Python function per group.
+    """
+
+    def __init__(self, aggregations: Container[str], columns: Iterable[str]) -> None:
+        self._supported_aggregations = aggregations
+        self._taken_names = set(columns)
+        self.pre_projection: dict[Hashable, tuple[str, list[ExprNode]]] = {}
+        self.aggregations: dict[Hashable, tuple[str, list[ExprNode]]] = {}
+        self.outputs: list[tuple[str, list[ExprNode]]] = []
+
+    def _temporary_name(self) -> str:
+        name = generate_temporary_column_name(n_bytes=8, columns=self._taken_names)
+        self._taken_names.add(name)
+        return name
+
+    def _column(self, nodes: list[ExprNode], /) -> str | None:
+        """Return the name of a column holding the (elementwise) `nodes`."""
+        root = nodes[0]
+        if root.kind in _SELECTOR_KINDS and (
+            root.kind is not ExprKind.COL or len(root.kwargs["names"]) != 1
+        ):
+            return None
+        if len(nodes) == 1 and root.kind is ExprKind.COL:
+            return str(root.kwargs["names"][0])
+        key = tuple(node.structural_key() for node in nodes)
+        if key not in self.pre_projection:
+            self.pre_projection[key] = (self._temporary_name(), nodes)
+        return self.pre_projection[key][0]
+
+    def _aggregate(self, inputs: list[ExprNode], agg: ExprNode, /) -> str | None:
+        """Return the name of a column holding `agg` applied to `inputs`, per group."""
+        if not inputs:
+            # e.g. `nw.len()`
+            nodes = [agg]
+        elif (column := self._column(inputs)) is not None:
+            nodes = [_col_node(column), agg]
+        else:
+            return None
+        key = tuple(node.structural_key() for node in nodes)
+        if key not in self.aggregations:
+            self.aggregations[key] = (self._temporary_name(), nodes)
+        return self.aggregations[key][0]
+
+    def add(
+        self,
+        metadata: ExprMetadata,
+        output_names: Sequence[str],
+        aliases: Sequence[str],
+        /,
+    ) -> bool:
+        """Add the outputs of an expression to the post-projection, if possible."""
+        nodes = list(metadata.iter_nodes_reversed())[::-1]
+        is_selection = nodes[0].kind in _SELECTOR_KINDS
+        if metadata.expansion_kind.is_multi_output() and not is_selection:
+            return False
+        for output_name, alias in zip_strict(output_names, aliases):
+            if is_selection:
+                # Expand multi-output expressions, one output column at a time.
+                nodes[0] = _col_node(output_name)
+            if (post_nodes := self.rewrite(nodes)) is None:
+                return False
+            self.outputs.append((alias, post_nodes))
+        return True
+
+    def rewrite(self, nodes: Sequence[ExprNode], /) -> list[ExprNode] | None:
+        """Replace each aggregation in `nodes` with a column of the aggregated frame.
+
+        Returns `None` if that isn't possible, e.g. if an aggregation is nested inside of
+        another one, or has no elementary native equivalent.
+        """
+        # Everything after the last aggregation (if any) must be elementwise.
+        i = len(nodes)
+        while i and nodes[i - 1].kind.is_elementwise:
+            i -= 1
+        head: list[ExprNode] = []
+        if i:
+            agg = nodes[i - 1]
+            inputs = [node for node in nodes[: i - 1] if not _is_aliasing(node)]
+            if (
+                agg.kind is not ExprKind.AGGREGATION
+                or agg.name not in self._supported_aggregations
+                or agg.exprs
+                or not all(node.is_elementwise() for node in inputs)
+                or (name := self._aggregate(inputs, agg)) is None
+            ):
+                return None
+            head.append(_col_node(name))
+        tail: list[ExprNode] = []
+        for node in nodes[i:]:
+            exprs = []
+            for expr in node.exprs:
+                if is_expr(expr):
+                    if (expr_nodes := self.rewrite(expr._nodes)) is None:
+                        return None
+                    expr = expr.__class__(*expr_nodes)  # noqa: PLW2901
+                exprs.append(expr)
+            tail.append(node._with_exprs(*exprs) if node.exprs else node)
+        return [*head, *tail]
+
+
 class CompliantGroupBy(Protocol[CompliantFrameT_co, CompliantExprT_contra]):
     _compliant_frame: Any
 
@@ -131,6 +263,58 @@ class DepthTrackingGroupBy(
     - `Dask` *may* return a `Callable` instead of a `str` referring to one.
     """
 
+    _keys: list[str]
+    _output_key_names: list[str]
+    _drop_null_keys: bool
+
+    def _agg_decomposed(
+        self, exprs: Sequence[DepthTrackingExprT_contra]
+    ) -> CompliantFrameT | None:
+        """Evaluate non-elementary aggregations as elementary ones, if possible.
+
+        Something like `agg((nw.col('a') * nw.col('b')).sum() / nw.col('b').sum())` is
+        evaluated as a `with_columns` of the product, a native aggregation of both sums,
+        and a `select` of their ratio.
+
+        Returns `None` if all of `exprs` are already elementary, or if any of them can't
+        be decomposed (e.g. `(nw.col('a') - nw.col('a').mean()).max()`).
+        """
+        if all(self._is_simple(expr) for expr in exprs):
+            return None
+        frame = self.compliant
+        exclude = (*self._keys, *self._output_key_names)
+        plan = _AggregationPlan(self._REMAP_AGGS, frame.columns)
+        for expr in exprs:
+            output_names, aliases = evaluate_output_names_and_aliases(
+                expr, frame, exclude
+            )
+            if not plan.add(expr._metadata, output_names, aliases):
+                return None
+
+        ns = frame.__narwhals_namespace__()
+        memo: CSEMemo = {}
+
+        def evaluate(nodes: Sequence[ExprNode], name: str) -> DepthTrackingExprT_contra:
+            alias = ExprNode(ExprKind.ELEMENTWISE, "alias", name=name)
+            return evaluate_nodes([*nodes, alias], ns, memo)  # type: ignore[no-any-return]
+
+        pre = [evaluate(nodes, name) for name, nodes in plan.pre_projection.values()]
+        aggs = [evaluate(nodes, name) for name, nodes in plan.aggregations.values()]
+        post = [evaluate(nodes, name) for name, nodes in plan.outputs]
+        if any(ce._metadata.expansion_kind.is_multi_output() for ce in chain(pre, post)):
+            return None
+        if pre:
+            frame = frame.with_columns(
+                *(ce.broadcast() if is_scalar_like(ce) else ce for ce in pre)
+            )
+        aggregated = frame.group_by(self._keys, drop_null_keys=self._drop_null_keys).agg(
+            *aggs
+        )
+        keys = evaluate_nodes([ExprNode(ExprKind.COL, "col", names=self._keys)], ns)
+        return aggregated.select(
+            keys, *(ce.broadcast() if is_scalar_like(ce) else ce for ce in post)
+        ).rename(dict(zip(self._keys, self._output_key_names)))
+
     def _ensure_all_simple(self, exprs: Sequence[DepthTrackingExprT_contra]) -> None:
         for expr in exprs:
             if not self._is_simple(expr):
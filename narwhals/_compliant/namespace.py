@@ -219,17 +219,19 @@ class EagerNamespace(
             return self._dataframe.from_numpy(data, schema=schema, context=self)
         return self._series.from_numpy(data, context=self)
 
-    def _concat_diagonal(self, dfs: Sequence[NativeFrameT], /) -> NativeFrameT: ...
+    def _concat_diagonal(self, dfs: Iterable[NativeFrameT], /) -> NativeFrameT: ...
     def _concat_horizontal(
         self, dfs: Sequence[NativeFrameT | Any], /
     ) -> NativeFrameT: ...
-    def _concat_vertical(self, dfs: Sequence[NativeFrameT], /) -> NativeFrameT: ...
+    def _concat_vertical(self, dfs: Iterable[NativeFrameT], /) -> NativeFrameT: ...
     def concat(
         self, items: Iterable[EagerDataFrameT], *, how: ConcatMethod
     ) -> EagerDataFrameT:
-        dfs = [item.native for item in items]
+        # NOTE: Row-wise concatenations consume `items` lazily, which lets backends
+        # combine an iterator of frames without holding all of them at once.
+        dfs = (item.native for item in items)
         if how == "horizontal":
-            native = self._concat_horizontal(dfs)
+            native = self._concat_horizontal(list(dfs))
         elif how == "vertical":
             native = self._concat_vertical(dfs)
         elif how == "diagonal":
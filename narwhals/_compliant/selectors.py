@@ -170,15 +170,13 @@ class EagerSelectorNamespace(
     CompliantSelectorNamespace[DataFrameT, SeriesT], Protocol[DataFrameT, SeriesT]
 ):
     def _iter_schema(self, df: DataFrameT, /) -> Iterator[tuple[str, DType]]:
-        for ser in self._iter_columns(df):
-            yield ser.name, ser.dtype
+        yield from df.schema.items()
 
     def _iter_columns(self, df: DataFrameT, /) -> Iterator[SeriesT]:
         yield from df.iter_columns()
 
     def _iter_columns_dtypes(self, df: DataFrameT, /) -> Iterator[tuple[SeriesT, DType]]:
-        for ser in self._iter_columns(df):
-            yield ser, ser.dtype
+        yield from zip_strict(self._iter_columns(df), df.schema.values())
 
 
 class LazySelectorNamespace(
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any
 
 import dask.dataframe as dd
 
-from narwhals._dask.utils import add_row_index, evaluate_exprs
+from narwhals._dask.utils import add_row_index, evaluate_exprs, partition_offsets
 from narwhals._pandas_like.utils import native_to_narwhals_dtype, select_columns_by_name
 from narwhals._typing_compat import assert_never
 from narwhals._utils import (
@@ -66,6 +66,7 @@ class DaskLazyFrame(
         self._version = version
         self._cached_schema: dict[str, DType] | None = None
         self._cached_columns: list[str] | None = None
+        self._cached_row_offsets: Any | None = None
         if validate_backend_version:
             self._validate_backend_version()
 
@@ -101,6 +102,12 @@ class DaskLazyFrame(
     def _with_native(self, df: Any) -> Self:
         return self.__class__(df, version=self._version)
 
+    def _with_native_same_rows(self, df: Any) -> Self:
+        # `df` only differs in its columns, so its partitions have the same lengths.
+        result = self._with_native(df)
+        result._cached_row_offsets = self._cached_row_offsets
+        return result
+
     def _check_columns_exist(self, subset: Sequence[str]) -> ColumnNotFoundError | None:
         return check_columns_exist(subset, available=self.columns)
 
@@ -179,7 +186,7 @@ class DaskLazyFrame(
     def simple_select(self, *column_names: str) -> Self:
         df: Incomplete = self.native
         native = select_columns_by_name(df, list(column_names), self._implementation)
-        return self._with_native(native)
+        return self._with_native_same_rows(native)
 
     def aggregate(self, *exprs: DaskExpr) -> Self:
         new_series = evaluate_exprs(self, *exprs)
@@ -221,24 +228,24 @@ class DaskLazyFrame(
     def drop(self, columns: Sequence[str], *, strict: bool) -> Self:
         to_drop = parse_columns_to_drop(self, columns, strict=strict)
 
-        return self._with_native(self.native.drop(columns=to_drop))
+        return self._with_native_same_rows(self.native.drop(columns=to_drop))
+
+    @property
+    def _row_offsets(self) -> Any:
+        # Rows before each partition, computed lazily and shared by every row index
+        # taken from this frame.
+        if self._cached_row_offsets is None:
+            self._cached_row_offsets = partition_offsets(self.native)
+        return self._cached_row_offsets
 
     def with_row_index(self, name: str, order_by: Sequence[str] | None) -> Self:
-        # Implementation is based on the following StackOverflow reply:
-        # https://stackoverflow.com/questions/60831518/in-dask-how-does-one-add-a-range-of-integersauto-increment-to-a-new-column/60852409#60852409
         if order_by is None:
-            return self._with_native(add_row_index(self.native, name))
-        plx = self.__narwhals_namespace__()
-        columns = self.columns
-        const_expr = plx.lit(1, dtype=None).alias(name).broadcast()
-        row_index_expr = (
-            plx.col(name).cum_sum(reverse=False).over(partition_by=[], order_by=order_by)
-            - plx.lit(1, dtype=None).broadcast()
-        )
-        return self.with_columns(const_expr).select(row_index_expr, plx.col(*columns))
+            return self._with_native(add_row_index(self.native, name, self._row_offsets))
+        ordered = self.sort(*order_by, descending=False, nulls_last=False)
+        return ordered._with_native(add_row_index(ordered.native, name))
 
     def rename(self, mapping: Mapping[str, str]) -> Self:
-        return self._with_native(self.native.rename(columns=mapping))
+        return self._with_native_same_rows(self.native.rename(columns=mapping))
 
     def head(self, n: int) -> Self:
         return self._with_native(self.native.head(n=n, compute=False, npartitions=-1))
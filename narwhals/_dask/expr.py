@@ -11,8 +11,15 @@ from narwhals._dask.expr_str import DaskExprStringNamespace
 from narwhals._dask.utils import (
     add_row_index,
     align_series_full_broadcast,
+    broadcast_groups,
+    first as dask_first,
+    last as dask_last,
     make_group_by_kwargs,
     narwhals_to_native_dtype,
+    quantile as dask_quantile,
+    rank as dask_rank,
+    rank_ordinal_over,
+    reverse_cumulative,
 )
 from narwhals._expression_parsing import evaluate_nodes, evaluate_output_names_and_aliases
 from narwhals._pandas_like.expr import window_kwargs_to_pandas_equivalent
@@ -39,12 +46,14 @@ if TYPE_CHECKING:
     )
     from narwhals._dask.dataframe import DaskLazyFrame
     from narwhals._dask.namespace import DaskNamespace
+    from narwhals._expression_parsing import ExprNode
     from narwhals._typing import NoDefault
     from narwhals._utils import Version, _LimitedContext
     from narwhals.typing import (
         FillNullStrategy,
         IntoDType,
         ModeKeepStrategy,
+        RankMethod,
         RollingInterpolationMethod,
     )
 
@@ -291,7 +300,7 @@ class DaskExpr(
             if not dtype.is_numeric():
                 msg = "`median` operation not supported for non-numeric input type."
                 raise InvalidOperationError(msg)
-            return s.median_approximate().to_series()
+            return dask_quantile(s, 0.5, "linear")
 
         return self._with_callable(func)
 
@@ -299,39 +308,30 @@ class DaskExpr(
         return self._with_callable(lambda expr: expr.shift(n))
 
     def cum_sum(self, *, reverse: bool) -> Self:
-        if reverse:  # pragma: no cover
-            # https://github.com/dask/dask/issues/11802
-            msg = "`cum_sum(reverse=True)` is not supported with Dask backend"
-            raise NotImplementedError(msg)
-
+        if reverse:
+            return self._with_callable(lambda expr: reverse_cumulative(expr, "cumsum"))
         return self._with_callable(lambda expr: expr.cumsum())
 
     def cum_count(self, *, reverse: bool) -> Self:
-        if reverse:  # pragma: no cover
-            msg = "`cum_count(reverse=True)` is not supported with Dask backend"
-            raise NotImplementedError(msg)
-
+        if reverse:
+            return self._with_callable(
+                lambda expr: reverse_cumulative((~expr.isna()).astype(int), "cumsum")
+            )
         return self._with_callable(lambda expr: (~expr.isna()).astype(int).cumsum())
 
     def cum_min(self, *, reverse: bool) -> Self:
-        if reverse:  # pragma: no cover
-            msg = "`cum_min(reverse=True)` is not supported with Dask backend"
-            raise NotImplementedError(msg)
-
+        if reverse:
+            return self._with_callable(lambda expr: reverse_cumulative(expr, "cummin"))
         return self._with_callable(lambda expr: expr.cummin())
 
     def cum_max(self, *, reverse: bool) -> Self:
-        if reverse:  # pragma: no cover
-            msg = "`cum_max(reverse=True)` is not supported with Dask backend"
-            raise NotImplementedError(msg)
-
+        if reverse:
+            return self._with_callable(lambda expr: reverse_cumulative(expr, "cummax"))
         return self._with_callable(lambda expr: expr.cummax())
 
     def cum_prod(self, *, reverse: bool) -> Self:
-        if reverse:  # pragma: no cover
-            msg = "`cum_prod(reverse=True)` is not supported with Dask backend"
-            raise NotImplementedError(msg)
-
+        if reverse:
+            return self._with_callable(lambda expr: reverse_cumulative(expr, "cumprod"))
         return self._with_callable(lambda expr: expr.cumprod())
 
     def rolling_sum(self, window_size: int, *, min_samples: int, center: bool) -> Self:
@@ -372,6 +372,42 @@ class DaskExpr(
         msg = "Dask backend only supports `ddof=1` for `rolling_std`"
         raise NotImplementedError(msg)
 
+    def rolling_min(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        return self._with_callable(
+            lambda expr: expr.rolling(
+                window=window_size, min_periods=min_samples, center=center
+            ).min()
+        )
+
+    def rolling_max(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        return self._with_callable(
+            lambda expr: expr.rolling(
+                window=window_size, min_periods=min_samples, center=center
+            ).max()
+        )
+
+    def rolling_median(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        return self._with_callable(
+            lambda expr: expr.rolling(
+                window=window_size, min_periods=min_samples, center=center
+            ).median()
+        )
+
+    def rolling_quantile(
+        self,
+        quantile: float,
+        interpolation: RollingInterpolationMethod,
+        window_size: int,
+        *,
+        min_samples: int,
+        center: bool,
+    ) -> Self:
+        return self._with_callable(
+            lambda expr: expr.rolling(
+                window=window_size, min_periods=min_samples, center=center
+            ).quantile(quantile, interpolation=interpolation)
+        )
+
     def floor(self) -> Self:
         import dask.array as da
 
@@ -457,19 +493,32 @@ class DaskExpr(
     def quantile(
         self, quantile: float, interpolation: RollingInterpolationMethod
     ) -> Self:
-        if interpolation == "linear":
-
-            def func(expr: dx.Series) -> dx.Series:
-                if expr.npartitions > 1:
-                    msg = "`Expr.quantile` is not supported for Dask backend with multiple partitions."
-                    raise NotImplementedError(msg)
-                return expr.quantile(
-                    q=quantile, method="dask"
-                ).to_series()  # pragma: no cover
-
-            return self._with_callable(func)
-        msg = "`higher`, `lower`, `midpoint`, `nearest` - interpolation methods are not supported by Dask. Please use `linear` instead."
-        raise NotImplementedError(msg)
+        return self._with_callable(
+            lambda expr: dask_quantile(expr, quantile, interpolation)
+        )
+
+    def first(self) -> Self:
+        return self._with_callable(dask_first)
+
+    def last(self) -> Self:
+        return self._with_callable(dask_last)
+
+    def any_value(self, *, ignore_nulls: bool) -> Self:
+        return self._with_callable(
+            lambda expr: dask_first(expr.dropna() if ignore_nulls else expr)
+        )
+
+    def rank(self, method: RankMethod, *, descending: bool) -> Self:
+        return self._with_callable(
+            lambda expr: dask_rank(expr, method, descending=descending)
+        )
+
+    def filter(self, *predicates: Self) -> Self:
+        plx = self.__narwhals_namespace__()
+        predicate = plx.all_horizontal(*predicates, ignore_nulls=False)
+        return self._with_callable(
+            lambda expr, predicate: expr[predicate], predicate=predicate
+        )
 
     def is_first_distinct(self) -> Self:
         def func(expr: dx.Series) -> dx.Series:
@@ -523,8 +572,61 @@ class DaskExpr(
     def _over_without_partition_by(self, order_by: Sequence[str]) -> Self:
         # This is something like `nw.col('a').cum_sum().order_by(key)`
         # which we can always easily support, as it doesn't require grouping.
+        meta = self._opt_metadata
+
+        def func(df: DaskLazyFrame) -> Sequence[dx.Series]:
+            results = self(df.sort(*order_by, descending=False, nulls_last=False))
+            if meta is not None and meta.is_scalar_like:
+                # We need to broadcast the results to the original size, since
+                # `over` is a length-preserving operation.
+                return [
+                    df.native.assign(**{result.name: result.loc[0][0]})[result.name]
+                    for result in results
+                ]
+            return results
+
+        return self.__class__(
+            func,
+            evaluate_output_names=self._evaluate_output_names,
+            alias_output_names=self._alias_output_names,
+            version=self._version,
+        )
+
+    def _over_ordered_aggregation(
+        self,
+        nodes: Sequence[ExprNode],
+        partition_by: Sequence[str],
+        order_by: Sequence[str],
+    ) -> Self:
+        # `first`, `last` and `any_value` per group are found with a tree reduction
+        # (after sorting by `order_by`, if given), and the (small) result is then
+        # joined back onto each partition, so the frame itself never gets shuffled.
+        from narwhals._dask.group_by import DaskLazyGroupBy
+
+        meta = self._metadata
+        leaf_node = nodes[-1]
+        agg_fn = DaskLazyGroupBy._REMAP_AGGS[cast("NarwhalsAggregation", leaf_node.name)]
+        aggregation = agg_fn(**leaf_node.kwargs) if callable(agg_fn) else agg_fn
+        keys = list(partition_by)
+
         def func(df: DaskLazyFrame) -> Sequence[dx.Series]:
-            return self(df.sort(*order_by, descending=False, nulls_last=False))
+            plx = self.__narwhals_namespace__()
+            if meta.prev is not None:
+                df = df.with_columns(cast("DaskExpr", evaluate_nodes(nodes[:-1], plx)))
+            _, aliases = evaluate_output_names_and_aliases(self, df, [])
+            ordered = (
+                df.sort(*order_by, descending=False, nulls_last=False) if order_by else df
+            )
+            group_by_kwargs = make_group_by_kwargs(drop_null_keys=False)
+            groups = (
+                ordered.native.groupby(keys, **group_by_kwargs)
+                .agg(**{alias: (alias, aggregation) for alias in aliases})
+                .reset_index()
+            )
+            result_frame = df.native[keys].map_partitions(
+                broadcast_groups, groups, keys, meta=groups._meta[list(aliases)]
+            )
+            return [result_frame[name] for name in aliases]
 
         return self.__class__(
             func,
@@ -533,7 +635,7 @@ class DaskExpr(
             version=self._version,
         )
 
-    def over(self, partition_by: Sequence[str], order_by: Sequence[str]) -> Self:
+    def over(self, partition_by: Sequence[str], order_by: Sequence[str]) -> Self:  # noqa: C901
         if not partition_by:
             assert order_by  # noqa: S101
             return self._over_without_partition_by(order_by)
@@ -559,16 +661,25 @@ class DaskExpr(
             )
             raise NotImplementedError(msg)
 
+        nodes = list(reversed(list(self._metadata.iter_nodes_reversed())))
+        leaf_node = nodes[-1]
+        if leaf_node.name in {"first", "last", "any_value"}:
+            return self._over_ordered_aggregation(nodes, partition_by, order_by)
+
         if order_by:
             # Wrong results https://github.com/dask/dask/issues/11806.
             msg = "`over` with `order_by` is not yet supported in Dask."
             raise NotImplementedError(msg)
 
-        nodes = list(reversed(list(self._metadata.iter_nodes_reversed())))
-        leaf_node = nodes[-1]
         function_name = cast("NarwhalsAggregation", leaf_node.name)
         try:
-            dask_function_name = PandasLikeGroupBy._REMAP_AGGS[function_name]
+            # Ranking within groups needs all of a group's rows in one partition,
+            # so (unlike aggregations) it can't avoid a shuffle.
+            dask_function_name = (
+                "rank"
+                if leaf_node.name == "rank"
+                else PandasLikeGroupBy._REMAP_AGGS[function_name]
+            )
         except KeyError:
             # window functions are unsupported: https://github.com/dask/dask/issues/11806
             msg = (
@@ -598,6 +709,13 @@ class DaskExpr(
                     res_native = grouped.transform(
                         dask_function_name, **dask_kwargs
                     ).to_frame(aliases[0])
+                elif dask_function_name == "rank" and dask_kwargs["method"] == "first":
+                    res_native = rank_ordinal_over(
+                        df.native,
+                        partition_by,
+                        aliases,
+                        descending=leaf_node.kwargs["descending"],
+                    )
                 else:
                     res_native = grouped[list(aliases)].transform(
                         dask_function_name, **dask_kwargs
@@ -703,12 +821,6 @@ class DaskExpr(
     def dt(self) -> DaskExprDateTimeNamespace:
         return DaskExprDateTimeNamespace(self)
 
-    any_value = not_implemented()
-    filter = not_implemented()
-    first = not_implemented()
-    rank = not_implemented()
-    last = not_implemented()
-
     # namespaces
     list: not_implemented = not_implemented()  # type: ignore[assignment]
     struct: not_implemented = not_implemented()  # type: ignore[assignment]
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from functools import partial
-from typing import TYPE_CHECKING, Any, Callable, ClassVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Literal
 
 import dask.dataframe as dd
 
 from narwhals._compliant import DepthTrackingGroupBy
-from narwhals._dask.utils import make_group_by_kwargs
+from narwhals._dask.utils import make_group_by_kwargs, quantile_ranks
 from narwhals._expression_parsing import evaluate_output_names_and_aliases
-from narwhals._utils import zip_strict
+from narwhals._utils import Implementation, zip_strict
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
@@ -21,9 +21,11 @@ if TYPE_CHECKING:
     from narwhals._compliant.typing import NarwhalsAggregation
     from narwhals._dask.dataframe import DaskLazyFrame
     from narwhals._dask.expr import DaskExpr
+    from narwhals.typing import RollingInterpolationMethod, _1DArray
 
     PandasSeriesGroupBy: TypeAlias = _PandasSeriesGroupBy[Any, Any]
     _AggFn: TypeAlias = Callable[..., Any]
+    _QuantileFn: TypeAlias = Callable[["pd.Series[Any]", "pd.Series[Any]", int], _1DArray]
 
 else:
     try:
@@ -66,6 +68,79 @@ def _any() -> dd.Aggregation:
     return dd.Aggregation(name="any", chunk=chunk, agg=agg)
 
 
+def _nth(name: str, n: Literal[0, -1], *, skipna: bool) -> dd.Aggregation:
+    # Partial results are combined in partition order, so taking the first (last)
+    # value of every chunk and then of the combined chunks keeps the row order.
+    method = "first" if n == 0 else "last"
+
+    def pick(s: PandasSeriesGroupBy) -> pd.Series[Any]:
+        if skipna:
+            return getattr(s, method)()
+        if Implementation.PANDAS._backend_version() >= (2, 2, 1):
+            return getattr(s, method)(skipna=False)
+        return s.agg(lambda group: group.iloc[n])  # pragma: no cover
+
+    return dd.Aggregation(name=name, chunk=pick, agg=pick)
+
+
+def first() -> dd.Aggregation:
+    return _nth("first", 0, skipna=False)
+
+
+def last() -> dd.Aggregation:
+    return _nth("last", -1, skipna=False)
+
+
+def any_value(*, ignore_nulls: bool) -> dd.Aggregation:
+    return _nth("any_value", 0, skipna=ignore_nulls)
+
+
+def quantile(quantile: float, interpolation: RollingInterpolationMethod) -> _QuantileFn:
+    import numpy as np  # ignore-banned-import
+
+    # Exact quantiles can't be combined from partial results, so groups get
+    # shuffled into single partitions (like Dask does for `median`), where one
+    # sort by (group, value) lets every group's order statistics be looked up.
+    def group_quantile(
+        values: pd.Series[Any], codes: pd.Series[Any], n_groups: int
+    ) -> _1DArray:
+        valid = (values.notna() & codes.notna()).to_numpy()
+        array, group = values[valid].to_numpy(), codes[valid].to_numpy("int64")
+        array = array[np.lexsort((array, group))]
+        counts = np.bincount(group, minlength=n_groups)
+        starts = np.cumsum(counts) - counts
+        lower, upper, weight = quantile_ranks(counts, quantile, interpolation)
+        found = counts > 0
+        result = np.full(n_groups, np.nan)
+        # Subtract in the native dtype, so large integers keep their precision.
+        low = array[(starts + lower)[found]]
+        high = array[(starts + upper)[found]]
+        result[found] = low + (high - low) * weight[found]
+        return result
+
+    return group_quantile
+
+
+def _agg_quantiles(
+    df: pd.DataFrame,
+    keys: list[str],
+    quantiles: Mapping[str, tuple[str, _QuantileFn]],
+    *,
+    drop_null_keys: bool,
+) -> pd.DataFrame:
+    import pandas as pd
+
+    grouped = df.groupby(keys, **make_group_by_kwargs(drop_null_keys=drop_null_keys))
+    codes, index = grouped.ngroup(), grouped.size().index
+    return pd.DataFrame(
+        {
+            alias: fn(df[column], codes, len(index))
+            for alias, (column, fn) in quantiles.items()
+        },
+        index=index,
+    ).reset_index()
+
+
 def var(ddof: int) -> _AggFn:
     return partial(_DaskGroupBy.var, ddof=ddof)
 
@@ -86,9 +161,12 @@ class DaskLazyGroupBy(DepthTrackingGroupBy["DaskLazyFrame", "DaskExpr", Aggregat
         "len": "size",
         "n_unique": n_unique,
         "count": "count",
-        "quantile": "quantile",
+        "quantile": quantile,
         "all": _all,
         "any": _any,
+        "first": first,
+        "last": last,
+        "any_value": any_value,
     }
 
     def __init__(
@@ -102,6 +180,7 @@ class DaskLazyGroupBy(DepthTrackingGroupBy["DaskLazyFrame", "DaskExpr", Aggregat
         self._compliant_frame, self._keys, self._output_key_names = self._parse_keys(
             df, keys=keys
         )
+        self._drop_null_keys = drop_null_keys
         group_by_kwargs = make_group_by_kwargs(drop_null_keys=drop_null_keys)
         self._grouped = self.compliant.native.groupby(self._keys, **group_by_kwargs)
 
@@ -116,16 +195,21 @@ class DaskLazyGroupBy(DepthTrackingGroupBy["DaskLazyFrame", "DaskExpr", Aggregat
                 .rename(dict(zip(self._keys, self._output_key_names)))
             )
 
+        if (result := self._agg_decomposed(exprs)) is not None:
+            return result
         self._ensure_all_simple(exprs)
         # This should be the fastpath, but cuDF is too far behind to use it.
         # - https://github.com/rapidsai/cudf/issues/15118
         # - https://github.com/rapidsai/cudf/issues/15084
         simple_aggregations: dict[str, tuple[str, Aggregation]] = {}
+        quantiles: dict[str, tuple[str, _QuantileFn]] = {}
+        all_aliases: list[str] = []
         exclude = (*self._keys, *self._output_key_names)
         for expr in exprs:
             output_names, aliases = evaluate_output_names_and_aliases(
                 expr, self.compliant, exclude
             )
+            all_aliases.extend(aliases)
             last_node = next(expr._metadata.op_nodes_reversed())
             if len(list(expr._metadata.op_nodes_reversed())) == 1:
                 # e.g. `agg(nw.len())`
@@ -138,11 +222,41 @@ class DaskLazyGroupBy(DepthTrackingGroupBy["DaskLazyFrame", "DaskExpr", Aggregat
             agg_fn = self._remap_expr_name(self._leaf_name(expr))
             # deal with n_unique case in a "lazy" mode to not depend on dask globally
             agg_fn = agg_fn(**last_node.kwargs) if callable(agg_fn) else agg_fn
-            simple_aggregations.update(
-                (alias, (output_name, agg_fn))
-                for alias, output_name in zip_strict(aliases, output_names)
+            pairs = zip_strict(aliases, output_names)
+            if self._leaf_name(expr) == "quantile":
+                quantiles.update((alias, (name, agg_fn)) for alias, name in pairs)
+            else:
+                simple_aggregations.update(
+                    (alias, (name, agg_fn)) for alias, name in pairs
+                )
+        result = (
+            self._grouped.agg(**simple_aggregations).reset_index()
+            if simple_aggregations
+            else None
+        )
+        if quantiles:
+            result_quantiles = self._agg_quantiles(quantiles)
+            result = (
+                result_quantiles
+                if result is None
+                else result.merge(result_quantiles, on=self._keys)
             )
         return DaskLazyFrame(
-            self._grouped.agg(**simple_aggregations).reset_index(),
-            version=self.compliant._version,
+            result[[*self._keys, *all_aliases]], version=self.compliant._version
         ).rename(dict(zip(self._keys, self._output_key_names)))
+
+    def _agg_quantiles(
+        self, quantiles: Mapping[str, tuple[str, _QuantileFn]]
+    ) -> dd.DataFrame:
+        columns = dict.fromkeys(column for column, _ in quantiles.values())
+        native = self.compliant.native
+        shuffled = native[list(dict.fromkeys((*self._keys, *columns)))].shuffle(
+            on=self._keys
+        )
+        func = partial(
+            _agg_quantiles,
+            keys=self._keys,
+            quantiles=quantiles,
+            drop_null_keys=self._drop_null_keys,
+        )
+        return shuffled.map_partitions(func, meta=func(shuffled._meta))
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import operator
+from typing import TYPE_CHECKING, Any, Literal, overload
 
-from narwhals._pandas_like.utils import (
-    make_group_by_kwargs as pd_make_group_by_kwargs,
-    select_columns_by_name,
+from narwhals._pandas_like.utils import make_group_by_kwargs as pd_make_group_by_kwargs
+from narwhals._utils import (
+    Implementation,
+    Version,
+    generate_temporary_column_name,
+    isinstance_or_issubclass,
 )
-from narwhals._utils import Implementation, Version, isinstance_or_issubclass
 from narwhals.dependencies import get_pyarrow
 
 if TYPE_CHECKING:
@@ -14,11 +17,18 @@ if TYPE_CHECKING:
 
     import dask.dataframe as dd
     import dask.dataframe.dask_expr as dx
+    import pandas as pd
 
-    from narwhals._dask.dataframe import DaskLazyFrame, Incomplete
+    from narwhals._dask.dataframe import DaskLazyFrame
     from narwhals._dask.expr import DaskExpr
     from narwhals.dtypes import DType
-    from narwhals.typing import IntoDType
+    from narwhals.typing import (
+        IntoDType,
+        RankMethod,
+        RollingInterpolationMethod,
+        _1DArray,
+        _1DArrayInt,
+    )
 else:
     try:
         import dask.dataframe.dask_expr as dx
@@ -47,16 +57,60 @@ def align_series_full_broadcast(
     ]  # pyright: ignore[reportReturnType]
 
 
-def add_row_index(frame: dd.DataFrame, name: str) -> dd.DataFrame:
-    original_cols = frame.columns
-    df: Incomplete = frame.assign(**{name: 1})
-    return select_columns_by_name(
-        df.assign(**{name: df[name].cumsum(method="blelloch") - 1}),
-        [name, *original_cols],
-        Implementation.DASK,
+def _partition_length(partition: pd.Index[Any]) -> pd.DataFrame:
+    import pandas as pd
+
+    return pd.DataFrame({"length": [len(partition)]})
+
+
+def _partition_offsets(lengths: pd.DataFrame) -> list[int]:
+    return [0, *lengths["length"].cumsum().tolist()[:-1]]
+
+
+def partition_offsets(frame: dd.DataFrame) -> Any:
+    """Count the rows before each partition of `frame`.
+
+    Only the index is needed for the partition lengths, and the result is a single
+    small (lazy) list that partition-wise operations can take as an argument.
+    """
+    return frame.index.reduction(
+        chunk=_partition_length,
+        aggregate=_partition_offsets,
+        meta=object,
+        split_every=False,
     )
 
 
+def _insert_row_index(
+    partition: pd.DataFrame,
+    offsets: list[int],
+    name: str,
+    partition_info: dict[str, Any] | None = None,
+) -> pd.DataFrame:
+    import numpy as np  # ignore-banned-import
+
+    start = offsets[partition_info["number"]] if partition_info else 0
+    result = partition.copy(deep=False)
+    result.insert(0, name, np.arange(start, start + len(partition), dtype="int64"))
+    return result
+
+
+def add_row_index(
+    frame: dd.DataFrame, name: str, offsets: Any | None = None
+) -> dd.DataFrame:
+    offsets = partition_offsets(frame) if offsets is None else offsets
+    meta = _insert_row_index(frame._meta, [0], name)
+    return frame.map_partitions(_insert_row_index, offsets, name, meta=meta)
+
+
+def broadcast_groups(
+    partition: pd.DataFrame, groups: pd.DataFrame, keys: list[str]
+) -> pd.DataFrame:
+    """Look up the row of `groups` matching each row's `keys`, keeping the index."""
+    result = partition[keys].merge(groups, on=keys, how="left")
+    return result.drop(columns=keys).set_axis(partition.index)
+
+
 def validate_comparand(lhs: dx.Series, rhs: dx.Series) -> None:
     if not dx.expr.are_co_aligned(lhs._expr, rhs._expr):  # pragma: no cover
         # are_co_aligned is a method which cheaply checks if two Dask expressions
@@ -136,3 +190,487 @@ def make_group_by_kwargs(*, drop_null_keys: bool) -> dict[str, bool]:
     kwargs = pd_make_group_by_kwargs(drop_null_keys=drop_null_keys)
     kwargs.pop("as_index")  # not supported in dask
     return kwargs
+
+
+QUANTILE_SAMPLES = 1000
+"""How many values of each partition get sampled to bracket a quantile."""
+
+
+@overload
+def quantile_ranks(
+    n: int, quantile: float, interpolation: RollingInterpolationMethod
+) -> tuple[int, int, float]: ...
+@overload
+def quantile_ranks(
+    n: _1DArrayInt, quantile: float, interpolation: RollingInterpolationMethod
+) -> tuple[_1DArrayInt, _1DArrayInt, _1DArray]: ...
+def quantile_ranks(
+    n: int | _1DArrayInt, quantile: float, interpolation: RollingInterpolationMethod
+) -> tuple[Any, Any, Any]:
+    """Return the ranks of the order statistics a quantile needs, and their weight.
+
+    The quantile is `(1 - weight) * x[lower] + weight * x[upper]`, where `x` holds the
+    `n` non-null values in sorted order. Like Polars, `nearest` rounds halves up.
+    `n` may also be an array of sizes, e.g. one per group.
+    """
+    import numpy as np  # ignore-banned-import
+
+    position = quantile * (np.asarray(n) - 1)
+    lower, upper = np.floor(position), np.ceil(position)
+    if interpolation == "lower":
+        upper = lower
+    elif interpolation == "higher":
+        lower = upper
+    elif interpolation == "nearest":
+        lower = upper = np.floor(position + 0.5)
+    weight = (
+        np.full_like(position, 0.5)
+        if interpolation == "midpoint"
+        else position - np.floor(position)
+    )
+    if isinstance(n, int):
+        return int(lower), int(upper), float(weight)
+    return lower.astype("int64"), upper.astype("int64"), weight
+
+
+def _quantile_sketch(partition: pd.Series[Any]) -> pd.DataFrame:
+    import numpy as np  # ignore-banned-import
+    import pandas as pd
+
+    values = np.sort(partition.dropna().to_numpy(dtype="float64"))
+    size = min(len(values), QUANTILE_SAMPLES)
+    ranks = np.unique(np.linspace(0, len(values) - 1, size).astype("int64"))
+    return pd.DataFrame(
+        {"values": [values[ranks]], "ranks": [ranks], "count": [len(values)]}
+    )
+
+
+def _quantile_bracket(
+    sketches: pd.DataFrame, quantile: float, interpolation: RollingInterpolationMethod
+) -> tuple[int, float, float]:
+    """Find values `lo` and `hi` between which the order statistics must lie.
+
+    Within a partition, a sample at rank `r` bounds how many of its values can be
+    below it (at most `r`) or up to it (at least `r + 1`), so summing those bounds
+    over partitions brackets the global ranks of each sampled value.
+    """
+    import numpy as np  # ignore-banned-import
+
+    sketches = sketches[sketches["count"] > 0]
+    n = int(sketches["count"].sum())
+    if n == 0:
+        return 0, float("nan"), float("nan")
+    lower, upper, _ = quantile_ranks(n, quantile, interpolation)
+    candidates = np.unique(np.concatenate(sketches["values"].tolist()))
+    at_most_below = np.zeros(len(candidates), dtype="int64")
+    at_least_up_to = np.zeros(len(candidates), dtype="int64")
+    for values, ranks, count in sketches.itertuples(index=False):
+        first_above = np.searchsorted(values, candidates, side="left")
+        at_most_below += np.append(ranks, count)[first_above]
+        last_below = np.searchsorted(values, candidates, side="right") - 1
+        at_least_up_to += np.where(last_below >= 0, ranks[last_below] + 1, 0)
+    lo = candidates[at_most_below <= lower]
+    hi = candidates[at_least_up_to >= upper + 1]
+    return (
+        n,
+        float(lo[-1]) if len(lo) else -float("inf"),
+        float(hi[0]) if len(hi) else float("inf"),
+    )
+
+
+def _quantile_select(
+    partition: pd.Series[Any], bracket: tuple[int, float, float]
+) -> pd.DataFrame:
+    import pandas as pd
+
+    n, lo, hi = bracket
+    values = partition.dropna().to_numpy(dtype="float64")
+    # Values equal to the ends of the bracket (which may be heavily tied) are only
+    # counted, not gathered.
+    return pd.DataFrame(
+        {
+            "values": [values[(values > lo) & (values < hi)]],
+            "below": [int((values < lo).sum())],
+            "at_lo": [int((values == lo).sum())],
+            "at_hi": [int((values == hi).sum()) if hi != lo else 0],
+            "lo": [lo],
+            "hi": [hi],
+            "count": [n],
+        }
+    )
+
+
+def _quantile_finish(
+    selected: pd.DataFrame, quantile: float, interpolation: RollingInterpolationMethod
+) -> float:
+    import numpy as np  # ignore-banned-import
+
+    n = int(selected["count"].iloc[0])
+    if n == 0:
+        return float("nan")
+    inside = np.sort(np.concatenate(selected["values"].tolist()))
+    below, at_lo = int(selected["below"].sum()), int(selected["at_lo"].sum())
+    lo, hi = float(selected["lo"].iloc[0]), float(selected["hi"].iloc[0])
+
+    def order_statistic(rank: int) -> float:
+        rank -= below
+        if rank < at_lo:
+            return lo
+        rank -= at_lo
+        return float(inside[rank]) if rank < len(inside) else hi
+
+    lower, upper, weight = quantile_ranks(n, quantile, interpolation)
+    low, high = order_statistic(lower), order_statistic(upper)
+    return low + (high - low) * weight
+
+
+def quantile(
+    series: dx.Series, quantile: float, interpolation: RollingInterpolationMethod
+) -> dx.Series:
+    """Compute an exact quantile over all partitions of `series`, ignoring nulls.
+
+    Sorting the whole series would need a shuffle. Instead, a first reduction
+    samples each sorted partition and merges the samples into a bracket around the
+    order statistics that the quantile needs. A second pass then only gathers the
+    values strictly inside that bracket (plus counts of those below it and at its
+    ends), which is a small fraction of the data.
+    """
+    import pandas as pd
+
+    bracket = series.reduction(
+        chunk=_quantile_sketch,
+        aggregate=_quantile_bracket,
+        aggregate_kwargs={"quantile": quantile, "interpolation": interpolation},
+        meta=object,
+        split_every=False,
+    )
+    meta = pd.DataFrame(
+        {
+            "values": pd.Series(dtype=object),
+            "below": pd.Series(dtype="int64"),
+            "at_lo": pd.Series(dtype="int64"),
+            "at_hi": pd.Series(dtype="int64"),
+            "lo": pd.Series(dtype="float64"),
+            "hi": pd.Series(dtype="float64"),
+            "count": pd.Series(dtype="int64"),
+        }
+    )
+    selected = series.map_partitions(_quantile_select, bracket, meta=meta)
+    return selected.reduction(
+        chunk=lambda df: df,
+        aggregate=_quantile_finish,
+        aggregate_kwargs={"quantile": quantile, "interpolation": interpolation},
+        meta=0.0,
+        split_every=False,
+    ).to_series()
+
+
+def _head(rows: pd.Series[Any] | pd.DataFrame) -> pd.DataFrame:
+    return rows.iloc[:1].to_frame() if rows.ndim == 1 else rows.iloc[:1]
+
+
+def _tail(rows: pd.Series[Any] | pd.DataFrame) -> pd.DataFrame:
+    return rows.iloc[-1:].to_frame() if rows.ndim == 1 else rows.iloc[-1:]
+
+
+def _first_value(heads: pd.DataFrame) -> pd.Series[Any]:
+    return heads.iloc[:1, 0].reset_index(drop=True).reindex([0])
+
+
+def _last_value(tails: pd.DataFrame) -> pd.Series[Any]:
+    return tails.iloc[-1:, 0].reset_index(drop=True).reindex([0])
+
+
+def first(series: dx.Series) -> dx.Series:
+    """Get the first value of `series`, or null if it's empty.
+
+    Each partition contributes its head, and heads are combined in partition order,
+    so only a single row per partition travels up the reduction tree.
+    """
+    return series.reduction(
+        chunk=_head, combine=_head, aggregate=_first_value, meta=series._meta
+    )
+
+
+def last(series: dx.Series) -> dx.Series:
+    """Get the last value of `series`, or null if it's empty."""
+    return series.reduction(
+        chunk=_tail, combine=_tail, aggregate=_last_value, meta=series._meta
+    )
+
+
+def _rank_counts(
+    partition: pd.Series[Any],
+    *,
+    ordinal: bool,
+    partition_info: dict[str, Any] | None = None,
+) -> pd.DataFrame:
+    """Count each distinct value of `partition`.
+
+    Rows with `partition=-1` hold the total count of a value. Ordinal ranks also
+    need a row per partition and value, which holds how often the value occurred
+    in the partitions before it (none, so far) and the `position` of its total.
+    """
+    import numpy as np  # ignore-banned-import
+    import pandas as pd
+
+    counts = partition.value_counts(sort=False, dropna=True)
+    counts = counts[counts > 0]
+    totals = pd.DataFrame(
+        {
+            "value": counts.index,
+            "count": counts.to_numpy(),
+            "partition": -1,
+            "position": -1,
+        }
+    )
+    if not ordinal:
+        return totals
+    number = partition_info["number"] if partition_info else 0
+    rows = totals.assign(count=0, partition=number, position=np.arange(len(totals)))
+    return pd.concat([rows, totals])
+
+
+def _rank_combine(counts: pd.DataFrame) -> pd.DataFrame:
+    """Merge the counts of consecutive runs of partitions.
+
+    Each run lists its partitions' rows before its totals, so adding up the totals
+    run by run finds how often each row's value occurred in the runs before it.
+    Only the totals get hashed: rows find theirs by position.
+    """
+    import numpy as np  # ignore-banned-import
+    import pandas as pd
+
+    is_total = counts["partition"].to_numpy() == -1
+    starts = np.flatnonzero(is_total[:-1] & ~is_total[1:]) + 1
+    if not len(starts) and not is_total.all():
+        # A single partition's rows and totals, which are already merged.
+        return counts
+    codes, uniques = pd.factorize(counts["value"][is_total])
+    count = counts["count"].to_numpy(dtype="int64", copy=True)
+    position = counts["position"].to_numpy()
+    running = np.zeros(len(uniques), dtype="int64")
+    row_codes = np.zeros(len(counts), dtype="int64")
+    first_total = 0
+    for start, end in zip((0, *starts), (*starts, len(counts))):
+        total = is_total[start:end]
+        run = codes[first_total : first_total + total.sum()]
+        first_total += len(run)
+        rows = np.flatnonzero(~total) + start
+        row_codes[rows] = run[position[rows]]
+        count[rows] += running[row_codes[rows]]
+        added = np.bincount(run, count[start:end][total], len(uniques))
+        running += added.astype("int64")
+    rows = counts[~is_total].assign(count=count[~is_total], position=row_codes[~is_total])
+    totals = pd.DataFrame(
+        {"value": uniques, "count": running, "partition": -1, "position": -1}
+    )
+    return pd.concat([rows, totals]) if len(rows) else totals
+
+
+def _rank_starts(
+    counts: pd.DataFrame, method: RankMethod, *, descending: bool
+) -> tuple[pd.Series[Any], dict[int, pd.Series[Any]]]:
+    """Find the rank of each distinct value, and ordinal offsets per partition.
+
+    For `method="ordinal"`, a value's rank is that of its first occurrence, and
+    each partition gets how often its values occurred in earlier partitions.
+    """
+    import numpy as np  # ignore-banned-import
+    import pandas as pd
+
+    counts = _rank_combine(counts)
+    is_total = counts["partition"].to_numpy() == -1
+    totals = counts[is_total].set_index("value")["count"]
+    totals = totals.sort_index(ascending=not descending)
+    occurrences = totals.to_numpy(dtype="int64")
+    ends = occurrences.cumsum()
+    if method == "dense":
+        ranks = np.arange(1, len(occurrences) + 1)
+    elif method == "max":
+        ranks = ends
+    elif method == "average":
+        ranks = ends - (occurrences - 1) / 2
+    else:
+        ranks = ends - occurrences + 1
+    rows = counts[~is_total]
+    rows = rows[rows["count"].to_numpy() > 0]
+    offsets = {
+        number: group.set_index("value")["count"]
+        for number, group in rows.groupby("partition", sort=False)
+    }
+    return pd.Series(ranks, index=totals.index, dtype="float64"), offsets
+
+
+def _rank_lookup(
+    partition: pd.Series[Any],
+    starts: tuple[pd.Series[Any], Mapping[int, pd.Series[Any]]],
+    method: RankMethod,
+    partition_info: dict[str, Any] | None = None,
+) -> pd.Series[Any]:
+    import numpy as np  # ignore-banned-import
+    import pandas as pd
+
+    assert partition_info is not None  # noqa: S101
+    ranks_by_value, offsets = starts
+    # Look up each distinct value once, rather than every row.
+    codes, uniques = pd.factorize(partition)
+    ranks = ranks_by_value.reindex(uniques).to_numpy()
+    if method == "ordinal":
+        if (earlier := offsets.get(partition_info["number"])) is not None:
+            ranks = ranks + earlier.reindex(uniques, fill_value=0).to_numpy()
+        ties = pd.Series(codes).groupby(codes, sort=False).cumcount().to_numpy()
+        return pd.Series(
+            np.append(ranks, np.nan)[codes] + ties,
+            index=partition.index,
+            name=partition.name,
+        )
+    return pd.Series(
+        np.append(ranks, np.nan)[codes], index=partition.index, name=partition.name
+    )
+
+
+def rank(series: dx.Series, method: RankMethod, *, descending: bool) -> dx.Series:
+    """Rank `series` across all partitions, keeping nulls as null.
+
+    Rather than globally sorting the values, a tree reduction merges the counts of
+    each distinct value per partition, and the cumulative counts of the sorted
+    distinct values become their ranks. Ordinal ranks number ties in order of
+    appearance, so the reduction also carries how often each partition's values
+    occurred in the partitions before it. Each partition then looks its ranks up.
+    """
+    if method == "ordinal":
+        # Only partition-wise mapping knows which partition the counts come from.
+        meta = _rank_counts(series._meta, ordinal=True)
+        counts = series.map_partitions(_rank_counts, ordinal=True, meta=meta)
+        chunk, chunk_kwargs = _rank_combine, {}
+    else:
+        counts, chunk, chunk_kwargs = series, _rank_counts, {"ordinal": False}
+    starts = counts.reduction(
+        chunk=chunk,
+        chunk_kwargs=chunk_kwargs,
+        combine=_rank_combine,
+        aggregate=_rank_starts,
+        aggregate_kwargs={"method": method, "descending": descending},
+        meta=object,
+    )
+    return series.map_partitions(
+        _rank_lookup, starts, method, meta=(series.name, "float64")
+    )
+
+
+def rank_ordinal_over(
+    frame: dd.DataFrame,
+    partition_by: Sequence[str],
+    names: Sequence[str],
+    *,
+    descending: bool,
+) -> dd.DataFrame:
+    """Ordinal rank of each of `names` within the groups of `partition_by`.
+
+    Grouping shuffles the rows, so ties can't be numbered in the order the rows come
+    in. Instead, a row's rank is the minimum rank of its value in its group, plus the
+    number of rows with the same value before it (according to a row index).
+    """
+    token = generate_temporary_column_name(
+        n_bytes=8, columns=list(frame.columns), prefix="row_index_"
+    )
+    frame = add_row_index(frame, token)
+    group_by_kwargs = make_group_by_kwargs(drop_null_keys=False)
+    min_ranks = frame.groupby(list(partition_by), **group_by_kwargs)[
+        list(names)
+    ].transform("rank", method="min", ascending=not descending, na_option="keep")
+    tie_ranks = {
+        name: frame.groupby(
+            list(dict.fromkeys([*partition_by, name])), **group_by_kwargs
+        )[token].transform("rank", method="min")
+        for name in names
+    }
+    return min_ranks.assign(
+        **{name: min_ranks[name] + tie_ranks[name] - 1 for name in names}
+    )
+
+
+CumulativeMethod = Literal["cumsum", "cumprod", "cummin", "cummax"]
+
+_CUMULATIVE_TOTALS: Mapping[CumulativeMethod, str] = {
+    "cumsum": "sum",
+    "cumprod": "prod",
+    "cummin": "min",
+    "cummax": "max",
+}
+
+
+def _cumulative_total(
+    partition: pd.Series[Any], method: CumulativeMethod
+) -> pd.DataFrame:
+    import pandas as pd
+
+    total = getattr(partition, _CUMULATIVE_TOTALS[method])()
+    return pd.DataFrame({"total": [total]}, dtype=object)
+
+
+def _reverse_cumulative_offsets(
+    totals: pd.DataFrame, method: CumulativeMethod
+) -> list[Any]:
+    """Scan the partition totals from the end.
+
+    Each partition gets the total of all the partitions after it, or `None` if
+    those are all empty or null.
+    """
+    import pandas as pd
+
+    combine = {
+        "cumsum": operator.add,
+        "cumprod": operator.mul,
+        "cummin": min,
+        "cummax": max,
+    }[method]
+    offsets: list[Any] = []
+    running = None
+    for total in reversed(totals["total"].tolist()):
+        offsets.append(running)
+        if not pd.isna(total):
+            running = total if running is None else combine(running, total)
+    return offsets[::-1]
+
+
+def _reverse_cumulative_partition(
+    partition: pd.Series[Any],
+    offsets: list[Any],
+    method: CumulativeMethod,
+    partition_info: dict[str, Any] | None = None,
+) -> pd.Series[Any]:
+    assert partition_info is not None  # noqa: S101
+    result = getattr(partition.iloc[::-1], method)().iloc[::-1]
+    offset = offsets[partition_info["number"]]
+    if offset is None:
+        return result
+    if method == "cumsum":
+        combined = result + offset
+    elif method == "cumprod":
+        combined = result * offset
+    elif method == "cummin":
+        combined = result.where(result.isna() | (result <= offset), offset)
+    else:
+        combined = result.where(result.isna() | (result >= offset), offset)
+    return combined.astype(result.dtype)
+
+
+def reverse_cumulative(series: dx.Series, method: CumulativeMethod) -> dx.Series:
+    """Compute a cumulative operation from the end of `series`, skipping nulls.
+
+    Each partition is scanned locally in reverse, then combined with the total of all
+    the partitions after it, which a small reduction over the partition totals finds.
+    """
+    offsets = series.reduction(
+        chunk=_cumulative_total,
+        chunk_kwargs={"method": method},
+        aggregate=_reverse_cumulative_offsets,
+        aggregate_kwargs={"method": method},
+        meta=object,
+        split_every=False,
+    )
+    return series.map_partitions(
+        _reverse_cumulative_partition, offsets, method, meta=series._meta
+    )
@@ -0,0 +1,146 @@
+"""Tools for inferring the format of datetime strings."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+__all__ = ["SAMPLE_SIZE", "infer_datetime_format"]
+
+SAMPLE_SIZE = 10
+"""Default number of non-null values from which a format is inferred."""
+
+# Regex for date, time, separator and timezone components
+DATE_RE = r"(?P<date>\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}|\d{8})"
+SEP_RE = r"(?P<sep>\s|T)"
+TIME_RE = r"(?P<time>\d{2}:\d{2}(?::\d{2})?|\d{6}?)"  # \s*(?P<period>[AP]M)?)?
+HMS_RE = r"^(?P<hms>\d{2}:\d{2}:\d{2})$"
+HM_RE = r"^(?P<hm>\d{2}:\d{2})$"
+HMS_RE_NO_SEP = r"^(?P<hms_no_sep>\d{6})$"
+TZ_RE = r"(?P<tz>Z|[+-]\d{2}:?\d{2})"  # Matches 'Z', '+02:00', '+0200', '+02', etc.
+FULL_RE = rf"{DATE_RE}{SEP_RE}?{TIME_RE}?{TZ_RE}?$"
+
+# Separate regexes for different date formats
+YMD_RE = r"^(?P<year>(?:[12][0-9])?[0-9]{2})(?P<sep1>[-/.])(?P<month>0[1-9]|1[0-2])(?P<sep2>[-/.])(?P<day>0[1-9]|[12][0-9]|3[01])$"
+DMY_RE = r"^(?P<day>0[1-9]|[12][0-9]|3[01])(?P<sep1>[-/.])(?P<month>0[1-9]|1[0-2])(?P<sep2>[-/.])(?P<year>(?:[12][0-9])?[0-9]{2})$"
+MDY_RE = r"^(?P<month>0[1-9]|1[0-2])(?P<sep1>[-/.])(?P<day>0[1-9]|[12][0-9]|3[01])(?P<sep2>[-/.])(?P<year>(?:[12][0-9])?[0-9]{2})$"
+YMD_RE_NO_SEP = r"^(?P<year>(?:[12][0-9])?[0-9]{2})(?P<month>0[1-9]|1[0-2])(?P<day>0[1-9]|[12][0-9]|3[01])$"
+
+DATE_FORMATS = (
+    (YMD_RE_NO_SEP, "%Y%m%d"),
+    (YMD_RE, "%Y-%m-%d"),
+    (DMY_RE, "%d-%m-%Y"),
+    (MDY_RE, "%m-%d-%Y"),
+)
+SEPS = ("sep1", "sep2")
+TIME_FORMATS = ((HMS_RE, "%H:%M:%S"), (HM_RE, "%H:%M"), (HMS_RE_NO_SEP, "%H%M%S"))
+
+PATTERN_FULL: re.Pattern[str] = re.compile(FULL_RE)
+
+
+def infer_datetime_format(sample: Iterable[str]) -> str:
+    """Infer a `strptime` format which parses all the (non-null) strings in `sample`.
+
+    Backends pass the first few non-null values of a column, or more of them to
+    check the format against a larger sample. Results are cached on the distinct
+    shapes of the sample (see `_canonical`), so that repeated conversions of similar
+    data skip inference even when the values themselves differ.
+    """
+    return _infer_datetime_format(tuple(sorted({_canonical(value) for value in sample})))
+
+
+def _canonical(value: str) -> str:
+    """Replace the digits of `value` by a representative which infers the same format.
+
+    Inference only depends on how many digits there are between separators, on
+    whether each pair of digits could be a month, a day or the start of a year, and
+    on the time zone offset. For example, `"2024-05-17 13:45"` becomes
+    `"1313-01-13 13:32"`.
+    """
+    tz = _TZ_OFFSET.search(value)
+    end = tz.start() if tz else len(value)
+    return _DIGITS.sub(_canonical_digits, value[:end]) + value[end:]
+
+
+def _canonical_digits(match: re.Match[str]) -> str:
+    digits = match[0]
+    if len(digits) % 2:
+        # Fields are only recognised with two or four digits, so odd runs never
+        # split into them: keep them as they are.
+        return digits
+    return "".join(_PAIRS[digits[i : i + 2]] for i in range(0, len(digits), 2))
+
+
+def _pair_class(number: int) -> str:
+    # Bounds of the ranges in `DATE_FORMATS`: months are 01-12, days 01-31, and
+    # four-digit years start with 10-29.
+    bounds = (0, 1, 10, 13, 30, 32)
+    return f"{max(bound for bound in bounds if bound <= number):02d}"
+
+
+_DIGITS = re.compile(r"[0-9]+")
+_TZ_OFFSET = re.compile(r"[+-]\d{2}:?\d{2}$")
+_PAIRS = {f"{number:02d}": _pair_class(number) for number in range(100)}
+
+
+@lru_cache(maxsize=128)
+def _infer_datetime_format(sample: tuple[str, ...]) -> str:
+    if not sample:
+        # There is nothing to parse, any format will do.
+        return "%Y-%m-%dT%H:%M:%S"
+    matches = [PATTERN_FULL.search(value) for value in sample]
+    if not all(matches):
+        msg = (
+            "Unable to infer datetime format, provided format is not supported. "
+            "Please report a bug to https://github.com/narwhals-dev/narwhals/issues"
+        )
+        raise NotImplementedError(msg)
+
+    def field(name: str) -> list[str]:
+        return [match[name] or "" for match in matches if match is not None]
+
+    separators, tz = field("sep"), field("tz")
+
+    # separators and time zones must be unique
+    if len(set(separators)) > 1:
+        msg = "Found multiple separator values while inferring datetime format."
+        raise ValueError(msg)
+
+    if len(set(tz)) > 1:
+        msg = "Found multiple timezone values while inferring datetime format."
+        raise ValueError(msg)
+
+    date_value = _parse_date_format(field("date"))
+    time_value = _parse_time_format(field("time"))
+    tz_value = "%z" if tz[0] else ""
+
+    return f"{date_value}{separators[0]}{time_value}{tz_value}"
+
+
+def _parse_date_format(dates: Sequence[str]) -> str:
+    for date_rgx, date_fmt in DATE_FORMATS:
+        matches = [re.search(date_rgx, date) for date in dates]
+        if not all(matches):
+            continue
+        if date_fmt == "%Y%m%d":
+            return date_fmt
+        sep1, sep2 = ({m[name] for m in matches if m is not None} for name in SEPS)
+        if len(sep1) == 1 and sep1 == sep2:
+            return date_fmt.replace("-", sep1.pop())
+
+    msg = (
+        "Unable to infer datetime format. "
+        "Please report a bug to https://github.com/narwhals-dev/narwhals/issues"
+    )
+    raise ValueError(msg)
+
+
+def _parse_time_format(times: Sequence[str]) -> str:
+    for time_rgx, time_fmt in TIME_FORMATS:
+        if all(re.search(time_rgx, time) for time in times):
+            return time_fmt
+    return ""
@@ -12,9 +12,11 @@ from narwhals._duckdb.utils import (
     F,
     catch_duckdb_exception,
     col,
+    duckdb_dtypes,
     evaluate_exprs_and_aliases,
     join_column_names,
     lit,
+    narwhals_to_native_dtype,
     native_to_narwhals_dtype,
     window_expression,
 )
@@ -48,13 +50,17 @@ if TYPE_CHECKING:
     from narwhals._duckdb.group_by import DuckDBGroupBy
     from narwhals._duckdb.namespace import DuckDBNamespace
     from narwhals._duckdb.series import DuckDBInterchangeSeries
-    from narwhals._duckdb.utils import duckdb_dtypes
     from narwhals._typing import _EagerAllowedImpl
     from narwhals._utils import _LimitedContext
     from narwhals.dataframe import LazyFrame
     from narwhals.dtypes import DType
     from narwhals.stable.v1 import DataFrame as DataFrameV1
-    from narwhals.typing import AsofJoinStrategy, JoinStrategy, UniqueKeepStrategy
+    from narwhals.typing import (
+        AsofJoinStrategy,
+        IntoDType,
+        JoinStrategy,
+        UniqueKeepStrategy,
+    )
 
 
 class DuckDBLazyFrame(
@@ -78,6 +84,7 @@ class DuckDBLazyFrame(
         self._version = version
         self._cached_native_schema: dict[str, duckdb_dtypes.DuckDBPyType] | None = None
         self._cached_columns: list[str] | None = None
+        self._partial_schema: dict[str, duckdb_dtypes.DuckDBPyType | None] | None = None
         if validate_backend_version:
             self._validate_backend_version()
 
@@ -170,33 +177,43 @@ class DuckDBLazyFrame(
         raise ValueError(msg)  # pragma: no cover
 
     def head(self, n: int) -> Self:
-        return self._with_native(self.native.limit(n))
+        return self._with_native(self.native.limit(n))._with_schema(self._known_schema())
 
     def simple_select(self, *column_names: str) -> Self:
-        return self._with_native(self.native.select(*column_names))
+        schema = self._known_schema()
+        return self._with_native(self.native.select(*column_names))._with_schema(
+            {name: schema[name] for name in column_names}
+        )
 
     def aggregate(self, *exprs: DuckDBExpr) -> Self:
         selection = [
             val.alias(name) for name, val in evaluate_exprs_and_aliases(self, *exprs)
         ]
         try:
-            return self._with_native(self.native.aggregate(selection))  # type: ignore[arg-type]
+            result = self._with_native(self.native.aggregate(selection))  # type: ignore[arg-type]
         except Exception as e:  # noqa: BLE001
             raise catch_duckdb_exception(e, self) from None
+        return result._with_schema(self._infer_schema(exprs))
 
     def select(self, *exprs: DuckDBExpr) -> Self:
         selection = (
             val.alias(name) for name, val in evaluate_exprs_and_aliases(self, *exprs)
         )
         try:
-            return self._with_native(self.native.select(*selection))
+            result = self._with_native(self.native.select(*selection))
         except Exception as e:  # noqa: BLE001
             raise catch_duckdb_exception(e, self) from None
+        return result._with_schema(self._infer_schema(exprs))
 
     def drop(self, columns: Sequence[str], *, strict: bool) -> Self:
         columns_to_drop = parse_columns_to_drop(self, columns, strict=strict)
-        selection = [col(name) for name in self.columns if name not in columns_to_drop]
-        return self._with_native(self.native.select(*selection))
+        schema = {
+            name: dtype
+            for name, dtype in self._known_schema().items()
+            if name not in columns_to_drop
+        }
+        selection = [col(name) for name in schema]
+        return self._with_native(self.native.select(*selection))._with_schema(schema)
 
     def lazy(self, backend: None = None, **_: None) -> Self:
         # The `backend`` argument has no effect but we keep it here for
@@ -218,45 +235,74 @@ class DuckDBLazyFrame(
         ]
         result.extend(value.alias(name) for name, value in new_columns_map.items())
         try:
-            return self._with_native(self.native.select(*result))
+            df = self._with_native(self.native.select(*result))
         except Exception as e:  # noqa: BLE001
             raise catch_duckdb_exception(e, self) from None
+        if (new_schema := self._infer_schema(exprs)) is None:
+            return df
+        return df._with_schema({**self._known_schema(), **new_schema})
 
     def filter(self, predicate: DuckDBExpr) -> Self:
         # `[0]` is safe as the predicate's expression only returns a single column
         mask = predicate(self)[0]
         try:
-            return self._with_native(self.native.filter(mask))
+            result = self._with_native(self.native.filter(mask))
         except Exception as e:
             raise catch_duckdb_exception(e, self) from e
+        return result._with_schema(self._known_schema())
 
     @property
-    def schema(self) -> dict[str, DType]:
+    def _native_schema(self) -> dict[str, duckdb_dtypes.DuckDBPyType]:
         if self._cached_native_schema is None:
             # Note: prefer `self._cached_native_schema` over `functools.cached_property`
             # due to Python3.13 failures.
-            self._cached_native_schema = dict(zip(self.columns, self.native.types))
+            partial = self._partial_schema
+            self._cached_native_schema = (
+                partial  # type: ignore[assignment]
+                if partial is not None
+                and all(dtype is not None for dtype in partial.values())
+                else dict(zip_strict(self.native.columns, self.native.types))
+            )
+        return self._cached_native_schema
 
+    @property
+    def schema(self) -> dict[str, DType]:
+        # Native dtypes get converted every time, as the connection's time zone may
+        # have changed since - see `DeferredTimeZone`.
         deferred_time_zone = DeferredTimeZone(self.native)
         return {
             column_name: native_to_narwhals_dtype(
                 duckdb_dtype, self._version, deferred_time_zone
             )
-            for column_name, duckdb_dtype in zip_strict(
-                self.native.columns, self.native.types
-            )
+            for column_name, duckdb_dtype in self._native_schema.items()
         }
 
     @property
     def columns(self) -> list[str]:
         if self._cached_columns is None:
             self._cached_columns = (
-                list(self.schema)
+                list(self._cached_native_schema)
                 if self._cached_native_schema is not None
                 else self.native.columns
             )
         return self._cached_columns
 
+    @property
+    def _boolean_dtype(self) -> duckdb_dtypes.DuckDBPyType:
+        return duckdb_dtypes.BOOLEAN
+
+    def _cast_dtype(self, dtype: IntoDType, /) -> duckdb_dtypes.DuckDBPyType:
+        return narwhals_to_native_dtype(
+            dtype, self._version, DeferredTimeZone(self.native)
+        )
+
+    def _known_schema(self) -> Mapping[str, duckdb_dtypes.DuckDBPyType | None]:
+        # Native dtypes are known without a round-trip, so there's no need to
+        # defer resolving them.
+        if self._cached_native_schema is None and self._partial_schema is not None:
+            return self._partial_schema
+        return self._native_schema
+
     def to_pandas(self) -> pd.DataFrame:
         # only if version is v1, keep around for backcompat
         return self.native.df()
@@ -279,12 +325,14 @@ class DuckDBLazyFrame(
         return DuckDBGroupBy(self, keys, drop_null_keys=drop_null_keys)
 
     def rename(self, mapping: Mapping[str, str]) -> Self:
-        df = self.native
+        schema = self._known_schema()
         selection = (
             col(name).alias(mapping[name]) if name in mapping else col(name)
-            for name in df.columns
+            for name in schema
+        )
+        return self._with_native(self.native.select(*selection))._with_schema(
+            {mapping.get(name, name): dtype for name, dtype in schema.items()}
         )
-        return self._with_native(self.native.select(*selection))
 
     def join(
         self,
@@ -318,23 +366,27 @@ class DuckDBLazyFrame(
                 how=native_how,
             )
 
+        schema = dict(self._known_schema())
         if native_how in {"inner", "left", "cross", "outer"}:
             select = [col(f'lhs."{x}"') for x in self.columns]
-            for name in other.columns:
+            for name, dtype in other._known_schema().items():
                 col_in_lhs: bool = name in self.columns
                 if native_how == "outer" and not col_in_lhs:
                     select.append(col(f'rhs."{name}"'))
+                    schema[name] = dtype
                 elif (native_how == "outer") or (
                     col_in_lhs and (right_on is None or name not in right_on)
                 ):
                     select.append(col(f'rhs."{name}"').alias(f"{name}{suffix}"))
+                    schema[f"{name}{suffix}"] = dtype
                 elif right_on is None or name not in right_on:
                     select.append(col(name))
+                    schema[name] = dtype
             res = rel.select(*select).set_alias(self.native.alias)
         else:  # semi, anti
             res = rel.select("lhs.*").set_alias(self.native.alias)
 
-        return self._with_native(res)
+        return self._with_native(res)._with_schema(schema)
 
     def join_asof(
         self,
@@ -414,11 +466,16 @@ class DuckDBLazyFrame(
                 descending=flags,
                 nulls_last=flags,
             )
-        return self._with_native(
-            self.native.select(StarExpression(), expr.alias(tmp_name)).filter(
-                col(tmp_name) == lit(1)
+        schema = self._known_schema()
+        return (
+            self._with_native(
+                self.native.select(StarExpression(), expr.alias(tmp_name)).filter(
+                    col(tmp_name) == lit(1)
+                )
             )
-        ).drop([tmp_name], strict=False)
+            ._with_schema({**schema, tmp_name: None})
+            .drop([tmp_name], strict=False)
+        )
 
     def sort(self, *by: str, descending: bool | Sequence[bool], nulls_last: bool) -> Self:
         descending = extend_bool(descending, len(by))
@@ -432,7 +489,7 @@ class DuckDBLazyFrame(
                 col(name).nulls_first() if not desc else col(name).desc().nulls_first()
                 for name, desc in zip_strict(by, descending)
             )
-        return self._with_native(self.native.sort(*it))
+        return self._with_native(self.native.sort(*it))._with_schema(self._known_schema())
 
     def top_k(self, k: int, *, by: Iterable[str], reverse: bool | Sequence[bool]) -> Self:
         _rel = self.native
@@ -453,12 +510,14 @@ class DuckDBLazyFrame(
             FROM _rel
             QUALIFY {condition}
         """  # noqa: S608
-        return self._with_native(duckdb.sql(query))
+        return self._with_native(duckdb.sql(query))._with_schema(self._known_schema())
 
     def drop_nulls(self, subset: Sequence[str] | None) -> Self:
         subset_ = subset if subset is not None else self.columns
         keep_condition = reduce(and_, (col(name).isnotnull() for name in subset_))
-        return self._with_native(self.native.filter(keep_condition))
+        return self._with_native(self.native.filter(keep_condition))._with_schema(
+            self._known_schema()
+        )
 
     def explode(self, columns: Sequence[str]) -> Self:
         dtypes = self._version.dtypes
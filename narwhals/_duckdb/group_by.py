@@ -34,6 +34,8 @@ class DuckDBGroupBy(SQLGroupBy["DuckDBLazyFrame", "DuckDBExpr", "Expression"]):
             join_column_names(*self._keys),
         )
 
-        return self.compliant._with_native(result).rename(
-            dict(zip(self._keys, self._output_key_names))
+        return (
+            self.compliant._with_native(result)
+            ._with_schema(self._output_schema(exprs))
+            .rename(dict(zip(self._keys, self._output_key_names)))
         )
@@ -4,8 +4,12 @@
 # ! Any change to this module will trigger the pyspark and pyspark-connect tests in CI
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import Decimal
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Any, Callable, Literal, cast
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Literal, NamedTuple, TypeVar, cast
 
 from narwhals._utils import zip_strict
 from narwhals.dependencies import is_numpy_array_1d
@@ -16,7 +20,7 @@ from narwhals.exceptions import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Hashable, Iterator, Sequence
 
     from typing_extensions import Never, TypeIs
 
@@ -32,6 +36,11 @@ if TYPE_CHECKING:
     from narwhals.series import Series
     from narwhals.typing import IntoExpr, NonNestedLiteral, _1DArray
 
+    CSEMemo = dict[Any, CompliantExprAny]
+    """Compliant expressions built so far in a single call, keyed by structural key."""
+
+T = TypeVar("T")
+
 
 def is_expr(obj: Any) -> TypeIs[Expr]:
     """Check whether `obj` is a Narwhals Expr."""
@@ -176,6 +185,17 @@ class ExprKind(Enum):
             ExprKind.ORDERABLE_AGGREGATION,
         }
 
+    @property
+    def is_selection(self) -> bool:
+        # Any operation which selects existing columns, without modifying them.
+        return self in {
+            ExprKind.ALL,
+            ExprKind.COL,
+            ExprKind.EXCLUDE,
+            ExprKind.NTH,
+            ExprKind.SELECTOR,
+        }
+
 
 def is_scalar_like(obj: CompliantExprAny) -> bool:
     return obj._metadata.is_scalar_like
@@ -266,11 +286,44 @@ class ExprNode:
             "allow_multi_output": self.allow_multi_output,
         }
 
+    def structural_key(self, *, by_identity: bool = True) -> Hashable:
+        """Hashable key which is equal for structurally identical nodes.
+
+        Arguments:
+            by_identity: Whether to key unhashable arguments (e.g. Series) and
+                functions by their `id`. Such keys are only valid while the node is
+                alive - if `False`, a `TypeError` is raised instead.
+
+        Note that this isn't cached, as `exprs` may be updated in-place when
+        pushing down `over` nodes.
+        """
+        return (
+            self.kind,
+            self.name,
+            tuple(_structural_key(expr, by_identity=by_identity) for expr in self.exprs),
+            tuple(
+                (key, _structural_key(value, by_identity=by_identity))
+                for key, value in self.kwargs.items()
+            ),
+            self.str_as_lit,
+            self.allow_multi_output,
+        )
+
     def _with_kwargs(self, **kwargs: Any) -> ExprNode:
         return self.__class__(
             self.kind, self.name, *self.exprs, str_as_lit=self.str_as_lit, **kwargs
         )
 
+    def _with_exprs(self, *exprs: IntoExpr | NonNestedLiteral) -> ExprNode:
+        return self.__class__(
+            self.kind,
+            self.name,
+            *exprs,
+            str_as_lit=self.str_as_lit,
+            allow_multi_output=self.allow_multi_output,
+            **self.kwargs,
+        )
+
     def _push_down_over_node_in_place(
         self, over_node: ExprNode, over_node_without_order_by: ExprNode
     ) -> None:
@@ -328,6 +381,38 @@ class ExprNode:
         return self._is_elementwise_cached
 
 
+def _structural_key(obj: Any, *, by_identity: bool = True) -> Hashable:
+    if is_expr(obj):
+        return (
+            "expr",
+            tuple(node.structural_key(by_identity=by_identity) for node in obj._nodes),
+        )
+    if isinstance(obj, (list, tuple)):
+        return (
+            type(obj),
+            tuple(_structural_key(x, by_identity=by_identity) for x in obj),
+        )
+    if isinstance(obj, (float, complex, Decimal)):
+        # Equal values can still behave differently, e.g. `0.0` and `-0.0`, or
+        # `Decimal("1.0")` and `Decimal("1.00")`, so key them by their `repr`.
+        return (type(obj), repr(obj))
+    if not by_identity and callable(obj) and not isinstance(obj, type):
+        # e.g. user-defined functions, which keys mustn't keep alive.
+        msg = f"Can't key {obj!r} by value."
+        raise TypeError(msg)
+    try:
+        hash(obj)
+    except TypeError:
+        if not by_identity:
+            raise
+        # e.g. Series or NumPy arrays. Only equal to themselves, which is
+        # fine as they're kept alive by the expression while we use the key.
+        return ("id", id(obj))
+    # Include the type so that, e.g., `lit(1)` and `lit(True)` aren't conflated, and
+    # the time zone so that equal instants in different time zones aren't either.
+    return (type(obj), obj, getattr(obj, "tzinfo", None))
+
+
 class ExprMetadata:
     """Expression metadata.
 
@@ -822,32 +907,38 @@ def evaluate_into_exprs(
     ns: CompliantNamespaceAny,
     str_as_lit: bool,
     allow_multi_output: bool,
+    memo: CSEMemo | None = None,
 ) -> Iterator[CompliantExprAny]:
     for expr in exprs:
         ret = _parse_into_expr(
             expr, str_as_lit=str_as_lit, backend=ns._implementation
-        )._to_compliant_expr(ns)
+        )._to_compliant_expr(ns, memo)
         if not allow_multi_output and ret._metadata.expansion_kind.is_multi_output():
             msg = "Multi-output expressions are not allowed in this context."
             raise MultiOutputExpressionError(msg)
         yield ret
 
 
+def broadcast_ce(compliant_expr: CompliantExprAny) -> CompliantExprAny:
+    result: CompliantExprAny = compliant_expr.broadcast()
+    # Make sure to preserve metadata.
+    result._opt_metadata = compliant_expr._metadata
+    return result
+
+
 def maybe_broadcast_ces(*compliant_exprs: CompliantExprAny) -> list[CompliantExprAny]:
     broadcast = any(not is_scalar_like(ce) for ce in compliant_exprs)
-    results: list[CompliantExprAny] = []
-    for compliant_expr in compliant_exprs:
-        if broadcast and is_scalar_like(compliant_expr):
-            _compliant_expr: CompliantExprAny = compliant_expr.broadcast()
-            # Make sure to preserve metadata.
-            _compliant_expr._opt_metadata = compliant_expr._metadata
-            results.append(_compliant_expr)
-        else:
-            results.append(compliant_expr)
-    return results
+    return [
+        broadcast_ce(compliant_expr)
+        if broadcast and is_scalar_like(compliant_expr)
+        else compliant_expr
+        for compliant_expr in compliant_exprs
+    ]
 
 
-def evaluate_root_node(node: ExprNode, ns: CompliantNamespaceAny) -> CompliantExprAny:
+def evaluate_root_node(
+    node: ExprNode, ns: CompliantNamespaceAny, memo: CSEMemo | None = None
+) -> CompliantExprAny:
     if node.name in {"col", "exclude"}:
         # There's too much potential for Sequence[str] vs str bugs, so we pass down
         # `names` positionally rather than as a sequence of strings.
@@ -865,6 +956,7 @@ def evaluate_root_node(node: ExprNode, ns: CompliantNamespaceAny) -> CompliantEx
                 ns=ns,
                 str_as_lit=node.str_as_lit,
                 allow_multi_output=node.allow_multi_output,
+                memo=memo,
             )
         )
         ce = cast("CompliantExprAny", func(*ces, **node.kwargs))
@@ -874,7 +966,10 @@ def evaluate_root_node(node: ExprNode, ns: CompliantNamespaceAny) -> CompliantEx
 
 
 def evaluate_node(
-    compliant_expr: CompliantExprAny, node: ExprNode, ns: CompliantNamespaceAny
+    compliant_expr: CompliantExprAny,
+    node: ExprNode,
+    ns: CompliantNamespaceAny,
+    memo: CSEMemo | None = None,
 ) -> CompliantExprAny:
     md: ExprMetadata = compliant_expr._metadata
     compliant_expr, *compliant_expr_args = maybe_broadcast_ces(
@@ -884,6 +979,7 @@ def evaluate_node(
             ns=ns,
             str_as_lit=node.str_as_lit,
             allow_multi_output=node.allow_multi_output,
+            memo=memo,
         ),
     )
     md = md.with_node(node, compliant_expr, *compliant_expr_args)
@@ -898,9 +994,170 @@ def evaluate_node(
 
 
 def evaluate_nodes(
-    nodes: Sequence[ExprNode], ns: CompliantNamespaceAny
+    nodes: Sequence[ExprNode], ns: CompliantNamespaceAny, memo: CSEMemo | None = None
 ) -> CompliantExprAny:
-    ce = evaluate_root_node(nodes[0], ns)
-    for node in nodes[1:]:
-        ce = evaluate_node(ce, node, ns)
+    """Evaluate `nodes` into a compliant expression.
+
+    Arguments:
+        nodes: Nodes to evaluate, starting from the root.
+        ns: Compliant namespace.
+        memo: If passed, used to deduplicate structurally identical (sub)expressions
+            across all expressions which share it (e.g. those passed to a single
+            `with_columns` call). Reused compliant expressions are marked, so that
+            eager backends can compute them once per frame within
+            `common_subexpression_scope`.
+    """
+    if memo is None:
+        ce = evaluate_root_node(nodes[0], ns)
+        for node in nodes[1:]:
+            ce = evaluate_node(ce, node, ns)
+        return ce
+    key: Hashable = None
+    for i, node in enumerate(nodes):
+        key = (key, node.structural_key())
+        if (cached := memo.get(key)) is not None:
+            cached._is_common_subexpr = True
+            ce = cached
+            continue
+        ce = (
+            evaluate_root_node(node, ns, memo)
+            if i == 0
+            else evaluate_node(ce, node, ns, memo)
+        )
+        memo[key] = ce
     return ce
+
+
+_CSE_RESULTS: ContextVar[dict[tuple[Any, int], tuple[Any, Any, Any]] | None] = ContextVar(
+    "_CSE_RESULTS", default=None
+)
+
+
+@contextmanager
+def common_subexpression_scope() -> Iterator[None]:
+    """Cache results of common subexpressions for the duration of the block.
+
+    Results are keyed on both the compliant expression and the frame it's evaluated
+    on (e.g. `over` may evaluate an expression on different frames), and are dropped
+    as soon as the block exits so that intermediate results aren't kept alive.
+    """
+    token = _CSE_RESULTS.set({})
+    try:
+        yield
+    finally:
+        _CSE_RESULTS.reset(token)
+
+
+def is_common_subexpression_scope_active() -> bool:
+    return _CSE_RESULTS.get() is not None
+
+
+def evaluate_common_subexpr(
+    compliant_expr: CompliantExprAny,
+    df: CompliantFrameAny,
+    call: Callable[[CompliantFrameAny], Sequence[Any]],
+) -> Sequence[Any]:
+    if (results := _CSE_RESULTS.get()) is None:
+        return call(df)
+    key = (id(compliant_expr), id(df))
+    if (cached := results.get(key)) is not None:
+        return cached[2]
+    result = call(df)
+    # Keep `compliant_expr` and `df` alive, so their ids can't be reused in this scope.
+    results[key] = (compliant_expr, df, result)
+    return result
+
+
+def cache_in_scope(key: Hashable, df: CompliantFrameAny, compute: Callable[[], T]) -> T:
+    """Compute something derived from `df` (e.g. a grouping) at most once per scope.
+
+    Outside of `common_subexpression_scope`, this just calls `compute`.
+    """
+    if (results := _CSE_RESULTS.get()) is None:
+        return compute()
+    scoped_key = (key, id(df))
+    if (cached := results.get(scoped_key)) is not None:
+        return cast("T", cached[2])
+    result = compute()
+    results[scoped_key] = (key, df, result)
+    return result
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CompiledExprCache:
+    """Bounded LRU cache of compliant expressions.
+
+    Converting Narwhals expressions to compliant ones (`evaluate_nodes`) means building
+    all the `ExprMetadata` and closures again, even if the same expressions get applied
+    to many (small) frames. The compliant expressions don't depend on the frame they're
+    evaluated on (output names are only resolved at evaluation time), so we cache
+    them per implementation and version.
+
+    Expressions with arguments which can't be hashed (e.g. Series) are never cached,
+    as their key would only be valid for as long as those arguments are alive. Nor
+    are expressions holding functions (e.g. `map_batches`), which the cache would
+    otherwise keep alive for the lifetime of the process.
+    """
+
+    __slots__ = ("_cache", "_lock", "hits", "maxsize", "misses")
+
+    def __init__(self, maxsize: int) -> None:
+        self._cache: dict[Hashable, list[CompliantExprAny]] = {}
+        self._lock = Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(
+        self, exprs: Sequence[Expr], ns: CompliantNamespaceAny
+    ) -> list[CompliantExprAny]:
+        """Convert all of `exprs` (which are evaluated together) to compliant ones."""
+        try:
+            key = (
+                ns._implementation,
+                ns._version,
+                tuple(_structural_key(expr, by_identity=False) for expr in exprs),
+            )
+        except TypeError:
+            return _to_compliant_exprs(exprs, ns)
+        with self._lock:
+            if (cached := self._cache.pop(key, None)) is not None:
+                self.hits += 1
+                # Re-insert, so that the least-recently used entry is always first.
+                self._cache[key] = cached
+                return list(cached)
+            self.misses += 1
+        result = _to_compliant_exprs(exprs, ns)
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.maxsize:
+                del self._cache[next(iter(self._cache))]
+        return list(result)
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+
+def _to_compliant_exprs(
+    exprs: Sequence[Expr], ns: CompliantNamespaceAny
+) -> list[CompliantExprAny]:
+    # Shared across all expressions, so that common subexpressions are only
+    # evaluated once per frame.
+    memo: CSEMemo = {}
+    return [expr._to_compliant_expr(ns, memo) for expr in exprs]
+
+
+compile_exprs = CompiledExprCache(maxsize=256)
+"""Convert expressions evaluated together (e.g. in a single `select`) to compliant ones."""
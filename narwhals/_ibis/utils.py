@@ -274,6 +274,8 @@ def function(name: str, *args: ir.Value | PythonLiteral) -> ir.Value:
         return cast("ir.NumericColumn", expr).std(how="pop")
     if name == "stddev_samp":
         return cast("ir.NumericColumn", expr).std(how="sample")
+    if name == "quantile_cont":
+        return cast("ir.NumericColumn", expr).quantile(args[1])  # type: ignore[arg-type]
     if name == "substr":
         # Ibis is 0-indexed here, SQL is 1-indexed
         return cast("ir.StringColumn", expr).substr(args[1] - 1, *args[2:])  # type: ignore[operator]  # pyright: ignore[reportArgumentType]
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import partial
 from itertools import chain, product
 from typing import TYPE_CHECKING, Any, Callable, Literal, cast, overload
 
 import numpy as np
 
 from narwhals._compliant import EagerDataFrame
+from narwhals._expression_parsing import (
+    cache_in_scope,
+    is_common_subexpression_scope_active,
+)
+from narwhals._pandas_like.expr import iter_windows
 from narwhals._pandas_like.series import PANDAS_TO_NUMPY_DTYPE_MISSING, PandasLikeSeries
 from narwhals._pandas_like.utils import (
     align_and_extract_native,
     get_dtype_backend,
     import_array_module,
     iter_dtype_backends,
+    make_group_by_kwargs,
     narwhals_to_native_dtype,
     native_to_narwhals_dtype,
     object_native_to_narwhals_dtype,
@@ -26,7 +34,6 @@ from narwhals._utils import (
     _into_arrow_table,
     _remap_full_join_keys,
     check_column_names_are_unique,
-    exclude_column_names,
     generate_temporary_column_name,
     parse_columns_to_drop,
     scale_bytes,
@@ -46,7 +53,7 @@ if TYPE_CHECKING:
     from typing_extensions import Self, TypeAlias, TypeIs
 
     from narwhals._compliant.typing import CompliantDataFrameAny, CompliantLazyFrameAny
-    from narwhals._pandas_like.expr import PandasLikeExpr
+    from narwhals._pandas_like.expr import PandasLikeExpr, WindowKey
     from narwhals._pandas_like.group_by import PandasLikeGroupBy
     from narwhals._pandas_like.namespace import PandasLikeNamespace
     from narwhals._spark_like.utils import SparkSession
@@ -70,6 +77,9 @@ if TYPE_CHECKING:
     )
 
     Constructor: TypeAlias = Callable[..., pd.DataFrame]
+    # The frame to evaluate a window function on, grouped by its `partition_by`
+    # columns, and the indices to undo its `order_by` sort with (if any).
+    Window: TypeAlias = tuple["PandasLikeDataFrame", Any, "PandasLikeSeries | None"]
 
 
 CLASSICAL_NUMPY_DTYPES: frozenset[np.dtype[Any]] = frozenset(
@@ -113,6 +123,8 @@ class PandasLikeDataFrame(
         self._native_frame = native_dataframe
         self._implementation = implementation
         self._version = version
+        # The schema, along with the native columns and dtypes it was computed from.
+        self._cached_schema: tuple[dict[str, DType], Any, list[Any]] | None = None
         if validate_column_names:
             check_column_names_are_unique(native_dataframe.columns)
         if validate_backend_version:
@@ -304,6 +316,53 @@ class PandasLikeDataFrame(
             validate_column_names=validate_column_names,
         )
 
+    def _evaluate_exprs(self, *exprs: PandasLikeExpr) -> Sequence[PandasLikeSeries]:
+        if is_common_subexpression_scope_active():
+            # e.g. `nw.col('a').sum().over('k')` and `nw.col('b').cum_sum().over('k')`
+            # can share a single grouping, so long as it includes both 'a' and 'b'.
+            windows: defaultdict[WindowKey, set[str]] = defaultdict(set)
+            for expr in exprs:
+                if (md := expr._opt_metadata) is not None:
+                    nodes = reversed(tuple(md.iter_nodes_reversed()))
+                    for key, names in iter_windows(tuple(nodes)):
+                        windows[key].update(names)
+            for key, columns in windows.items():
+                self._shared_window(key, list(columns))
+        return super()._evaluate_exprs(*exprs)
+
+    def _shared_window(self, key: WindowKey, columns: Sequence[str]) -> Window:
+        """Prepare the window for `key`, at most once per frame-level operation."""
+        partition_by, order_by, reverse = key
+        compute = partial(
+            self._prepare_window, partition_by, order_by, reverse=reverse, columns=columns
+        )
+        return cache_in_scope(("window", key), self, compute)
+
+    def _prepare_window(
+        self,
+        partition_by: Sequence[str],
+        order_by: Sequence[str],
+        *,
+        reverse: bool,
+        columns: Sequence[str],
+    ) -> Window:
+        df, sorting_indices = self, None
+        if order_by:
+            columns = list(set(partition_by).union(columns).union(order_by))
+            token = generate_temporary_column_name(8, columns)
+            df = (
+                df.simple_select(*columns)
+                .with_row_index(token, order_by=None)
+                .sort(*order_by, descending=reverse, nulls_last=reverse)
+            )
+            sorting_indices = df.get_column(token)
+        elif reverse:
+            columns = list(set(partition_by).union(columns))
+            df = df.simple_select(*columns)._gather_slice(slice(None, None, -1))
+        group_by_kwargs = make_group_by_kwargs(drop_null_keys=False)
+        grouped = df.native.groupby(list(partition_by), **group_by_kwargs)
+        return df, grouped, sorting_indices
+
     def _extract_comparand(self, other: PandasLikeSeries) -> pd.Series[Any]:
         index = self.native.index
         if other._broadcast:
@@ -417,27 +476,60 @@ class PandasLikeDataFrame(
 
     @property
     def schema(self) -> dict[str, DType]:
-        native_dtypes = self.native.dtypes
+        if (schema := self._known_schema) is None:
+            schema = self._native_schema()
+            self._with_schema(schema)
+        return dict(schema)
+
+    @property
+    def _known_schema(self) -> dict[str, DType] | None:
+        """The cached schema, unless the native frame was mutated since it was cached."""
+        if self._cached_schema is None:
+            return None
+        schema, columns, dtypes = self._cached_schema
+        native = self.native
+        if native.columns.equals(columns) and native.dtypes.tolist() == dtypes:
+            return schema
+        return None
+
+    def _native_schema(self, names: Iterable[str] | None = None) -> dict[str, DType]:
+        """Convert the dtypes of `names` (or of all columns) to Narwhals dtypes.
+
+        Object columns are inferred from their values, so this isn't cheap for wide
+        frames - hence the cached `schema`, which the methods that only add, remove,
+        or rename columns derive from their parent's (when it's known).
+        """
+        native = self.native
+        version, implementation = self._version, self._implementation
+        items = (
+            native.dtypes.items()
+            if names is None
+            else ((name, native[name].dtype) for name in names)
+        )
         return {
-            col: native_to_narwhals_dtype(
-                native_dtypes[col], self._version, self._implementation
-            )
-            if native_dtypes[col] != "object"
-            else object_native_to_narwhals_dtype(
-                self.native[col], self._version, self._implementation
-            )
-            for col in self.native.columns
+            name: native_to_narwhals_dtype(dtype, version, implementation)
+            if dtype != "object"
+            else object_native_to_narwhals_dtype(native[name], version, implementation)
+            for name, dtype in items
         }
 
+    def _with_schema(self, schema: dict[str, DType]) -> Self:
+        native = self.native
+        self._cached_schema = (schema, native.columns, native.dtypes.tolist())
+        return self
+
     def collect_schema(self) -> dict[str, DType]:
         return self.schema
 
     # --- reshape ---
     def simple_select(self, *column_names: str) -> Self:
-        return self._with_native(
+        result = self._with_native(
             select_columns_by_name(self.native, list(column_names), self._implementation),
             validate_column_names=False,
         )
+        if (schema := self._known_schema) is None:
+            return result
+        return result._with_schema({name: schema[name] for name in column_names})
 
     def select(self, *exprs: PandasLikeExpr) -> Self:
         new_series = self._evaluate_exprs(*exprs)
@@ -449,7 +541,26 @@ class PandasLikeDataFrame(
         df = namespace._concat_horizontal([s.native for s in new_series])
         # `concat` creates a new object, so fine to modify `.columns.name` inplace.
         df.columns.name = self.native.columns.name
-        return self._with_native(df, validate_column_names=True)
+        result = self._with_native(df, validate_column_names=True)
+        if (schema := self._known_schema) is None:
+            return result
+        # Columns which are selected as-is keep their dtypes.
+        unchanged = {
+            name
+            for expr in exprs
+            if (md := expr._opt_metadata) is not None
+            and md.prev is None
+            and md.current_node.kind.is_selection
+            for name in expr._evaluate_output_names(self)
+        }
+        changed = [s.name for s in new_series if s.name not in unchanged]
+        new_schema = result._native_schema(changed)
+        return result._with_schema(
+            {
+                s.name: schema[s.name] if s.name in unchanged else new_schema[s.name]
+                for s in new_series
+            }
+        )
 
     def drop_nulls(self, subset: Sequence[str] | None) -> Self:
         if subset is None:
@@ -512,18 +623,34 @@ class PandasLikeDataFrame(
         df = namespace._concat_horizontal(to_concat)
         # `concat` creates a new object, so fine to modify `.columns.name` inplace.
         df.columns.name = self.native.columns.name
-        return self._with_native(df, validate_column_names=False)
+        result = self._with_native(df, validate_column_names=False)
+        if (schema := self._known_schema) is None:
+            return result
+        return result._with_schema(
+            {**schema, **result._native_schema(s.name for s in columns)}
+        )
 
     def rename(self, mapping: Mapping[str, str]) -> Self:
-        return self._with_native(
+        result = self._with_native(
             rename(self.native, columns=mapping, implementation=self._implementation)
         )
+        if (schema := self._known_schema) is None:
+            return result
+        return result._with_schema(
+            {mapping.get(name, name): dtype for name, dtype in schema.items()}
+        )
 
     def drop(self, columns: Sequence[str], *, strict: bool) -> Self:
         to_drop = parse_columns_to_drop(self, columns, strict=strict)
-        return self._with_native(
+        result = self._with_native(
             self.native.drop(columns=to_drop), validate_column_names=False
         )
+        if (schema := self._known_schema) is None:
+            return result
+        dropped = set(to_drop)
+        return result._with_schema(
+            {name: dtype for name, dtype in schema.items() if name not in dropped}
+        )
 
     # --- transform ---
     def sort(self, *by: str, descending: bool | Sequence[bool], nulls_last: bool) -> Self:
@@ -1033,64 +1160,6 @@ class PandasLikeDataFrame(
     def gather_every(self, n: int, offset: int) -> Self:
         return self._with_native(self.native.iloc[offset::n], validate_column_names=False)
 
-    def _pivot_into_index_values(
-        self,
-        on: Sequence[str],
-        index: Sequence[str] | None,
-        values: Sequence[str] | None,
-        /,
-    ) -> tuple[Sequence[str], Sequence[str]]:
-        index = index or (
-            exclude_column_names(self, {*on, *values})
-            if values
-            else exclude_column_names(self, on)
-        )
-        values = values or exclude_column_names(self, {*on, *index})
-        return index, values
-
-    @staticmethod
-    def _pivot_multi_on_name(unique_values: tuple[str, ...], /) -> str:
-        LB, RB, Q = "{", "}", '"'  # noqa: N806
-        body = '","'.join(unique_values)
-        return f"{LB}{Q}{body}{Q}{RB}"
-
-    @staticmethod
-    def _pivot_single_on_names(
-        column_names: Iterable[str], n_values: int, separator: str, /
-    ) -> list[str]:
-        if n_values > 1:
-            return [separator.join(col).strip() for col in column_names]
-        return [col[-1] for col in column_names]
-
-    def _pivot_multi_on_names(
-        self,
-        column_names: Iterable[tuple[str, ...]],
-        n_on: int,
-        n_values: int,
-        separator: str,
-        /,
-    ) -> Iterator[str]:
-        if n_values > 1:
-            for col in column_names:
-                names = col[-n_on:]
-                prefix = col[0]
-                yield separator.join((prefix, self._pivot_multi_on_name(names)))
-        else:
-            for col in column_names:
-                yield self._pivot_multi_on_name(col[-n_on:])
-
-    def _pivot_remap_column_names(
-        self, column_names: Iterable[Any], *, n_on: int, n_values: int, separator: str
-    ) -> list[str]:
-        """Reformat output column names from a native pivot operation, to match `polars`.
-
-        Note:
-            `column_names` is a `pd.MultiIndex`, but not in the stubs.
-        """
-        if n_on == 1:
-            return self._pivot_single_on_names(column_names, n_values, separator)
-        return list(self._pivot_multi_on_names(column_names, n_on, n_values, separator))
-
     def _pivot_table(
         self,
         on: Sequence[str],
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import math
+import os
 import warnings
 from typing import TYPE_CHECKING, Any, cast
 
 from narwhals._compliant import EagerExpr
-from narwhals._expression_parsing import evaluate_nodes, evaluate_output_names_and_aliases
+from narwhals._expression_parsing import (
+    ExprKind,
+    evaluate_common_subexpr,
+    evaluate_nodes,
+    evaluate_output_names_and_aliases,
+    is_expr,
+)
 from narwhals._pandas_like.group_by import _REMAP_ORDERED_INDEX, PandasLikeGroupBy
 from narwhals._pandas_like.series import PandasLikeSeries
-from narwhals._pandas_like.utils import make_group_by_kwargs
-from narwhals._utils import generate_temporary_column_name
+from narwhals._utils import Implementation, generate_temporary_column_name
+from narwhals.dependencies import get_numexpr
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
 
-    from typing_extensions import Self
+    from typing_extensions import Self, TypeAlias
 
     from narwhals._compliant.typing import (
         AliasNames,
@@ -21,11 +29,47 @@ if TYPE_CHECKING:
         EvalSeries,
         NarwhalsAggregation,
     )
+    from narwhals._expression_parsing import ExprNode
     from narwhals._pandas_like.dataframe import PandasLikeDataFrame
     from narwhals._pandas_like.namespace import PandasLikeNamespace
-    from narwhals._utils import Implementation, Version, _LimitedContext
+    from narwhals._utils import Version, _LimitedContext
     from narwhals.typing import PythonLiteral
 
+    # e.g. `(">", ("col", "a"), ("lit", 1))`
+    NumexprTree: TypeAlias = tuple[Any, ...]
+    # `(partition_by, order_by, reverse)`
+    WindowKey: TypeAlias = tuple[tuple[str, ...], tuple[str, ...], bool]
+
+NUMEXPR_ENV_VAR = "NARWHALS_USE_NUMEXPR"
+"""Set to `1` to opt into evaluating elementwise subexpressions with `numexpr`."""
+
+# Elementwise operations which can be fused into a single `numexpr` evaluation.
+_NUMEXPR_ARITHMETIC_OPS = {"__add__": "+", "__sub__": "-", "__mul__": "*"}
+_NUMEXPR_COMPARISON_OPS = {
+    "__eq__": "==",
+    "__ne__": "!=",
+    "__lt__": "<",
+    "__le__": "<=",
+    "__gt__": ">",
+    "__ge__": ">=",
+}
+_NUMEXPR_BOOLEAN_OPS = {"__and__": "&", "__or__": "|"}
+_NUMEXPR_BINARY_OPS = {
+    **_NUMEXPR_ARITHMETIC_OPS,
+    **_NUMEXPR_COMPARISON_OPS,
+    **_NUMEXPR_BOOLEAN_OPS,
+}
+_NUMEXPR_IS_BETWEEN_OPS = {
+    "left": (">=", "<"),
+    "right": (">", "<="),
+    "none": (">", "<"),
+    "both": (">=", "<="),
+}
+# Only NumPy dtypes for which `numexpr` gives the same results (and result dtypes)
+# as pandas, mapped to a kind: "b"ool, "i"nteger, or "f"loat.
+_NUMEXPR_DTYPE_KINDS = {"bool": "b", "int64": "i", "float64": "f"}
+_NUMEXPR_KIND_DTYPES = {"b": "bool", "i": "int64", "f": "float64"}
+
 WINDOW_FUNCTIONS_TO_PANDAS_EQUIVALENT = {
     "cum_sum": "cumsum",
     "cum_min": "cummin",
@@ -39,6 +83,10 @@ WINDOW_FUNCTIONS_TO_PANDAS_EQUIVALENT = {
     "rolling_mean": "mean",
     "rolling_std": "std",
     "rolling_var": "var",
+    "rolling_min": "min",
+    "rolling_max": "max",
+    "rolling_median": "median",
+    "rolling_quantile": "quantile",
     "shift": "shift",
     "rank": "rank",
     "diff": "diff",
@@ -125,6 +173,12 @@ def window_kwargs_to_pandas_equivalent(  # noqa: C901
 
 
 class PandasLikeExpr(EagerExpr["PandasLikeDataFrame", PandasLikeSeries]):
+    # Set by `PandasLikeNamespace` for expressions (such as `all_horizontal`) which
+    # don't get any metadata attached, but which can still be fused. Otherwise, it is
+    # computed (at most once) by `_to_numexpr_tree`.
+    _opt_numexpr_tree: NumexprTree | None = None
+    _is_fusable: bool | None = None
+
     def __init__(
         self,
         call: EvalSeries[PandasLikeDataFrame, PandasLikeSeries],
@@ -140,11 +194,82 @@ class PandasLikeExpr(EagerExpr["PandasLikeDataFrame", PandasLikeSeries]):
         self._implementation = implementation
         self._version = version
 
+    def __call__(self, df: PandasLikeDataFrame) -> Sequence[PandasLikeSeries]:
+        # Subexpressions are evaluated through here too, so e.g. the product in
+        # `(nw.col("a") * nw.col("b")).sum()` still gets fused.
+        if self._is_common_subexpr:
+            return evaluate_common_subexpr(self, df, self._call_fused)
+        return self._call_fused(df)
+
+    def _call_fused(self, df: PandasLikeDataFrame) -> Sequence[PandasLikeSeries]:
+        if (result := self._evaluate_numexpr(df)) is not None:
+            return [result]
+        return self._call(df)
+
     def __narwhals_namespace__(self) -> PandasLikeNamespace:
         from narwhals._pandas_like.namespace import PandasLikeNamespace
 
         return PandasLikeNamespace(self._implementation, version=self._version)
 
+    def _to_numexpr_tree(self) -> NumexprTree | None:
+        """Fuse this expression into a tree which can be rendered for `numexpr`, if possible.
+
+        This is only possible (for pandas) for single-output chains of arithmetic,
+        comparison, and boolean operations on columns and numeric literals. Whether
+        the tree can actually be evaluated with `numexpr` depends on the column
+        dtypes, and is checked in `_evaluate_numexpr`.
+        """
+        if self._opt_numexpr_tree is None and self._is_fusable is None:
+            self._opt_numexpr_tree = self._fuse()
+        self._is_fusable = self._opt_numexpr_tree is not None
+        return self._opt_numexpr_tree
+
+    def _fuse(self) -> NumexprTree | None:
+        if (
+            self._implementation is not Implementation.PANDAS
+            or (md := self._opt_metadata) is None
+            or not (
+                md.is_elementwise
+                and md.preserves_length
+                and not md.is_scalar_like
+                and not md.expansion_kind.is_multi_output()
+            )
+        ):
+            return None
+        nodes = tuple(reversed(tuple(md.iter_nodes_reversed())))
+        if all(_is_alias(node) for node in nodes[1:]):
+            return None
+        return _nodes_to_numexpr_tree(nodes)
+
+    def _evaluate_numexpr(self, df: PandasLikeDataFrame) -> PandasLikeSeries | None:
+        """Evaluate this expression with a single `numexpr` call, if possible.
+
+        Returns `None` unless opted into (by setting the `NARWHALS_USE_NUMEXPR`
+        environment variable to `1`), if `numexpr` isn't available (or is disabled
+        with pandas' `compute.use_numexpr` option), or if this expression (given the
+        dtypes in `df`) can't be fused.
+        """
+        if (
+            os.environ.get(NUMEXPR_ENV_VAR) != "1"
+            or (numexpr := get_numexpr()) is None
+            or (tree := self._to_numexpr_tree()) is None
+        ):
+            return None
+        ns = df.__native_namespace__()
+        if not ns.get_option("compute.use_numexpr"):
+            return None
+        variables: dict[str, str] = {}
+        if (rendered := _render_numexpr(tree, df.native, variables)) is None:
+            return None
+        expression, kind = rendered
+        local_dict = {var: df.native[name].to_numpy() for name, var in variables.items()}
+        result = numexpr.evaluate(expression, local_dict=local_dict)
+        if result.dtype != _NUMEXPR_KIND_DTYPES[kind]:  # pragma: no cover
+            return None
+        (name,) = self._evaluate_aliases(df)
+        native = ns.Series(result, index=df.native.index, name=name, copy=False)
+        return PandasLikeSeries.from_native(native, context=df)
+
     @classmethod
     def from_column_names(
         cls: type[Self],
@@ -291,11 +416,19 @@ class PandasLikeExpr(EagerExpr["PandasLikeDataFrame", PandasLikeSeries]):
             raise NotImplementedError(msg)
         scalar_kwargs = leaf_node.kwargs
         pandas_kwargs = window_kwargs_to_pandas_equivalent(function_name, scalar_kwargs)
+        if function_name.startswith("cum_"):
+            assert "reverse" in scalar_kwargs  # noqa: S101
+            reverse: bool = scalar_kwargs["reverse"]
+        else:
+            assert "reverse" not in scalar_kwargs  # noqa: S101
+            reverse = False
+        prev_is_column = _is_column(nodes[:-1])
+        window_key = _window_key(nodes, partition_by, order_by)
 
         def func(df: PandasLikeDataFrame) -> Sequence[PandasLikeSeries]:  # noqa: C901, PLR0912, PLR0914, PLR0915
             assert pandas_function_name is not None  # help mypy  # noqa: S101
             plx = self.__narwhals_namespace__()
-            if meta.prev is not None:
+            if meta.prev is not None and not prev_is_column:
                 df = df.with_columns(
                     cast("PandasLikeExpr", evaluate_nodes(nodes[:-1], plx))
                 )
@@ -303,27 +436,18 @@ class PandasLikeExpr(EagerExpr["PandasLikeDataFrame", PandasLikeSeries]):
             if function_name == "cum_count":
                 df = df.with_columns(~plx.col(*aliases).is_null())
 
-            if function_name.startswith("cum_"):
-                assert "reverse" in scalar_kwargs  # noqa: S101
-                reverse = scalar_kwargs["reverse"]
-            else:
-                assert "reverse" not in scalar_kwargs  # noqa: S101
-                reverse = False
-
-            if order_by:
-                columns = list(set(partition_by).union(aliases).union(order_by))
-                token = generate_temporary_column_name(8, columns)
-                df = (
-                    df.simple_select(*columns)
-                    .with_row_index(token, order_by=None)
-                    .sort(*order_by, descending=reverse, nulls_last=reverse)
+            window = None
+            if window_key is not None:
+                window = df._shared_window(window_key, aliases)
+                if not set(aliases).issubset(window[0].columns):
+                    # e.g. `nw.col('a').sum().over('k') - nw.col('b').sum().over('k')`,
+                    # where the shared window was only prepared for `'a'`.
+                    window = None
+            if window is None:
+                window = df._prepare_window(
+                    partition_by, order_by, reverse=reverse, columns=aliases
                 )
-                sorting_indices = df.get_column(token)
-            elif reverse:
-                columns = list(set(partition_by).union(aliases))
-                df = df.simple_select(*columns)._gather_slice(slice(None, None, -1))
-            group_by_kwargs = make_group_by_kwargs(drop_null_keys=False)
-            grouped = df._native_frame.groupby(partition_by, **group_by_kwargs)
+            df, grouped, sorting_indices = window
             if function_name.startswith("rolling"):
                 rolling = grouped[list(aliases)].rolling(**pandas_kwargs)
                 if pandas_function_name in {"std", "var"}:
@@ -331,6 +455,13 @@ class PandasLikeExpr(EagerExpr["PandasLikeDataFrame", PandasLikeSeries]):
                     res_native = getattr(rolling, pandas_function_name)(
                         ddof=scalar_kwargs["ddof"]
                     )
+                elif pandas_function_name == "quantile":
+                    assert "quantile" in scalar_kwargs  # noqa: S101
+                    assert "interpolation" in scalar_kwargs  # noqa: S101
+                    res_native = rolling.quantile(
+                        scalar_kwargs["quantile"],
+                        interpolation=scalar_kwargs["interpolation"],
+                    )
                 else:
                     res_native = getattr(rolling, pandas_function_name)()
             elif function_name.startswith("ewm"):
@@ -379,7 +510,7 @@ class PandasLikeExpr(EagerExpr["PandasLikeDataFrame", PandasLikeSeries]):
                 )
             result_frame = df._with_native(res_native)
             results = [result_frame.get_column(name) for name in aliases]
-            if order_by:
+            if sorting_indices is not None:
                 with warnings.catch_warnings():
                     # Ignore settingwithcopy warnings/errors, they're false-positives here.
                     warnings.filterwarnings("ignore", message="\n.*copy of a slice")
@@ -397,3 +528,130 @@ class PandasLikeExpr(EagerExpr["PandasLikeDataFrame", PandasLikeSeries]):
             implementation=self._implementation,
             version=self._version,
         )
+
+
+def _is_column(nodes: Sequence[ExprNode]) -> bool:
+    return len(nodes) == 1 and nodes[0].name == "col"
+
+
+def _window_key(
+    nodes: Sequence[ExprNode], partition_by: Sequence[str], order_by: Sequence[str]
+) -> WindowKey | None:
+    """Key for `prev.leaf().over(partition_by, order_by)`, if it can share its window.
+
+    If `prev` is just a column, then the window only depends on the input frame, and so
+    other windows over the same keys can share its grouping (and sort).
+    """
+    *prev, leaf = nodes
+    if not partition_by or not _is_column(prev) or leaf.name == "cum_count":
+        return None
+    reverse = leaf.name.startswith("cum_") and leaf.kwargs["reverse"]
+    return tuple(partition_by), tuple(order_by), reverse
+
+
+def iter_windows(nodes: Sequence[ExprNode]) -> Iterator[tuple[WindowKey, list[str]]]:
+    """Yield the shareable windows in `nodes` (see `_window_key`), and their columns."""
+    for i, node in enumerate(nodes):
+        for arg in node.exprs:
+            if is_expr(arg):
+                yield from iter_windows(arg._nodes)
+        if node.name == "over" and i == 2:
+            key = _window_key(
+                nodes[:i], node.kwargs["partition_by"], node.kwargs["order_by"]
+            )
+            if key is not None:
+                yield key, nodes[0].kwargs["names"]
+
+
+def _is_alias(node: ExprNode) -> bool:
+    return node.name == "alias" or node.name.startswith("name.")
+
+
+def _nodes_to_numexpr_tree(nodes: Sequence[ExprNode]) -> NumexprTree | None:  # noqa: C901
+    root, *rest = nodes
+    if root.name != "col" or len(names := root.kwargs["names"]) != 1:
+        return None
+    tree: NumexprTree = ("col", names[0])
+    for node in rest:
+        if _is_alias(node):
+            continue
+        if node.kind is not ExprKind.ELEMENTWISE:
+            return None
+        args = []
+        for arg in node.exprs:
+            if (arg_tree := _into_numexpr_tree(arg, node)) is None:
+                return None
+            args.append(arg_tree)
+        if (op := _NUMEXPR_BINARY_OPS.get(node.name)) is not None:
+            tree = (op, tree, *args)
+        elif node.name == "__rsub__":
+            tree = ("-", *args, tree)
+        elif node.name == "__invert__":
+            tree = ("~", tree)
+        elif node.name == "abs":
+            tree = ("abs", tree)
+        elif node.name == "is_between":
+            lower_op, upper_op = _NUMEXPR_IS_BETWEEN_OPS[node.kwargs["closed"]]
+            lower, upper = args
+            tree = ("&", (lower_op, tree, lower), (upper_op, tree, upper))
+        else:
+            return None
+    return tree
+
+
+def _into_numexpr_tree(arg: Any, node: ExprNode) -> NumexprTree | None:
+    if isinstance(arg, str) and not node.str_as_lit:
+        return ("col", arg)
+    if is_expr(arg):
+        return _nodes_to_numexpr_tree(arg._nodes)
+    if (
+        isinstance(arg, int) and not isinstance(arg, bool) and -(2**63) <= arg < 2**63
+    ) or (isinstance(arg, float) and math.isfinite(arg)):
+        return ("lit", arg)
+    return None
+
+
+def _render_numexpr(  # noqa: C901, PLR0911, PLR0912
+    tree: NumexprTree, native: Any, variables: dict[str, str]
+) -> tuple[str, str] | None:
+    """Render `tree` as a `numexpr` expression, along with the kind of its result.
+
+    Column names are replaced by variables `_0`, `_1`, ... (recorded in `variables`),
+    as they needn't be valid identifiers.
+    """
+    op, *args = tree
+    if op == "col":
+        (name,) = args
+        if name not in native.columns:
+            # Let the unfused path raise.
+            return None
+        if (kind := _NUMEXPR_DTYPE_KINDS.get(str(native[name].dtype))) is None:
+            return None
+        var = variables.setdefault(name, f"_{len(variables)}")
+        return var, kind
+    if op == "lit":
+        (value,) = args
+        return f"({value!r})", "f" if isinstance(value, float) else "i"
+    operands = []
+    for arg in args:
+        if (rendered := _render_numexpr(arg, native, variables)) is None:
+            return None
+        operands.append(rendered)
+    kinds = {kind for _, kind in operands}
+    if op in {"~", "&", "|"}:
+        if kinds != {"b"}:
+            return None
+        kind = "b"
+    elif not kinds.issubset({"i", "f"}):
+        return None
+    elif op in _NUMEXPR_COMPARISON_OPS.values():
+        kind = "b"
+    else:
+        kind = "f" if "f" in kinds else "i"
+    if op == "abs":
+        # `numexpr` always returns floats for `abs`.
+        return (f"abs({operands[0][0]})", kind) if kind == "f" else None
+    if op == "~":
+        return f"(~{operands[0][0]})", kind
+    lhs, rhs = operands
+    return f"({lhs[0]} {op} {rhs[0]})", kind
@@ -202,6 +202,11 @@ class AggExpr:
                 )
                 raise NotImplementedError(msg)
             return methodcaller("nth", n=_REMAP_ORDERED_INDEX[self.leaf_name])
+        if self.leaf_name == "quantile":
+            kwargs = last_node.kwargs
+            return _native_agg(
+                native_name, q=kwargs["quantile"], interpolation=kwargs["interpolation"]
+            )
         return _native_agg(native_name, **last_node.kwargs)
 
 
@@ -270,6 +275,8 @@ class PandasLikeGroupBy(
         )
 
     def agg(self, *exprs: PandasLikeExpr) -> PandasLikeDataFrame:
+        if (decomposed := self._agg_decomposed(exprs)) is not None:
+            return decomposed
         all_aggs_are_simple = True
         agg_exprs: list[AggExpr] = []
         for expr in exprs:
@@ -20,7 +20,7 @@ from narwhals._pandas_like.utils import is_non_nullable_boolean
 from narwhals._utils import zip_strict
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
     from typing_extensions import TypeAlias
 
@@ -153,12 +153,19 @@ class PandasLikeNamespace(
             )
             return [reduce(operator.and_, it)]
 
-        return self._expr._from_callable(
+        expr = self._expr._from_callable(
             func=func,
             evaluate_output_names=combine_evaluate_output_names(*exprs),
             alias_output_names=combine_alias_output_names(*exprs),
             context=self,
         )
+        # e.g. `df.filter(predicate_1, predicate_2)` ends up here, and doesn't get
+        # any metadata, so we fuse it now. Fused trees only ever evaluate to NumPy
+        # booleans, so there are no nulls to worry about.
+        trees = [e._to_numexpr_tree() for e in exprs]
+        if all(tree is not None for tree in trees):
+            expr._opt_numexpr_tree = reduce(lambda x, y: ("&", x, y), trees)
+        return expr
 
     def any_horizontal(
         self, *exprs: PandasLikeExpr, ignore_nulls: bool
@@ -252,10 +259,8 @@ class PandasLikeNamespace(
         """
         return self._implementation.to_native_namespace().concat
 
-    def _concat_diagonal(self, dfs: Sequence[NativeDataFrameT], /) -> NativeDataFrameT:
-        if self._implementation.is_pandas() and self._backend_version < (3,):
-            return self._concat(dfs, axis=VERTICAL, copy=False)
-        return self._concat(dfs, axis=VERTICAL)
+    def _concat_diagonal(self, dfs: Iterable[NativeDataFrameT], /) -> NativeDataFrameT:
+        return self._concat_rows(dfs)
 
     def _concat_horizontal(
         self, dfs: Sequence[NativeDataFrameT | NativeSeriesT], /
@@ -272,19 +277,28 @@ class PandasLikeNamespace(
             return self._concat(dfs, axis=HORIZONTAL, copy=False)
         return self._concat(dfs, axis=HORIZONTAL)
 
-    def _concat_vertical(self, dfs: Sequence[NativeDataFrameT], /) -> NativeDataFrameT:
-        cols_0 = dfs[0].columns
-        for i, df in enumerate(dfs[1:], start=1):
-            cols_current = df.columns
-            if not (
-                (len(cols_current) == len(cols_0)) and (cols_current == cols_0).all()
-            ):
-                msg = (
-                    "unable to vstack, column names don't match:\n"
-                    f"   - dataframe 0: {cols_0.to_list()}\n"
-                    f"   - dataframe {i}: {cols_current.to_list()}\n"
-                )
-                raise TypeError(msg)
+    def _concat_vertical(self, dfs: Iterable[NativeDataFrameT], /) -> NativeDataFrameT:
+        def iter_checked() -> Iterator[NativeDataFrameT]:
+            it = iter(dfs)
+            df_0 = next(it)
+            cols_0 = df_0.columns
+            yield df_0
+            for i, df in enumerate(it, start=1):
+                cols_current = df.columns
+                if not (
+                    (len(cols_current) == len(cols_0)) and (cols_current == cols_0).all()
+                ):
+                    msg = (
+                        "unable to vstack, column names don't match:\n"
+                        f"   - dataframe 0: {cols_0.to_list()}\n"
+                        f"   - dataframe {i}: {cols_current.to_list()}\n"
+                    )
+                    raise TypeError(msg)
+                yield df
+
+        return self._concat_rows(iter_checked())
+
+    def _concat_rows(self, dfs: Iterable[NativeDataFrameT], /) -> NativeDataFrameT:
         if self._implementation.is_pandas() and self._backend_version < (3,):
             return self._concat(dfs, axis=VERTICAL, copy=False)
         return self._concat(dfs, axis=VERTICAL)
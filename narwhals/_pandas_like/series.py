@@ -996,6 +996,38 @@ class PandasLikeSeries(EagerSeries[Any]):
         ).std(ddof=ddof)
         return self._with_native(result)
 
+    def rolling_min(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        result = self.native.rolling(
+            window=window_size, min_periods=min_samples, center=center
+        ).min()
+        return self._with_native(result)
+
+    def rolling_max(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        result = self.native.rolling(
+            window=window_size, min_periods=min_samples, center=center
+        ).max()
+        return self._with_native(result)
+
+    def rolling_median(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        result = self.native.rolling(
+            window=window_size, min_periods=min_samples, center=center
+        ).median()
+        return self._with_native(result)
+
+    def rolling_quantile(
+        self,
+        quantile: float,
+        interpolation: RollingInterpolationMethod,
+        window_size: int,
+        *,
+        min_samples: int,
+        center: bool,
+    ) -> Self:
+        result = self.native.rolling(
+            window=window_size, min_periods=min_samples, center=center
+        ).quantile(quantile, interpolation=interpolation)
+        return self._with_native(result)
+
     def __iter__(self) -> Iterator[Any]:
         if self._implementation.is_cudf():
             msg = (
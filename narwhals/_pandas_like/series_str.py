@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from narwhals._compliant.any_namespace import StringNamespace
+from narwhals._datetime_format import SAMPLE_SIZE, infer_datetime_format
 from narwhals._pandas_like.utils import (
     PandasLikeSeriesNamespace,
     align_and_extract_native,
@@ -10,12 +13,31 @@ from narwhals._pandas_like.utils import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from narwhals._pandas_like.series import PandasLikeSeries
 
 
 class PandasLikeSeriesStringNamespace(
     PandasLikeSeriesNamespace, StringNamespace["PandasLikeSeries"]
 ):
+    def _map_strings(self, function: Callable[[Any], Any]) -> PandasLikeSeries:
+        """Apply `function`, which maps strings to strings.
+
+        Categoricals only have their categories transformed, and are then decoded, so
+        that (like in Polars) the result is a string column either way.
+        """
+        native = self.native
+        if native.dtype != "category" or self.implementation.is_cudf():
+            return self.with_native(function(native))
+        categories = function(native.cat.categories)
+        values = categories.take(
+            native.cat.codes.to_numpy(), allow_fill=True, fill_value=np.nan
+        )
+        ns = self.implementation.to_native_namespace()
+        result = ns.Series(values, index=native.index, name=native.name)
+        return self.with_native(result)
+
     def len_chars(self) -> PandasLikeSeries:
         return self.with_native(self.native.str.len())
 
@@ -26,10 +48,11 @@ class PandasLikeSeriesStringNamespace(
         if not isinstance(value_native, str):
             msg = f"{self.compliant._implementation} backed `.str.replace` only supports str replacement values"
             raise TypeError(msg)
-        series = self.native.str.replace(
-            pat=pattern, repl=value_native, n=n, regex=not literal
+        return self._map_strings(
+            lambda native: native.str.replace(
+                pat=pattern, repl=value_native, n=n, regex=not literal
+            )
         )
-        return self.with_native(series)
 
     def replace_all(
         self, value: PandasLikeSeries, pattern: str, *, literal: bool
@@ -37,7 +60,7 @@ class PandasLikeSeriesStringNamespace(
         return self.replace(value, pattern, literal=literal, n=-1)
 
     def strip_chars(self, characters: str | None) -> PandasLikeSeries:
-        return self.with_native(self.native.str.strip(characters))
+        return self._map_strings(lambda native: native.str.strip(characters))
 
     def starts_with(self, prefix: str) -> PandasLikeSeries:
         return self.with_native(self.native.str.startswith(prefix))
@@ -50,7 +73,7 @@ class PandasLikeSeriesStringNamespace(
 
     def slice(self, offset: int, length: int | None) -> PandasLikeSeries:
         stop = offset + length if length else None
-        return self.with_native(self.native.str.slice(start=offset, stop=stop))
+        return self._map_strings(lambda native: native.str.slice(start=offset, stop=stop))
 
     def split(self, by: str) -> PandasLikeSeries:
         implementation = self.implementation
@@ -64,7 +87,15 @@ class PandasLikeSeriesStringNamespace(
             raise TypeError(msg)
         return self.with_native(self.native.str.split(pat=by))
 
-    def to_datetime(self, format: str | None) -> PandasLikeSeries:
+    def to_datetime(
+        self, format: str | None, *, sample_size: int = SAMPLE_SIZE
+    ) -> PandasLikeSeries:
+        if format is None and (inferred := self._infer_datetime_format(sample_size)):
+            try:
+                return self.to_datetime(inferred)
+            except ValueError:
+                # The sample didn't represent the whole column, so let pandas infer it.
+                pass
         # If we know inputs are timezone-aware, we can pass `utc=True` for better performance.
         if format and any(x in format for x in ("%z", "Z")):
             return self.with_native(self._to_datetime(format, utc=True))
@@ -73,6 +104,21 @@ class PandasLikeSeriesStringNamespace(
             return result.dt.convert_time_zone("UTC")
         return result
 
+    def _infer_datetime_format(self, sample_size: int) -> str | None:
+        # An explicit format lets pandas parse all values at once, rather than inferring
+        # them one by one.
+        if self.implementation.is_cudf():
+            return None
+        sample = self.native.dropna().iloc[:sample_size].tolist()
+        if not all(isinstance(value, str) for value in sample):
+            return None
+        try:
+            inferred = infer_datetime_format(sample)
+        except (NotImplementedError, ValueError):
+            return None
+        # pandas reads ambiguous dates month first, so only year-first formats are used.
+        return inferred if inferred.startswith("%Y") else None
+
     def _to_datetime(self, format: str | None, *, utc: bool) -> Any:
         result = self.implementation.to_native_namespace().to_datetime(
             self.native, format=format, utc=utc
@@ -87,13 +133,13 @@ class PandasLikeSeriesStringNamespace(
         return self.to_datetime(format=format).dt.date()
 
     def to_uppercase(self) -> PandasLikeSeries:
-        return self.with_native(self.native.str.upper())
+        return self._map_strings(lambda native: native.str.upper())
 
     def to_lowercase(self) -> PandasLikeSeries:
-        return self.with_native(self.native.str.lower())
+        return self._map_strings(lambda native: native.str.lower())
 
     def to_titlecase(self) -> PandasLikeSeries:
-        return self.with_native(self.native.str.title())
+        return self._map_strings(lambda native: native.str.title())
 
     def zfill(self, width: int) -> PandasLikeSeries:
-        return self.with_native(self.native.str.zfill(width))
+        return self._map_strings(lambda native: native.str.zfill(width))
@@ -45,6 +45,7 @@ if TYPE_CHECKING:
         MultiIndexSelector,
         NonNestedLiteral,
         PythonLiteral,
+        RollingInterpolationMethod,
         _1DArray,
     )
 
@@ -492,6 +493,66 @@ class PolarsSeries:
             )
         )
 
+    def rolling_min(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        extra_kwargs: dict[str, Any] = (
+            {"min_periods": min_samples}
+            if self._backend_version < (1, 21, 0)
+            else {"min_samples": min_samples}
+        )
+        return self._with_native(
+            self.native.rolling_min(
+                window_size=window_size, center=center, **extra_kwargs
+            )
+        )
+
+    def rolling_max(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        extra_kwargs: dict[str, Any] = (
+            {"min_periods": min_samples}
+            if self._backend_version < (1, 21, 0)
+            else {"min_samples": min_samples}
+        )
+        return self._with_native(
+            self.native.rolling_max(
+                window_size=window_size, center=center, **extra_kwargs
+            )
+        )
+
+    def rolling_median(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        extra_kwargs: dict[str, Any] = (
+            {"min_periods": min_samples}
+            if self._backend_version < (1, 21, 0)
+            else {"min_samples": min_samples}
+        )
+        return self._with_native(
+            self.native.rolling_median(
+                window_size=window_size, center=center, **extra_kwargs
+            )
+        )
+
+    def rolling_quantile(
+        self,
+        quantile: float,
+        interpolation: RollingInterpolationMethod,
+        window_size: int,
+        *,
+        min_samples: int,
+        center: bool,
+    ) -> Self:
+        extra_kwargs: dict[str, Any] = (
+            {"min_periods": min_samples}
+            if self._backend_version < (1, 21, 0)
+            else {"min_samples": min_samples}
+        )
+        return self._with_native(
+            self.native.rolling_quantile(
+                quantile,
+                interpolation,
+                window_size=window_size,
+                center=center,
+                **extra_kwargs,
+            )
+        )
+
     def sort(self, *, descending: bool, nulls_last: bool) -> Self:
         if self._backend_version < (0, 20, 6):
             result = self.native.sort(descending=descending)
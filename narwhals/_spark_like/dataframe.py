@@ -13,6 +13,7 @@ from narwhals._spark_like.utils import (
     import_functions,
     import_native_dtypes,
     import_window,
+    narwhals_to_native_dtype,
     native_to_narwhals_dtype,
 )
 from narwhals._sql.dataframe import SQLLazyFrame
@@ -49,7 +50,7 @@ if TYPE_CHECKING:
     from narwhals._utils import Version, _LimitedContext
     from narwhals.dataframe import LazyFrame
     from narwhals.dtypes import DType
-    from narwhals.typing import JoinStrategy, UniqueKeepStrategy
+    from narwhals.typing import IntoDType, JoinStrategy, UniqueKeepStrategy
 
     SQLFrameDataFrame = BaseDataFrame[Any, Any, Any, Any, Any]
 
@@ -74,6 +75,7 @@ class SparkLikeLazyFrame(
         self._version = version
         self._cached_schema: dict[str, DType] | None = None
         self._cached_columns: list[str] | None = None
+        self._partial_schema: dict[str, DType | None] | None = None
         if validate_backend_version:  # pragma: no cover
             self._validate_backend_version()
 
@@ -202,6 +204,25 @@ class SparkLikeLazyFrame(
             )
         return self._cached_columns
 
+    def _cast_dtype(self, dtype: IntoDType, /) -> DType:
+        # Round-trip through the native dtype, as the engine would report it.
+        session = self.native.sparkSession
+        native_dtype = narwhals_to_native_dtype(
+            dtype, self._version, self._native_dtypes, session
+        )
+        return native_to_narwhals_dtype(
+            native_dtype, self._version, self._native_dtypes, session
+        )
+
+    def _known_schema(self) -> Mapping[str, DType | None]:
+        # Unlike `columns`, the full schema may need an extra round-trip, so it's
+        # only fetched once a dtype which couldn't be inferred is needed.
+        if self._cached_schema is not None:
+            return self._cached_schema
+        if self._partial_schema is not None:
+            return self._partial_schema
+        return dict.fromkeys(self.columns)
+
     def _collect(
         self, backend: _EagerAllowedImpl | None, **kwargs: Any
     ) -> CompliantDataFrameAny:
@@ -251,7 +272,10 @@ class SparkLikeLazyFrame(
         return self._collect(backend, **kwargs)
 
     def simple_select(self, *column_names: str) -> Self:
-        return self._with_native(self.native.select(*column_names))
+        schema = self._known_schema()
+        return self._with_native(self.native.select(*column_names))._with_schema(
+            {name: schema[name] for name in column_names}
+        )
 
     def aggregate(self, *exprs: SparkLikeExpr) -> Self:
         new_columns = evaluate_exprs(self, *exprs)
@@ -259,53 +283,68 @@ class SparkLikeLazyFrame(
         new_columns_list = [col.alias(col_name) for col_name, col in new_columns]
         if self._implementation.is_pyspark():
             try:
-                return self._with_native(self.native.agg(*new_columns_list))
+                result = self._with_native(self.native.agg(*new_columns_list))
             except Exception as e:  # noqa: BLE001
                 raise catch_pyspark_sql_exception(e, self) from None
-        return self._with_native(self.native.agg(*new_columns_list))
+        else:
+            result = self._with_native(self.native.agg(*new_columns_list))
+        return result._with_schema(self._infer_schema(exprs))
 
     def select(self, *exprs: SparkLikeExpr) -> Self:
         new_columns = evaluate_exprs(self, *exprs)
         new_columns_list = [col.alias(col_name) for (col_name, col) in new_columns]
         if self._implementation.is_pyspark():  # pragma: no cover
             try:
-                return self._with_native(self.native.select(*new_columns_list))
+                result = self._with_native(self.native.select(*new_columns_list))
             except Exception as e:  # noqa: BLE001
                 raise catch_pyspark_sql_exception(e, self) from None
-        return self._with_native(self.native.select(*new_columns_list))
+        else:
+            result = self._with_native(self.native.select(*new_columns_list))
+        return result._with_schema(self._infer_schema(exprs))
 
     def with_columns(self, *exprs: SparkLikeExpr) -> Self:
         new_columns = evaluate_exprs(self, *exprs)
         if self._implementation.is_pyspark():  # pragma: no cover
             try:
-                return self._with_native(self.native.withColumns(dict(new_columns)))
+                result = self._with_native(self.native.withColumns(dict(new_columns)))
             except Exception as e:  # noqa: BLE001
                 raise catch_pyspark_sql_exception(e, self) from None
-
-        return self._with_native(self.native.withColumns(dict(new_columns)))
+        else:
+            result = self._with_native(self.native.withColumns(dict(new_columns)))
+        if (new_schema := self._infer_schema(exprs)) is None:
+            return result
+        return result._with_schema({**self._known_schema(), **new_schema})
 
     def filter(self, predicate: SparkLikeExpr) -> Self:
         # `[0]` is safe as the predicate's expression only returns a single column
         condition = predicate._call(self)[0]
         if self._implementation.is_pyspark():
             try:
-                return self._with_native(self.native.where(condition))
+                result = self._with_native(self.native.where(condition))
             except Exception as e:  # noqa: BLE001
                 raise catch_pyspark_sql_exception(e, self) from None
-        return self._with_native(self.native.where(condition))
+        else:
+            result = self._with_native(self.native.where(condition))
+        return result._with_schema(self._known_schema())
 
     @property
     def schema(self) -> dict[str, DType]:
         if self._cached_schema is None:
-            self._cached_schema = {
-                field.name: native_to_narwhals_dtype(
-                    field.dataType,
-                    self._version,
-                    self._native_dtypes,
-                    self.native.sparkSession,
-                )
-                for field in self.native.schema
-            }
+            partial = self._partial_schema
+            if partial is not None and all(
+                dtype is not None for dtype in partial.values()
+            ):
+                self._cached_schema = partial  # type: ignore[assignment]
+            else:
+                self._cached_schema = {
+                    field.name: native_to_narwhals_dtype(
+                        field.dataType,
+                        self._version,
+                        self._native_dtypes,
+                        self.native.sparkSession,
+                    )
+                    for field in self.native.schema
+                }
         return self._cached_schema
 
     def collect_schema(self) -> dict[str, DType]:
@@ -313,10 +352,16 @@ class SparkLikeLazyFrame(
 
     def drop(self, columns: Sequence[str], *, strict: bool) -> Self:
         columns_to_drop = parse_columns_to_drop(self, columns, strict=strict)
-        return self._with_native(self.native.drop(*columns_to_drop))
+        return self._with_native(self.native.drop(*columns_to_drop))._with_schema(
+            {
+                name: dtype
+                for name, dtype in self._known_schema().items()
+                if name not in columns_to_drop
+            }
+        )
 
     def head(self, n: int) -> Self:
-        return self._with_native(self.native.limit(n))
+        return self._with_native(self.native.limit(n))._with_schema(self._known_schema())
 
     def group_by(
         self, keys: Sequence[str] | Sequence[SparkLikeExpr], *, drop_null_keys: bool
@@ -339,7 +384,9 @@ class SparkLikeLazyFrame(
             )
 
         sort_cols = [sort_f(col) for col, sort_f in zip_strict(by, sort_funcs)]
-        return self._with_native(self.native.sort(*sort_cols))
+        return self._with_native(self.native.sort(*sort_cols))._with_schema(
+            self._known_schema()
+        )
 
     def top_k(self, k: int, *, by: Iterable[str], reverse: bool | Sequence[bool]) -> Self:
         by = tuple(by)
@@ -348,21 +395,24 @@ class SparkLikeLazyFrame(
             self._F.desc_nulls_last if not d else self._F.asc_nulls_last for d in reverse
         )
         sort_cols = [sort_f(col) for col, sort_f in zip_strict(by, sort_funcs)]
-        return self._with_native(self.native.sort(*sort_cols).limit(k))
+        return self._with_native(self.native.sort(*sort_cols).limit(k))._with_schema(
+            self._known_schema()
+        )
 
     def drop_nulls(self, subset: Sequence[str] | None) -> Self:
         subset = list(subset) if subset else None
-        return self._with_native(self.native.dropna(subset=subset))
+        return self._with_native(self.native.dropna(subset=subset))._with_schema(
+            self._known_schema()
+        )
 
     def rename(self, mapping: Mapping[str, str]) -> Self:
-        rename_mapping = {
-            colname: mapping.get(colname, colname) for colname in self.columns
-        }
+        schema = self._known_schema()
+        rename_mapping = {colname: mapping.get(colname, colname) for colname in schema}
         return self._with_native(
             self.native.select(
                 [self._F.col(old).alias(new) for old, new in rename_mapping.items()]
             )
-        )
+        )._with_schema({rename_mapping[name]: dtype for name, dtype in schema.items()})
 
     def unique(
         self,
@@ -391,7 +441,7 @@ class SparkLikeLazyFrame(
             .filter(self._F.col(tmp_name) == self._F.lit(1))
             .drop(tmp_name)
         )
-        return self._with_native(df)
+        return self._with_native(df)._with_schema(self._known_schema())
 
     def join(
         self,
@@ -457,9 +507,19 @@ class SparkLikeLazyFrame(
             else left_on_
         )
         how_native = "full_outer" if how == "full" else how
+        right_schema = other._known_schema()
+        schema = {
+            **{new: right_schema[old] for old, new in rename_mapping.items()},
+            **self._known_schema(),
+        }
+        if how in {"inner", "left"}:
+            # Keys which are joined on by name may get coerced to a common dtype.
+            for left_key, right_key in zip_strict(left_on_, right_on_):
+                if schema[left_key] != right_schema[right_key]:
+                    schema[left_key] = None
         return self._with_native(
             self.native.join(other_native, on=on_, how=how_native).select(col_order)
-        )
+        )._with_schema({name: schema[name] for name in col_order})
 
     def explode(self, columns: Sequence[str]) -> Self:
         dtypes = self._version.dtypes
@@ -32,6 +32,8 @@ class SparkLikeLazyGroupBy(SQLGroupBy["SparkLikeLazyFrame", "SparkLikeExpr", "Co
             else self.compliant.native.select(*self._keys).dropDuplicates()
         )
 
-        return self.compliant._with_native(result).rename(
-            dict(zip(self._keys, self._output_key_names))
+        return (
+            self.compliant._with_native(result)
+            ._with_schema(self._output_schema(exprs))
+            .rename(dict(zip(self._keys, self._output_key_names)))
         )
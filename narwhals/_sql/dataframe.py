@@ -8,21 +8,89 @@ from narwhals._compliant.typing import (
     NativeExprT,
     NativeLazyFrameT,
 )
+from narwhals._expression_parsing import ExprKind
 from narwhals._translate import ToNarwhalsT_co
-from narwhals._utils import check_columns_exist
+from narwhals._utils import check_columns_exist, zip_strict
 from narwhals.exceptions import MultiOutputExpressionError
+from narwhals.selectors import Selector
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Mapping, Sequence
 
     from typing_extensions import Self, TypeAlias
 
     from narwhals._compliant.window import WindowInputs
+    from narwhals._expression_parsing import ExprNode
     from narwhals._sql.expr import SQLExpr
     from narwhals.exceptions import ColumnNotFoundError
+    from narwhals.typing import IntoDType
 
     Incomplete: TypeAlias = Any
 
+_DTYPE_PRESERVING_OPS = frozenset(
+    (
+        "any_value",
+        "cum_max",
+        "cum_min",
+        "drop_nulls",
+        "filter",
+        "first",
+        "last",
+        "max",
+        "min",
+        "over",
+        "shift",
+        "str.replace",
+        "str.replace_all",
+        "str.slice",
+        "str.strip_chars",
+        "str.to_lowercase",
+        "str.to_titlecase",
+        "str.to_uppercase",
+        "unique",
+    )
+)
+"""Operations whose output has the same (native) dtype as their input."""
+
+_BOOLEAN_OPS = frozenset(
+    (
+        "__eq__",
+        "__ge__",
+        "__gt__",
+        "__le__",
+        "__lt__",
+        "__ne__",
+        "all",
+        "all_horizontal",
+        "any",
+        "any_horizontal",
+        "is_between",
+        "is_duplicated",
+        "is_finite",
+        "is_first_distinct",
+        "is_in",
+        "is_last_distinct",
+        "is_nan",
+        "is_null",
+        "is_unique",
+        "list.contains",
+        "str.contains",
+        "str.ends_with",
+        "str.starts_with",
+    )
+)
+"""Operations whose output is always boolean."""
+
+_LOGICAL_OPS = frozenset(("__and__", "__invert__", "__or__"))
+"""Operations whose output is boolean if their input is (and bitwise otherwise)."""
+
+_SET_OPS = frozenset(("__and__", "__invert__", "__or__", "__sub__"))
+
+
+def _is_selector_set_op(node: ExprNode) -> bool:
+    # e.g. `~ncs.numeric()` or `ncs.numeric() - ncs.boolean()`.
+    return node.name in _SET_OPS and all(isinstance(e, Selector) for e in node.exprs)
+
 
 class SQLLazyFrame(
     CompliantLazyFrame[CompliantExprT_contra, NativeLazyFrameT, ToNarwhalsT_co],
@@ -49,5 +117,82 @@ class SQLLazyFrame(
             raise MultiOutputExpressionError(msg)
         return result[0]
 
+    # Derived frames know their column names, and (where they could be inferred)
+    # dtypes, without asking the engine - see `_infer_schema`. Each backend keeps
+    # them in whichever representation its `schema` is cheapest to compute from.
+    _cached_columns: list[str] | None
+    _partial_schema: dict[str, Any] | None
+
+    @property
+    def _boolean_dtype(self) -> Any:
+        return self._version.dtypes.Boolean()
+
+    def _cast_dtype(self, dtype: IntoDType, /) -> Any:
+        """Dtype of the output of `cast(dtype)`, or `None` if it isn't known."""
+        return None
+
+    def _known_schema(self) -> Mapping[str, Any]:
+        """Column names mapped to their dtypes, or to `None` where those aren't known."""
+        return self.schema
+
+    def _with_schema(self, schema: Mapping[str, Any] | None) -> Self:
+        # Only to be called on newly created frames.
+        if schema is not None:
+            self._partial_schema = dict(schema)
+            self._cached_columns = list(schema)
+        return self
+
+    def _infer_dtype(self, expr: SQLExpr[Self, Any], input_dtype: Any) -> Any:
+        if (md := expr._opt_metadata) is None:
+            return None
+        root, *ops = reversed(tuple(md.op_nodes_reversed()))
+        if root.kind.is_selection:
+            dtype = input_dtype
+        elif root.name == "lit" and root.kwargs["dtype"] is not None:
+            dtype = self._cast_dtype(root.kwargs["dtype"])
+        else:
+            dtype = self._boolean_dtype if root.name in _BOOLEAN_OPS else None
+        if root.kind is ExprKind.SELECTOR:
+            # Combining selectors still just selects columns.
+            while ops and _is_selector_set_op(ops[0]):
+                ops.pop(0)
+        for node in ops:
+            if node.name == "cast":
+                dtype = self._cast_dtype(node.kwargs["dtype"])
+            elif node.name in _BOOLEAN_OPS or (
+                node.name in _LOGICAL_OPS
+                and dtype is not None
+                and dtype == self._boolean_dtype
+            ):
+                dtype = self._boolean_dtype
+            elif node.name not in _DTYPE_PRESERVING_OPS:
+                dtype = None
+        return dtype
+
+    def _infer_schema(
+        self, exprs: Iterable[SQLExpr[Self, Any]], /, exclude: Sequence[str] = ()
+    ) -> dict[str, Any] | None:
+        """Infer the names and dtypes of the outputs of `exprs`, evaluated on this frame.
+
+        Dtypes which can't be inferred are `None`. Multi-output unnamed expressions
+        (e.g. `nw.all()`) skip the columns in `exclude`. Returns `None` if the
+        output names aren't unique.
+        """
+        known_schema = self._known_schema()
+        schema: dict[str, Any] = {}
+        n_outputs = 0
+        for expr in exprs:
+            names = expr._evaluate_output_names(self)
+            aliases = (
+                expr._alias_output_names(names) if expr._alias_output_names else names
+            )
+            skip_excluded = bool(exclude) and expr._is_multi_output_unnamed()
+            for name, alias in zip_strict(names, aliases):
+                if skip_excluded and name in exclude:
+                    continue
+                schema[alias] = self._infer_dtype(expr, known_schema.get(name))
+                n_outputs += 1
+        return schema if len(schema) == n_outputs else None
+
     def _check_columns_exist(self, subset: Sequence[str]) -> ColumnNotFoundError | None:
         return check_columns_exist(subset, available=self.columns)
@@ -28,7 +28,12 @@ if TYPE_CHECKING:
     from narwhals._sql.expr_dt import SQLExprDateTimeNamesSpace
     from narwhals._sql.expr_str import SQLExprStringNamespace
     from narwhals._sql.namespace import SQLNamespace
-    from narwhals.typing import ModeKeepStrategy, PythonLiteral, RankMethod
+    from narwhals.typing import (
+        ModeKeepStrategy,
+        PythonLiteral,
+        RankMethod,
+        RollingInterpolationMethod,
+    )
 
 
 class SQLExpr(LazyExpr[SQLLazyFrameT, NativeExprT], Protocol[SQLLazyFrameT, NativeExprT]):
@@ -235,14 +240,26 @@ class SQLExpr(LazyExpr[SQLLazyFrameT, NativeExprT], Protocol[SQLLazyFrameT, Nati
 
     def _rolling_window_func(
         self,
-        func_name: Literal["sum", "mean", "std", "var"],
+        func_name: Literal[
+            "sum", "mean", "std", "var", "min", "max", "median", "quantile"
+        ],
         window_size: int,
         min_samples: int,
         ddof: int | None = None,
         *,
         center: bool,
+        quantile: float | None = None,
     ) -> WindowFunction[SQLLazyFrameT, NativeExprT]:
-        supported_funcs = ["sum", "mean", "std", "var"]
+        supported_funcs = [
+            "sum",
+            "mean",
+            "std",
+            "var",
+            "min",
+            "max",
+            "median",
+            "quantile",
+        ]
         if center:
             half = (window_size - 1) // 2
             remainder = (window_size - 1) % 2
@@ -255,8 +272,12 @@ class SQLExpr(LazyExpr[SQLLazyFrameT, NativeExprT], Protocol[SQLLazyFrameT, Nati
         def func(
             df: SQLLazyFrameT, inputs: WindowInputs[NativeExprT]
         ) -> Sequence[NativeExprT]:
-            if func_name in {"sum", "mean"}:
+            args: tuple[NativeExprT, ...] = ()
+            if func_name in {"sum", "mean", "min", "max", "median"}:
                 func_: str = func_name
+            elif func_name == "quantile":
+                func_ = "quantile_cont"
+                args = (self._lit(quantile),)
             elif func_name == "var" and ddof == 0:
                 func_ = "var_pop"
             elif func_name in "var" and ddof == 1:
@@ -283,7 +304,9 @@ class SQLExpr(LazyExpr[SQLLazyFrameT, NativeExprT], Protocol[SQLLazyFrameT, Nati
                         self._function("count", expr), **window_kwargs
                     )
                     >= self._lit(min_samples),
-                    self._window_expression(self._function(func_, expr), **window_kwargs),
+                    self._window_expression(
+                        self._function(func_, expr, *args), **window_kwargs
+                    ),
                 )
                 for expr in self(df)
             ]
@@ -676,6 +699,41 @@ class SQLExpr(LazyExpr[SQLLazyFrameT, NativeExprT], Protocol[SQLLazyFrameT, Nati
             )
         )
 
+    def rolling_min(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        return self._with_window_function(
+            self._rolling_window_func("min", window_size, min_samples, center=center)
+        )
+
+    def rolling_max(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        return self._with_window_function(
+            self._rolling_window_func("max", window_size, min_samples, center=center)
+        )
+
+    def rolling_median(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        return self._with_window_function(
+            self._rolling_window_func("median", window_size, min_samples, center=center)
+        )
+
+    def rolling_quantile(
+        self,
+        quantile: float,
+        interpolation: RollingInterpolationMethod,
+        window_size: int,
+        *,
+        min_samples: int,
+        center: bool,
+    ) -> Self:
+        if interpolation != "linear":
+            msg = (
+                "Only linear interpolation methods are supported for `rolling_quantile`."
+            )
+            raise NotImplementedError(msg)
+        return self._with_window_function(
+            self._rolling_window_func(
+                "quantile", window_size, min_samples, center=center, quantile=quantile
+            )
+        )
+
     # Other window functions
     def diff(self) -> Self:
         def func(
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 from narwhals._compliant.group_by import CompliantGroupBy, ParseKeysGroupBy
 from narwhals._compliant.typing import CompliantLazyFrameT, NativeExprT_co
@@ -43,3 +43,18 @@ class SQLGroupBy(
     ) -> Iterator[NativeExprT_co]:
         for expr in exprs:
             yield from self._evaluate_expr(expr)
+
+    def _output_schema(
+        self, exprs: Iterable[SQLExprT_contra], /
+    ) -> dict[str, Any] | None:
+        """Names and (where known) dtypes of the result of `agg(*exprs)`.
+
+        Output keys keep their names until the final `rename`.
+        """
+        frame = self.compliant
+        known_schema = frame._known_schema()
+        exclude = (*self._keys, *self._output_key_names)
+        schema = frame._infer_schema(exprs, exclude=exclude)
+        if schema is None or not schema.keys().isdisjoint(self._keys):
+            return None
+        return {**{key: known_schema[key] for key in self._keys}, **schema}
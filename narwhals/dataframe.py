@@ -19,7 +19,10 @@ from typing import (
 from narwhals._exceptions import issue_warning
 from narwhals._expression_parsing import (
     _parse_into_expr,
+    broadcast_ce,
     check_expressions_preserve_length,
+    common_subexpression_scope,
+    compile_exprs,
     is_scalar_like,
 )
 from narwhals._typing import Arrow, Pandas, _LazyAllowedImpl, _LazyFrameCollectImpl
@@ -148,18 +151,16 @@ class BaseFrame(Generic[_FrameT]):
     ) -> list[CompliantExprAny]:
         # Process `args` and `kwargs`, extracting underlying objects as we go.
         # NOTE: Strings are interpreted as column names.
-        out_exprs = []
         ns = self.__narwhals_namespace__()
         parse = partial(
             _parse_into_expr, backend=self._compliant._implementation, allow_literal=False
         )
-        all_exprs = chain(
-            (parse(x) for x in flatten(exprs)),
-            (parse(expr).alias(alias) for alias, expr in named_exprs.items()),
-        )
-        for expr in all_exprs:
-            ce = expr._to_compliant_expr(ns)
-            out_exprs.append(ce)
+        all_exprs = [
+            *(parse(x) for x in flatten(exprs)),
+            *(parse(expr).alias(alias) for alias, expr in named_exprs.items()),
+        ]
+        out_exprs = compile_exprs(all_exprs, ns)
+        for ce in out_exprs:
             self._validate_metadata(ce._metadata)
         return out_exprs
 
@@ -206,12 +207,14 @@ class BaseFrame(Generic[_FrameT]):
     ) -> Self:
         compliant_exprs = self._flatten_and_extract(*exprs, **named_exprs)
         compliant_exprs = [
-            compliant_expr.broadcast()
+            broadcast_ce(compliant_expr)
             if is_scalar_like(compliant_expr)
             else compliant_expr
             for compliant_expr in compliant_exprs
         ]
-        return self._with_compliant(self._compliant_frame.with_columns(*compliant_exprs))
+        with common_subexpression_scope():
+            compliant_frame = self._compliant_frame.with_columns(*compliant_exprs)
+        return self._with_compliant(compliant_frame)
 
     def select(
         self, *exprs: IntoExpr | Iterable[IntoExpr], **named_exprs: IntoExpr
@@ -230,14 +233,18 @@ class BaseFrame(Generic[_FrameT]):
                 raise
         compliant_exprs = self._flatten_and_extract(*flat_exprs, **named_exprs)
         if compliant_exprs and all(is_scalar_like(x) for x in compliant_exprs):
-            return self._with_compliant(self._compliant_frame.aggregate(*compliant_exprs))
+            with common_subexpression_scope():
+                compliant_frame = self._compliant_frame.aggregate(*compliant_exprs)
+            return self._with_compliant(compliant_frame)
         compliant_exprs = [
-            compliant_expr.broadcast()
+            broadcast_ce(compliant_expr)
             if is_scalar_like(compliant_expr)
             else compliant_expr
             for compliant_expr in compliant_exprs
         ]
-        return self._with_compliant(self._compliant_frame.select(*compliant_exprs))
+        with common_subexpression_scope():
+            compliant_frame = self._compliant_frame.select(*compliant_exprs)
+        return self._with_compliant(compliant_frame)
 
     def rename(self, mapping: dict[str, str]) -> Self:
         return self._with_compliant(self._compliant_frame.rename(mapping))
@@ -266,7 +273,9 @@ class BaseFrame(Generic[_FrameT]):
         predicate = plx.all_horizontal(
             *chain(compliant_predicates, compliant_constraints), ignore_nulls=False
         )
-        return self._with_compliant(self._compliant_frame.filter(predicate))
+        with common_subexpression_scope():
+            compliant_frame = self._compliant_frame.filter(predicate)
+        return self._with_compliant(compliant_frame)
 
     def sort(
         self,
@@ -79,6 +79,11 @@ def get_numpy() -> Any:
     return sys.modules.get("numpy", None)
 
 
+def get_numexpr() -> Any:
+    """Get numexpr module (if already imported - else return None)."""
+    return sys.modules.get("numexpr", None)
+
+
 def get_dask() -> Any:  # pragma: no cover
     """Get dask (if already imported - else return None)."""
     return sys.modules.get("dask", None)
@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from typing_extensions import Concatenate, ParamSpec, Self
 
     from narwhals._compliant import CompliantExpr, CompliantNamespace
+    from narwhals._expression_parsing import CSEMemo
     from narwhals._typing import NoDefault
     from narwhals.dtypes import DType
     from narwhals.series import Series
@@ -53,9 +54,9 @@ class Expr:
         self._nodes = nodes
 
     def _to_compliant_expr(
-        self, ns: CompliantNamespace[Any, Any]
+        self, ns: CompliantNamespace[Any, Any], memo: CSEMemo | None = None
     ) -> CompliantExpr[Any, Any]:
-        return evaluate_nodes(self._nodes, ns)
+        return evaluate_nodes(self._nodes, ns, memo)
 
     def _append_node(self, node: ExprNode) -> Self:
         return self.__class__(*self._nodes, node)
@@ -1446,11 +1447,7 @@ class Expr:
             interpolation: Interpolation method.
 
         Note:
-            - pandas and Polars may have implementation differences for a given interpolation method.
-            - [dask](https://docs.dask.org/en/stable/generated/dask.dataframe.Series.quantile.html) has
-                its own method to approximate quantile and it doesn't implement 'nearest', 'higher',
-                'lower', 'midpoint' as interpolation method - use 'linear' which is closest to the
-                native 'dask' - method.
+            pandas and Polars may have implementation differences for a given interpolation method.
 
         Examples:
             >>> import pandas as pd
@@ -2118,6 +2115,245 @@ class Expr:
             )
         )
 
+    def rolling_min(
+        self, window_size: int, *, min_samples: int | None = None, center: bool = False
+    ) -> Self:
+        """Apply a rolling min (moving min) over the values.
+
+        A window of length `window_size` will traverse the values. The resulting values
+        will be aggregated to their min.
+
+        The window at a given row will include the row itself and the `window_size - 1`
+        elements before it.
+
+        Info:
+            For lazy backends, this operation must be followed by `Expr.over` with
+            `order_by` specified, see [order-dependence](../concepts/order_dependence.md).
+
+        Arguments:
+            window_size: The length of the window in number of elements. It must be a
+                strictly positive integer.
+            min_samples: The number of values in the window that should be non-null before
+                computing a result. If set to `None` (default), it will be set equal to
+                `window_size`. If provided, it must be a strictly positive integer, and
+                less than or equal to `window_size`
+            center: Set the labels at the center of the window.
+
+        Examples:
+            >>> import pandas as pd
+            >>> import narwhals as nw
+            >>> df_native = pd.DataFrame({"a": [1.0, 2.0, None, 4.0]})
+            >>> df = nw.from_native(df_native)
+            >>> df.with_columns(
+            ...     a_rolling_min=nw.col("a").rolling_min(window_size=3, min_samples=1)
+            ... )
+            ┌─────────────────────┐
+            | Narwhals DataFrame  |
+            |---------------------|
+            |     a  a_rolling_min|
+            |0  1.0            1.0|
+            |1  2.0            1.0|
+            |2  NaN            1.0|
+            |3  4.0            2.0|
+            └─────────────────────┘
+        """
+        window_size, min_samples = _validate_rolling_arguments(
+            window_size=window_size, min_samples=min_samples
+        )
+        return self._append_node(
+            ExprNode(
+                ExprKind.ORDERABLE_WINDOW,
+                "rolling_min",
+                window_size=window_size,
+                min_samples=min_samples,
+                center=center,
+            )
+        )
+
+    def rolling_max(
+        self, window_size: int, *, min_samples: int | None = None, center: bool = False
+    ) -> Self:
+        """Apply a rolling max (moving max) over the values.
+
+        A window of length `window_size` will traverse the values. The resulting values
+        will be aggregated to their max.
+
+        The window at a given row will include the row itself and the `window_size - 1`
+        elements before it.
+
+        Info:
+            For lazy backends, this operation must be followed by `Expr.over` with
+            `order_by` specified, see [order-dependence](../concepts/order_dependence.md).
+
+        Arguments:
+            window_size: The length of the window in number of elements. It must be a
+                strictly positive integer.
+            min_samples: The number of values in the window that should be non-null before
+                computing a result. If set to `None` (default), it will be set equal to
+                `window_size`. If provided, it must be a strictly positive integer, and
+                less than or equal to `window_size`
+            center: Set the labels at the center of the window.
+
+        Examples:
+            >>> import pandas as pd
+            >>> import narwhals as nw
+            >>> df_native = pd.DataFrame({"a": [1.0, 2.0, None, 4.0]})
+            >>> df = nw.from_native(df_native)
+            >>> df.with_columns(
+            ...     a_rolling_max=nw.col("a").rolling_max(window_size=3, min_samples=1)
+            ... )
+            ┌─────────────────────┐
+            | Narwhals DataFrame  |
+            |---------------------|
+            |     a  a_rolling_max|
+            |0  1.0            1.0|
+            |1  2.0            2.0|
+            |2  NaN            2.0|
+            |3  4.0            4.0|
+            └─────────────────────┘
+        """
+        window_size, min_samples = _validate_rolling_arguments(
+            window_size=window_size, min_samples=min_samples
+        )
+        return self._append_node(
+            ExprNode(
+                ExprKind.ORDERABLE_WINDOW,
+                "rolling_max",
+                window_size=window_size,
+                min_samples=min_samples,
+                center=center,
+            )
+        )
+
+    def rolling_median(
+        self, window_size: int, *, min_samples: int | None = None, center: bool = False
+    ) -> Self:
+        """Apply a rolling median (moving median) over the values.
+
+        A window of length `window_size` will traverse the values. The resulting values
+        will be aggregated to their median.
+
+        The window at a given row will include the row itself and the `window_size - 1`
+        elements before it.
+
+        Info:
+            For lazy backends, this operation must be followed by `Expr.over` with
+            `order_by` specified, see [order-dependence](../concepts/order_dependence.md).
+
+        Arguments:
+            window_size: The length of the window in number of elements. It must be a
+                strictly positive integer.
+            min_samples: The number of values in the window that should be non-null before
+                computing a result. If set to `None` (default), it will be set equal to
+                `window_size`. If provided, it must be a strictly positive integer, and
+                less than or equal to `window_size`
+            center: Set the labels at the center of the window.
+
+        Examples:
+            >>> import pandas as pd
+            >>> import narwhals as nw
+            >>> df_native = pd.DataFrame({"a": [1.0, 3.0, None, 4.0]})
+            >>> df = nw.from_native(df_native)
+            >>> df.with_columns(
+            ...     a_rolling_median=nw.col("a").rolling_median(
+            ...         window_size=3, min_samples=1
+            ...     )
+            ... )
+            ┌────────────────────────┐
+            |   Narwhals DataFrame   |
+            |------------------------|
+            |     a  a_rolling_median|
+            |0  1.0               1.0|
+            |1  3.0               2.0|
+            |2  NaN               2.0|
+            |3  4.0               3.5|
+            └────────────────────────┘
+        """
+        window_size, min_samples = _validate_rolling_arguments(
+            window_size=window_size, min_samples=min_samples
+        )
+        return self._append_node(
+            ExprNode(
+                ExprKind.ORDERABLE_WINDOW,
+                "rolling_median",
+                window_size=window_size,
+                min_samples=min_samples,
+                center=center,
+            )
+        )
+
+    def rolling_quantile(
+        self,
+        quantile: float,
+        interpolation: RollingInterpolationMethod,
+        window_size: int,
+        *,
+        min_samples: int | None = None,
+        center: bool = False,
+    ) -> Self:
+        """Apply a rolling quantile (moving quantile) over the values.
+
+        A window of length `window_size` will traverse the values. The resulting values
+        will be aggregated to their quantile.
+
+        The window at a given row will include the row itself and the `window_size - 1`
+        elements before it.
+
+        Info:
+            For lazy backends, this operation must be followed by `Expr.over` with
+            `order_by` specified, see [order-dependence](../concepts/order_dependence.md).
+
+        Note:
+            - pandas and Polars may have implementation differences for a given interpolation method.
+            - SQL backends (DuckDB, Ibis) only support `interpolation="linear"`, and PySpark
+                doesn't support this method.
+
+        Arguments:
+            quantile: Quantile between 0.0 and 1.0.
+            interpolation: Interpolation method.
+            window_size: The length of the window in number of elements. It must be a
+                strictly positive integer.
+            min_samples: The number of values in the window that should be non-null before
+                computing a result. If set to `None` (default), it will be set equal to
+                `window_size`. If provided, it must be a strictly positive integer, and
+                less than or equal to `window_size`
+            center: Set the labels at the center of the window.
+
+        Examples:
+            >>> import pandas as pd
+            >>> import narwhals as nw
+            >>> df_native = pd.DataFrame({"a": [1.0, 3.0, None, 4.0]})
+            >>> df = nw.from_native(df_native)
+            >>> df.with_columns(
+            ...     a_rolling_quantile=nw.col("a").rolling_quantile(
+            ...         0.25, "linear", window_size=3, min_samples=1
+            ...     )
+            ... )
+            ┌──────────────────────────┐
+            |    Narwhals DataFrame    |
+            |--------------------------|
+            |     a  a_rolling_quantile|
+            |0  1.0                1.00|
+            |1  3.0                1.50|
+            |2  NaN                1.50|
+            |3  4.0                3.25|
+            └──────────────────────────┘
+        """
+        window_size, min_samples = _validate_rolling_arguments(
+            window_size=window_size, min_samples=min_samples
+        )
+        return self._append_node(
+            ExprNode(
+                ExprKind.ORDERABLE_WINDOW,
+                "rolling_quantile",
+                quantile=quantile,
+                interpolation=interpolation,
+                window_size=window_size,
+                min_samples=min_samples,
+                center=center,
+            )
+        )
+
     def rank(self, method: RankMethod = "average", *, descending: bool = False) -> Self:
         """Assign ranks to data, dealing with ties appropriately.
 
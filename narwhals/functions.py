@@ -28,6 +28,7 @@ from narwhals.expr import Expr
 from narwhals.translate import from_native, to_native
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from types import ModuleType
 
     from typing_extensions import TypeAlias, TypeIs
@@ -133,25 +134,39 @@ def concat(items: Iterable[FrameT], *, how: ConcatMethod = "vertical") -> FrameT
     """
     from narwhals.dependencies import is_narwhals_lazyframe
 
-    if not items:
+    iterator = iter(items)
+    first_item = next(iterator, None)
+    if first_item is None:
         msg = "No items to concatenate."
         raise ValueError(msg)
-    items = tuple(items)
-    validate_laziness(items)
     if how not in {"horizontal", "vertical", "diagonal"}:  # pragma: no cover
         msg = "Only vertical, horizontal and diagonal concatenations are supported."
         raise NotImplementedError(msg)
-    first_item = items[0]
-    if is_narwhals_lazyframe(first_item) and how == "horizontal":
-        msg = (
-            "Horizontal concatenation is not supported for LazyFrames.\n\n"
-            "Hint: you may want to use `join` instead."
+    if is_narwhals_lazyframe(first_item):
+        items = (first_item, *iterator)
+        validate_laziness(items)
+        if how == "horizontal":
+            msg = (
+                "Horizontal concatenation is not supported for LazyFrames.\n\n"
+                "Hint: you may want to use `join` instead."
+            )
+            raise InvalidOperationError(msg)
+        compliant_frames: Iterable[Any] = [df._compliant_frame for df in items]
+    else:
+        # Eager frames are handed over one at a time, so that an iterator of frames
+        # (e.g. a generator of chunks) is consumed as the backend concatenates it.
+        compliant_frames = (
+            df._compliant_frame for df in _iter_eager_items(first_item, iterator)
         )
-        raise InvalidOperationError(msg)
     plx = first_item.__narwhals_namespace__()
-    return first_item._with_compliant(
-        plx.concat([df._compliant_frame for df in items], how=how)
-    )
+    return first_item._with_compliant(plx.concat(compliant_frames, how=how))
+
+
+def _iter_eager_items(first_item: FrameT, items: Iterator[FrameT]) -> Iterator[FrameT]:
+    yield first_item
+    for item in items:
+        validate_laziness((first_item, item))
+        yield item
 
 
 def new_series(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-from narwhals._expression_parsing import is_scalar_like
+from narwhals._expression_parsing import common_subexpression_scope, is_scalar_like
 from narwhals._utils import tupleify
 from narwhals.exceptions import InvalidOperationError
 from narwhals.typing import DataFrameT
@@ -81,7 +81,9 @@ class GroupBy(Generic[DataFrameT]):
                 "but `df.group_by('a').agg(nw.col('b'))` is not."
             )
             raise InvalidOperationError(msg)
-        return self._df._with_compliant(self._grouped.agg(*compliant_aggs))
+        with common_subexpression_scope():
+            compliant_frame = self._grouped.agg(*compliant_aggs)
+        return self._df._with_compliant(compliant_frame)
 
     def __iter__(self) -> Iterator[tuple[Any, DataFrameT]]:
         yield from (
@@ -167,4 +169,6 @@ class LazyGroupBy(Generic[LazyFrameT]):
                 "but `df.group_by('a').agg(nw.col('b'))` is not."
             )
             raise InvalidOperationError(msg)
-        return self._df._with_compliant(self._grouped.agg(*compliant_aggs))
+        with common_subexpression_scope():
+            compliant_frame = self._grouped.agg(*compliant_aggs)
+        return self._df._with_compliant(compliant_frame)
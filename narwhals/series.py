@@ -2600,6 +2600,212 @@ class Series(Generic[IntoSeriesT]):
             )
         )
 
+    def rolling_min(
+        self, window_size: int, *, min_samples: int | None = None, center: bool = False
+    ) -> Self:
+        """Apply a rolling min (moving min) over the values.
+
+        A window of length `window_size` will traverse the values. The resulting values
+        will be aggregated to their min.
+
+        The window at a given row will include the row itself and the `window_size - 1`
+        elements before it.
+
+        Arguments:
+            window_size: The length of the window in number of elements. It must be a
+                strictly positive integer.
+            min_samples: The number of values in the window that should be non-null before
+                computing a result. If set to `None` (default), it will be set equal to
+                `window_size`. If provided, it must be a strictly positive integer, and
+                less than or equal to `window_size`
+            center: Set the labels at the center of the window.
+
+        Examples:
+            >>> import pandas as pd
+            >>> import narwhals as nw
+            >>>
+            >>> s_native = pd.Series([3.0, 1.0, 4.0, 2.0])
+            >>> nw.from_native(s_native, series_only=True).rolling_min(
+            ...     window_size=2
+            ... ).to_native()
+            0    NaN
+            1    1.0
+            2    1.0
+            3    2.0
+            dtype: float64
+        """
+        window_size, min_samples_int = _validate_rolling_arguments(
+            window_size=window_size, min_samples=min_samples
+        )
+
+        if len(self) == 0:  # pragma: no cover
+            return self
+
+        return self._with_compliant(
+            self._compliant_series.rolling_min(
+                window_size=window_size, min_samples=min_samples_int, center=center
+            )
+        )
+
+    def rolling_max(
+        self, window_size: int, *, min_samples: int | None = None, center: bool = False
+    ) -> Self:
+        """Apply a rolling max (moving max) over the values.
+
+        A window of length `window_size` will traverse the values. The resulting values
+        will be aggregated to their max.
+
+        The window at a given row will include the row itself and the `window_size - 1`
+        elements before it.
+
+        Arguments:
+            window_size: The length of the window in number of elements. It must be a
+                strictly positive integer.
+            min_samples: The number of values in the window that should be non-null before
+                computing a result. If set to `None` (default), it will be set equal to
+                `window_size`. If provided, it must be a strictly positive integer, and
+                less than or equal to `window_size`
+            center: Set the labels at the center of the window.
+
+        Examples:
+            >>> import pandas as pd
+            >>> import narwhals as nw
+            >>>
+            >>> s_native = pd.Series([3.0, 1.0, 4.0, 2.0])
+            >>> nw.from_native(s_native, series_only=True).rolling_max(
+            ...     window_size=2
+            ... ).to_native()
+            0    NaN
+            1    3.0
+            2    4.0
+            3    4.0
+            dtype: float64
+        """
+        window_size, min_samples_int = _validate_rolling_arguments(
+            window_size=window_size, min_samples=min_samples
+        )
+
+        if len(self) == 0:  # pragma: no cover
+            return self
+
+        return self._with_compliant(
+            self._compliant_series.rolling_max(
+                window_size=window_size, min_samples=min_samples_int, center=center
+            )
+        )
+
+    def rolling_median(
+        self, window_size: int, *, min_samples: int | None = None, center: bool = False
+    ) -> Self:
+        """Apply a rolling median (moving median) over the values.
+
+        A window of length `window_size` will traverse the values. The resulting values
+        will be aggregated to their median.
+
+        The window at a given row will include the row itself and the `window_size - 1`
+        elements before it.
+
+        Arguments:
+            window_size: The length of the window in number of elements. It must be a
+                strictly positive integer.
+            min_samples: The number of values in the window that should be non-null before
+                computing a result. If set to `None` (default), it will be set equal to
+                `window_size`. If provided, it must be a strictly positive integer, and
+                less than or equal to `window_size`
+            center: Set the labels at the center of the window.
+
+        Examples:
+            >>> import polars as pl
+            >>> import narwhals as nw
+            >>>
+            >>> s_native = pl.Series([3.0, 1.0, 4.0, 2.0])
+            >>> nw.from_native(s_native, series_only=True).rolling_median(
+            ...     window_size=3, min_samples=1
+            ... ).to_native()  # doctest:+NORMALIZE_WHITESPACE
+            shape: (4,)
+            Series: '' [f64]
+            [
+               3.0
+               2.0
+               3.0
+               2.0
+            ]
+        """
+        window_size, min_samples_int = _validate_rolling_arguments(
+            window_size=window_size, min_samples=min_samples
+        )
+
+        if len(self) == 0:  # pragma: no cover
+            return self
+
+        return self._with_compliant(
+            self._compliant_series.rolling_median(
+                window_size=window_size, min_samples=min_samples_int, center=center
+            )
+        )
+
+    def rolling_quantile(
+        self,
+        quantile: float,
+        interpolation: RollingInterpolationMethod,
+        window_size: int,
+        *,
+        min_samples: int | None = None,
+        center: bool = False,
+    ) -> Self:
+        """Apply a rolling quantile (moving quantile) over the values.
+
+        A window of length `window_size` will traverse the values. The resulting values
+        will be aggregated to their quantile.
+
+        The window at a given row will include the row itself and the `window_size - 1`
+        elements before it.
+
+        Note:
+            pandas and Polars may have implementation differences for a given interpolation method.
+
+        Arguments:
+            quantile: Quantile between 0.0 and 1.0.
+            interpolation: Interpolation method.
+            window_size: The length of the window in number of elements. It must be a
+                strictly positive integer.
+            min_samples: The number of values in the window that should be non-null before
+                computing a result. If set to `None` (default), it will be set equal to
+                `window_size`. If provided, it must be a strictly positive integer, and
+                less than or equal to `window_size`
+            center: Set the labels at the center of the window.
+
+        Examples:
+            >>> import pandas as pd
+            >>> import narwhals as nw
+            >>>
+            >>> s_native = pd.Series([3.0, 1.0, 4.0, 2.0])
+            >>> nw.from_native(s_native, series_only=True).rolling_quantile(
+            ...     0.75, "linear", window_size=3, min_samples=1
+            ... ).to_native()
+            0    3.0
+            1    2.5
+            2    3.5
+            3    3.0
+            dtype: float64
+        """
+        window_size, min_samples_int = _validate_rolling_arguments(
+            window_size=window_size, min_samples=min_samples
+        )
+
+        if len(self) == 0:  # pragma: no cover
+            return self
+
+        return self._with_compliant(
+            self._compliant_series.rolling_quantile(
+                quantile,
+                interpolation,
+                window_size,
+                min_samples=min_samples_int,
+                center=center,
+            )
+        )
+
     def __iter__(self) -> Iterator[Any]:
         yield from self._compliant_series.__iter__()
 
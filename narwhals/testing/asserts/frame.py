@@ -5,14 +5,17 @@ from typing import TYPE_CHECKING, Any
 from narwhals._utils import Implementation, qualified_type_name
 from narwhals.dataframe import DataFrame, LazyFrame
 from narwhals.dependencies import is_narwhals_dataframe, is_narwhals_lazyframe
+from narwhals.functions import col, concat, lit
 from narwhals.testing.asserts.series import assert_series_equal
 from narwhals.testing.asserts.utils import (
     raise_assertion_error,
     raise_frame_assertion_error,
 )
+from narwhals.translate import from_native
 
 if TYPE_CHECKING:
     from narwhals._typing import Arrow, IntoBackend, Pandas, Polars
+    from narwhals.series import Series
     from narwhals.typing import DataFrameT, LazyFrameT
 
 GUARANTEES_ROW_ORDER = {
@@ -46,7 +49,7 @@ def assert_frame_equal(
     Warning:
         1. In the case of backends that do not guarantee the row order, such as DuckDB,
             Ibis, PySpark, and SQLFrame, `check_row_order` argument is ignored and the
-            comparands are sorted by all the columns regardless.
+            rows are matched regardless of their order.
         2. In the case of lazy backends a [`collect(...)`](lazyframe.md#narwhals.dataframe.LazyFrame.collect)
             operation is triggered.
 
@@ -193,14 +196,28 @@ def _assert_dataframe_equal(
 
     left_schema = left.schema
     if (not check_row_order) or (impl not in GUARANTEES_ROW_ORDER):
+        # Rows with the exact same values are matched by their keys, so that only the
+        # remaining ones need to be sorted and compared (e.g. within tolerance).
+        if (keys := _row_keys(left, right)) is not None:
+            left_rows, right_rows = _unmatched_rows(*keys)
+            if not left_rows:
+                return
+            left, right = left[left_rows], right[right_rows]
+            if all(dtype.is_nested() for dtype in left_schema.dtypes()):
+                # Nested values can't be sorted, but the keys already tell these rows
+                # apart.
+                raise_frame_assertion_error(
+                    "rows do not match", left.rows(), right.rows()
+                )
+
         # !NOTE: Sort by all the non-nested dtypes columns.
         # See: https://github.com/narwhals-dev/narwhals/issues/2939
         # !WARNING: This might lead to wrong results if there are duplicate values in the
         # sorting columns as the final order might still be non fully deterministic.
         sort_by = [name for name, dtype in left_schema.items() if not dtype.is_nested()]
 
-        if not sort_by:
-            # If only nested dtypes are available, then we raise an exception.
+        if not sort_by:  # pragma: no cover
+            # Only nested dtypes, but the rows couldn't be keyed.
             msg = "`check_row_order=False` is not supported (yet) with only nested data type."
             raise NotImplementedError(msg)
 
@@ -231,6 +248,69 @@ def _assert_dataframe_equal(
             )
 
 
+def _row_keys(
+    left: DataFrameT, right: DataFrameT
+) -> tuple[Series[Any], Series[Any]] | None:
+    """Return a key for each row of `left` and `right`, equal for rows with equal values.
+
+    Polars hashes the rows natively, while other backends get exact codes computed
+    with PyArrow. Returns `None` if the rows cannot be keyed (e.g. PyArrow is missing,
+    or can't represent the values).
+    """
+    if left.implementation is Implementation.POLARS:
+        left_hash, right_hash = (
+            frame.to_native().hash_rows() for frame in (left, right.select(left.columns))
+        )
+        return (
+            from_native(left_hash, series_only=True),
+            from_native(right_hash, series_only=True),
+        )
+
+    try:
+        import pyarrow as pa  # ignore-banned-import
+    except ModuleNotFoundError:  # pragma: no cover
+        return None
+
+    from narwhals._arrow.utils import group_codes
+
+    try:
+        # pandas may add its index as a column, hence the `select`.
+        left_native, right_native = (
+            frame.to_arrow().select(left.columns) for frame in (left, right)
+        )
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        # e.g. pandas object columns holding values of mixed types.
+        return None
+    if left_native.schema != right_native.schema:
+        # Values with different data types are left to the element-wise comparison.
+        return None
+    codes = group_codes(*pa.concat_tables([left_native, right_native]).columns)
+    return (
+        from_native(pa.chunked_array([codes[: len(left)]]), series_only=True),
+        from_native(pa.chunked_array([codes[len(left) :]]), series_only=True),
+    )
+
+
+def _unmatched_rows(
+    left_keys: Series[Any], right_keys: Series[Any]
+) -> tuple[list[int], list[int]]:
+    """Return the positions of the rows whose key is not as frequent in both frames."""
+    key, count = "key", "count"
+    counts = concat(
+        [
+            left_keys.alias(key).to_frame().with_columns(lit(1).alias(count)),
+            right_keys.alias(key).to_frame().with_columns(lit(-1).alias(count)),
+        ]
+    )
+    unmatched = (
+        counts.group_by(key).agg(col(count).sum()).filter(col(count) != 0).get_column(key)
+    ).to_list()
+    return (
+        left_keys.is_in(unmatched).arg_true().to_list(),
+        right_keys.is_in(unmatched).arg_true().to_list(),
+    )
+
+
 def _check_schema_equal(
     left: DataFrameT, right: DataFrameT, *, check_dtypes: bool, check_column_order: bool
 ) -> None:
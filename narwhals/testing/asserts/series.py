@@ -237,20 +237,25 @@ def _check_list_like(
     right_dtype: List | Array,
     check_fn: CheckFn,
 ) -> None:
-    # Check row by row after transforming each array/list into a new series.
-    # Notice that order within the array/list must be the same, regardless of
-    # `check_order` value at the top level.
-    impl = left_vals.implementation
+    # Compare the list lengths once, then all the flattened values in a single call,
+    # which recurses for nested lists and structs. Notice that order within the
+    # array/list must be the same, regardless of `check_order` value at the top level.
+    left_lists = left_vals.cast(List(left_dtype.inner))
+    right_lists = right_vals.cast(List(right_dtype.inner))
+    if (left_lists.list.len() != right_lists.list.len()).any():
+        raise_series_assertion_error("nested value mismatch", left_vals, right_vals)
     try:
-        for left_val, right_val in zip_strict(left_vals, right_vals):
-            check_fn(
-                new_series("", values=left_val, dtype=left_dtype.inner, backend=impl),
-                new_series("", values=right_val, dtype=right_dtype.inner, backend=impl),
-            )
+        check_fn(_explode(left_lists), _explode(right_lists))
     except AssertionError:
         raise_series_assertion_error("nested value mismatch", left_vals, right_vals)
 
 
+def _explode(series: SeriesT) -> SeriesT:
+    # Under a fixed name, as (e.g. pandas) series may not have one.
+    name = "values"
+    return series.alias(name).to_frame().explode(name).get_column(name)
+
+
 def _check_struct(
     left_vals: SeriesT,
     right_vals: SeriesT,
@@ -28,6 +28,7 @@ if TYPE_CHECKING:
         "implementation mismatch",
         "in left, but not in right",
         "in right, but not in left",
+        "rows do not match",
         "value mismatch for column",
     ]
 
@@ -18,13 +18,7 @@ data = {
 
 
 @pytest.mark.parametrize("ignore_nulls", [False, True])
-def test_any_value_expr(
-    constructor: Constructor, request: pytest.FixtureRequest, *, ignore_nulls: bool
-) -> None:
-    if "dask" in str(constructor):
-        reason = "sample does not allow n, use frac instead"
-        request.applymarker(pytest.mark.xfail(reason=reason))
-
+def test_any_value_expr(constructor: Constructor, *, ignore_nulls: bool) -> None:
     df = nw.from_native(constructor(data))
 
     # Aggregation
@@ -86,9 +80,6 @@ def test_any_value_series(
 def test_any_value_group_by(
     constructor: Constructor, request: pytest.FixtureRequest, *, ignore_nulls: bool
 ) -> None:
-    if "dask" in str(constructor):
-        reason = "sample does not allow n, use frac instead"
-        request.applymarker(pytest.mark.xfail(reason=reason))
     if "pyarrow_table" in str(constructor) and PYARROW_VERSION < (14, 0):
         reason = "too old"
         pytest.skip(reason)
@@ -113,17 +104,14 @@ def test_any_value_group_by(
         values = result_collected["c"].to_list()
         assert values[0] == 1  # group a=1: [None, None, 1] -> 1
         assert values[1] == 2  # group a=2: [None, 2] -> 2
-        assert values[2] is None  # group a=3: [None] -> None regardless of ignore_nulls
+        # group a=3: [None] -> None regardless of ignore_nulls
+        assert result_collected["c"].is_null()[2]
 
 
 @pytest.mark.parametrize("ignore_nulls", [False, True])
 def test_any_value_over(
     constructor: Constructor, request: pytest.FixtureRequest, *, ignore_nulls: bool
 ) -> None:
-    if "dask" in str(constructor):
-        reason = "sample does not allow n, use frac instead"
-        request.applymarker(pytest.mark.xfail(reason=reason))
-
     if "duckdb" in str(constructor) and DUCKDB_VERSION < (1, 3):
         reason = "`over` requires DuckDB 1.3.0"
         pytest.skip(reason=reason)
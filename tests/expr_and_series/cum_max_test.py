@@ -41,9 +41,6 @@ def test_lazy_cum_max_grouped(
     reverse: bool,
     expected_a: list[int],
 ) -> None:
-    if "pyarrow_table" in str(constructor):
-        # grouped window functions not yet supported
-        request.applymarker(pytest.mark.xfail)
     if "modin" in str(constructor):
         pytest.skip(reason="probably bugged")
     if "dask" in str(constructor):
@@ -78,9 +75,6 @@ def test_lazy_cum_max_ordered_by_nulls(
     reverse: bool,
     expected_a: list[int],
 ) -> None:
-    if "pyarrow_table" in str(constructor):
-        # grouped window functions not yet supported
-        request.applymarker(pytest.mark.xfail)
     if "modin" in str(constructor):
         pytest.skip(reason="probably bugged")
     if "dask" in str(constructor):
@@ -120,15 +114,8 @@ def test_lazy_cum_max_ordered_by_nulls(
     ("reverse", "expected_a"), [(False, [2, 2, 3]), (True, [3, 3, 3])]
 )
 def test_lazy_cum_max_ungrouped(
-    constructor: Constructor,
-    request: pytest.FixtureRequest,
-    *,
-    reverse: bool,
-    expected_a: list[int],
+    constructor: Constructor, *, reverse: bool, expected_a: list[int]
 ) -> None:
-    if "dask" in str(constructor) and reverse:
-        # https://github.com/dask/dask/issues/11802
-        request.applymarker(pytest.mark.xfail)
     if "modin" in str(constructor):
         pytest.skip(reason="probably bugged")
     if ("polars" in str(constructor) and POLARS_VERSION < (1, 9)) or (
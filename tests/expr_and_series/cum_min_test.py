@@ -43,9 +43,6 @@ def test_lazy_cum_min_grouped(
     reverse: bool,
     expected_a: list[int],
 ) -> None:
-    if "pyarrow_table" in str(constructor):
-        # grouped window functions not yet supported
-        request.applymarker(pytest.mark.xfail)
     if "modin" in str(constructor):
         pytest.skip(reason="probably bugged")
     if "dask" in str(constructor):
@@ -80,9 +77,6 @@ def test_lazy_cum_min_ordered_by_nulls(
     reverse: bool,
     expected_a: list[int],
 ) -> None:
-    if "pyarrow_table" in str(constructor):
-        # grouped window functions not yet supported
-        request.applymarker(pytest.mark.xfail)
     if "modin" in str(constructor):
         pytest.skip(reason="probably bugged")
     if "pandas_nullable" in str(constructor):
@@ -128,15 +122,8 @@ def test_lazy_cum_min_ordered_by_nulls(
     ("reverse", "expected_a"), [(False, [1, 2, 1]), (True, [1, 1, 3])]
 )
 def test_lazy_cum_min_ungrouped(
-    constructor: Constructor,
-    request: pytest.FixtureRequest,
-    *,
-    reverse: bool,
-    expected_a: list[int],
+    constructor: Constructor, *, reverse: bool, expected_a: list[int]
 ) -> None:
-    if "dask" in str(constructor) and reverse:
-        # https://github.com/dask/dask/issues/11802
-        request.applymarker(pytest.mark.xfail)
     if "modin" in str(constructor):
         pytest.skip(reason="probably bugged")
     if ("polars" in str(constructor) and POLARS_VERSION < (1, 9)) or (
@@ -164,7 +151,7 @@ def test_lazy_cum_min_ungrouped_ordered_by_nulls(
     reverse: bool,
     expected_a: list[int],
 ) -> None:
-    if "dask" in str(constructor):
+    if "dask" in str(constructor) and not reverse:
         # https://github.com/dask/dask/issues/11806
         request.applymarker(pytest.mark.xfail)
     if "modin" in str(constructor):
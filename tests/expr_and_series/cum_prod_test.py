@@ -54,9 +54,6 @@ def test_lazy_cum_prod_grouped(
     reverse: bool,
     expected_a: list[int],
 ) -> None:
-    if "pyarrow_table" in str(constructor):
-        # grouped window functions not yet supported
-        request.applymarker(pytest.mark.xfail)
     if "modin" in str(constructor):
         pytest.skip(reason="probably bugged")
     if "dask" in str(constructor):
@@ -36,9 +36,6 @@ def test_lazy_cum_sum_grouped(
     reverse: bool,
     expected_a: list[int],
 ) -> None:
-    if "pyarrow_table" in str(constructor):
-        # grouped window functions not yet supported
-        request.applymarker(pytest.mark.xfail)
     if "dask" in str(constructor):
         # https://github.com/dask/dask/issues/11806
         request.applymarker(pytest.mark.xfail)
@@ -83,9 +80,6 @@ def test_lazy_cum_sum_ordered_by_nulls(
     reverse: bool,
     expected_a: list[int],
 ) -> None:
-    if "pyarrow_table" in str(constructor):
-        # grouped window functions not yet supported
-        request.applymarker(pytest.mark.xfail)
     if "dask" in str(constructor):
         # https://github.com/dask/dask/issues/11806
         request.applymarker(pytest.mark.xfail)
@@ -129,15 +123,8 @@ def test_lazy_cum_sum_ordered_by_nulls(
     ("reverse", "expected_a"), [(False, [3, 2, 6]), (True, [4, 6, 3])]
 )
 def test_lazy_cum_sum_ungrouped(
-    constructor: Constructor,
-    request: pytest.FixtureRequest,
-    *,
-    reverse: bool,
-    expected_a: list[int],
+    constructor: Constructor, *, reverse: bool, expected_a: list[int]
 ) -> None:
-    if "dask" in str(constructor) and reverse:
-        # https://github.com/dask/dask/issues/11802
-        request.applymarker(pytest.mark.xfail)
     if ("polars" in str(constructor) and POLARS_VERSION < (1, 9)) or (
         "duckdb" in str(constructor) and DUCKDB_VERSION < (1, 3)
     ):
@@ -222,3 +209,28 @@ def test_shift_cum_sum(constructor_eager: ConstructorEager) -> None:
         "kalimantan": [None, 1, 3, 6, 10],
     }
     assert_equal_data(result, expected)
+
+
+def test_reverse_cumulative_dask_many_partitions() -> None:
+    pytest.importorskip("dask")
+    import dask.dataframe as dd
+
+    data = {"a": [2, None, 1, 4, None, None, 3, 1], "i": list(range(8))}
+    df = nw.from_native(dd.from_dict(data, npartitions=4))
+    result = df.select(
+        "i",
+        cum_sum=nw.col("a").cum_sum(reverse=True).over(order_by="i"),
+        cum_count=nw.col("a").cum_count(reverse=True).over(order_by="i"),
+        cum_min=nw.col("a").cum_min(reverse=True).over(order_by="i"),
+        cum_max=nw.col("a").cum_max(reverse=True).over(order_by="i"),
+        cum_prod=nw.col("a").cum_prod(reverse=True).over(order_by="i"),
+    ).sort("i")
+    expected = {
+        "i": list(range(8)),
+        "cum_sum": [11, None, 9, 8, None, None, 4, 1],
+        "cum_count": [5, 4, 4, 3, 2, 2, 2, 1],
+        "cum_min": [1, None, 1, 1, None, None, 1, 1],
+        "cum_max": [4, None, 4, 4, None, None, 3, 1],
+        "cum_prod": [24, None, 12, 12, None, None, 3, 1],
+    }
+    assert_equal_data(result, expected)
@@ -52,7 +52,7 @@ def test_diff_lazy_grouped(
         pytest.skip()
     if "duckdb" in str(constructor) and DUCKDB_VERSION < (1, 3):
         pytest.skip()
-    if any(x in str(constructor) for x in ("dask", "pyarrow_table", "cudf")):
+    if any(x in str(constructor) for x in ("dask", "cudf")):
         # https://github.com/dask/dask/issues/11806
         # https://github.com/rapidsai/cudf/issues/18160
         # wooah their issue numbers use exactly the same digits but in a different order
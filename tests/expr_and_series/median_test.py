@@ -19,11 +19,7 @@ data = {
 @pytest.mark.parametrize(
     "expr", [nw.col("a", "b", "z").median(), nw.median("a", "b", "z")]
 )
-def test_median_expr(
-    constructor: Constructor, expr: nw.Expr, request: pytest.FixtureRequest
-) -> None:
-    if "dask_lazy_p2" in str(constructor):
-        request.applymarker(pytest.mark.xfail)
+def test_median_expr(constructor: Constructor, expr: nw.Expr) -> None:
     df = nw.from_native(constructor(data))
     result = df.select(expr)
     expected = {"a": [3.0], "b": [5.0], "z": [8.0]}
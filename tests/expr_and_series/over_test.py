@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from contextlib import nullcontext as does_not_raise
+from typing import Any
 
 import pytest
 
@@ -102,8 +103,6 @@ def test_over_multiple(constructor: Constructor) -> None:
 def test_over_cumsum(
     request: pytest.FixtureRequest, constructor_eager: ConstructorEager
 ) -> None:
-    if "pyarrow_table" in str(constructor_eager):
-        request.applymarker(pytest.mark.xfail)
     if "pandas_pyarrow" in str(constructor_eager) and PANDAS_VERSION < (2, 1):
         request.applymarker(pytest.mark.xfail)
     if "cudf" in str(constructor_eager):
@@ -130,8 +129,6 @@ def test_over_cumsum(
 def test_over_cumcount(
     request: pytest.FixtureRequest, constructor_eager: ConstructorEager
 ) -> None:
-    if "pyarrow_table" in str(constructor_eager):
-        request.applymarker(pytest.mark.xfail)
     if "cudf" in str(constructor_eager):
         # https://github.com/rapidsai/cudf/issues/18159
         request.applymarker(pytest.mark.xfail)
@@ -156,8 +153,6 @@ def test_over_cumcount(
 def test_over_cummax(
     request: pytest.FixtureRequest, constructor_eager: ConstructorEager
 ) -> None:
-    if "pyarrow_table" in str(constructor_eager):
-        request.applymarker(pytest.mark.xfail)
     if "pandas_pyarrow" in str(constructor_eager) and PANDAS_VERSION < (2, 1):
         request.applymarker(pytest.mark.xfail)
     if "cudf" in str(constructor_eager):
@@ -182,8 +177,6 @@ def test_over_cummax(
 def test_over_cummin(
     request: pytest.FixtureRequest, constructor_eager: ConstructorEager
 ) -> None:
-    if "pyarrow_table" in str(constructor_eager):
-        request.applymarker(pytest.mark.xfail)
     if "pandas_pyarrow" in str(constructor_eager) and PANDAS_VERSION < (2, 1):
         request.applymarker(pytest.mark.xfail)
     if "cudf" in str(constructor_eager):
@@ -210,8 +203,6 @@ def test_over_cummin(
 def test_over_cumprod(
     request: pytest.FixtureRequest, constructor_eager: ConstructorEager
 ) -> None:
-    if "pyarrow_table" in str(constructor_eager):
-        request.applymarker(pytest.mark.xfail)
     if "pandas_pyarrow" in str(constructor_eager) and PANDAS_VERSION < (2, 1):
         request.applymarker(pytest.mark.xfail)
     if "cudf" in str(constructor_eager):
@@ -243,9 +234,7 @@ def test_over_anonymous_cumulative(
         request.applymarker(pytest.mark.xfail)
     df = nw.from_native(constructor_eager({"": [1, 1, 2], "b": [4, 5, 6]}))
     context = (
-        pytest.raises(NotImplementedError)
-        if df.implementation.is_pyarrow()
-        else pytest.raises(KeyError)  # type: ignore[arg-type]
+        pytest.raises(KeyError)  # type: ignore[arg-type]
         if df.implementation.is_modin()
         or (df.implementation.is_pandas() and PANDAS_VERSION < (1, 3))
         # TODO(unassigned): bug in old pandas + modin.
@@ -317,8 +306,6 @@ def test_over_unsupported_dask() -> None:
 def test_over_shift(
     request: pytest.FixtureRequest, constructor_eager: ConstructorEager
 ) -> None:
-    if "pyarrow_table" in str(constructor_eager):
-        request.applymarker(pytest.mark.xfail)
     if "cudf" in str(constructor_eager):
         # https://github.com/rapidsai/cudf/issues/18159
         request.applymarker(pytest.mark.xfail)
@@ -337,8 +324,6 @@ def test_over_shift(
 def test_over_diff(
     request: pytest.FixtureRequest, constructor_eager: ConstructorEager
 ) -> None:
-    if "pyarrow_table" in str(constructor_eager):
-        request.applymarker(pytest.mark.xfail)
     if "cudf" in str(constructor_eager):
         # https://github.com/rapidsai/cudf/issues/18159
         request.applymarker(pytest.mark.xfail)
@@ -370,8 +355,6 @@ def test_over_cum_reverse(
     attr: str,
     expected_b: list[object],
 ) -> None:
-    if "pyarrow_table" in str(constructor_eager):
-        request.applymarker(pytest.mark.xfail)
     if (
         "pandas_nullable" in str(constructor_eager)
         and attr in {"cum_max", "cum_min"}
@@ -472,13 +455,8 @@ def test_over_quantile(constructor: Constructor, request: pytest.FixtureRequest)
     data = {"a": [1, 2, 3, 4, 5, 6], "b": ["x", "x", "x", "y", "y", "y"]}
 
     quantile_expr = nw.col("a").quantile(quantile=0.5, interpolation="linear")
-    native_frame = constructor(data)
-
-    if "dask" in str(constructor):
-        native_frame = native_frame.repartition(npartitions=1)  # type: ignore[union-attr]
-
     result = (
-        nw.from_native(native_frame)
+        nw.from_native(constructor(data))
         .with_columns(
             quantile_over_b=quantile_expr.over("b"), quantile_global=quantile_expr
         )
@@ -588,3 +566,64 @@ def test_over_when_then_aggregation_partition_by(
     result = df.select("a", "b", c=expr).sort("b")
     expected = {"a": [1, 1, None, 3, 3], "b": [1, 3, 4, 5, 6], "c": expected_c}
     assert_equal_data(result, expected)
+
+
+def test_over_shared_window(
+    constructor_eager: ConstructorEager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    native = df.to_native()
+    n_groupbys = 0
+    if "pandas" in str(constructor_eager):
+        groupby = type(native).groupby
+
+        def counting_groupby(self: Any, *args: Any, **kwargs: Any) -> Any:
+            nonlocal n_groupbys
+            n_groupbys += 1
+            return groupby(self, *args, **kwargs)
+
+        monkeypatch.setattr(type(native), "groupby", counting_groupby)
+    result = df.with_columns(
+        b_sum=nw.col("b").sum().over("a"),
+        c_max=nw.col("c").max().over("a"),
+        diff=nw.col("b").min().over("a") - nw.col("c").min().over("a"),
+        b_cum_sum=nw.col("b").cum_sum().over("a", order_by="i"),
+        c_shift=nw.col("c").shift(1).over("a", order_by="i"),
+    ).sort("i")
+    expected = {
+        **data,
+        "b_sum": [3, 3, 11, 11, 11],
+        "c_max": [5, 5, 3, 3, 3],
+        "diff": [-3, -3, 2, 2, 2],
+        "b_cum_sum": [1, 3, 3, 8, 11],
+        "c_shift": [None, 5, None, 3, 2],
+    }
+    assert_equal_data(result, expected)
+    if "pandas" in str(constructor_eager):
+        # One grouping for each of the two distinct `(partition_by, order_by)`.
+        assert n_groupbys == 2
+
+
+def test_over_partitions_of_different_magnitudes(
+    constructor_eager: ConstructorEager,
+) -> None:
+    # Large values in one partition mustn't swamp small ones in another.
+    data = {
+        "g": ["a", "a", "b", "b", "b"],
+        "x": [1e20, 1e20, 1, 2, 3],
+        "i": list(range(5)),
+    }
+    df = nw.from_native(constructor_eager(data))
+    result = df.select(
+        "i",
+        cum_sum=nw.col("x").cum_sum().over("g", order_by="i"),
+        cum_sum_reverse=nw.col("x").cum_sum(reverse=True).over("g", order_by="i"),
+        rolling_var=nw.col("x").rolling_var(2).over("g", order_by="i"),
+    ).sort("i")
+    expected = {
+        "i": [0, 1, 2, 3, 4],
+        "cum_sum": [1e20, 2e20, 1, 3, 6],
+        "cum_sum_reverse": [2e20, 1e20, 6, 5, 3],
+        "rolling_var": [None, 0, None, 0.5, 0.5],
+    }
+    assert_equal_data(result, expected)
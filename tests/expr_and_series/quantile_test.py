@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import re
-from contextlib import nullcontext as does_not_raise
 from typing import Literal
 
 import pytest
@@ -28,7 +26,7 @@ def test_quantile_expr(
     request: pytest.FixtureRequest,
 ) -> None:
     if (
-        any(x in str(constructor) for x in ("dask", "duckdb", "ibis"))
+        any(x in str(constructor) for x in ("duckdb", "ibis"))
         and interpolation != "linear"
     ) or "pyspark" in str(constructor):
         request.applymarker(pytest.mark.xfail)
@@ -38,18 +36,8 @@ def test_quantile_expr(
     df_raw = constructor(data)
     df = nw.from_native(df_raw)
 
-    msg = re.escape(
-        "`Expr.quantile` is not supported for Dask backend with multiple partitions."
-    )
-    context = (
-        pytest.raises(NotImplementedError, match=msg)
-        if "dask_lazy_p2" in str(constructor)
-        else does_not_raise()
-    )
-
-    with context:
-        result = df.select(nw.all().quantile(quantile=q, interpolation=interpolation))
-        assert_equal_data(result, expected)
+    result = df.select(nw.all().quantile(quantile=q, interpolation=interpolation))
+    assert_equal_data(result, expected)
 
 
 @pytest.mark.parametrize(
@@ -75,3 +63,15 @@ def test_quantile_series(
     ].alias("a")
     result = series.quantile(quantile=q, interpolation=interpolation)
     assert_equal_data({"a": [result]}, {"a": [expected]})
+
+
+@pytest.mark.parametrize(("q", "expected"), [(0.5, 1.0), (0.75, 1.75), (0.8, 2.0)])
+def test_quantile_expr_ties(
+    constructor: Constructor, q: float, expected: float, request: pytest.FixtureRequest
+) -> None:
+    if "pyspark" in str(constructor):
+        request.applymarker(pytest.mark.xfail)
+    data = {"a": [1, 1, 1, 1, 2, 2, 3, 1, 1, 1]}
+    df = nw.from_native(constructor(data))
+    result = df.select(nw.col("a").quantile(quantile=q, interpolation="linear"))
+    assert_equal_data(result, {"a": [expected]})
@@ -41,12 +41,19 @@ expected_desc = {
     "ordinal": [3, 1, 4, 5, None, 2],
 }
 
+# Ties within the groups of `b`, which `ordinal` breaks in the order of the rows.
+data_over = {
+    "a": [3.1, 6.1, 1.5, 1.5, None, 6.1, 3.1, 1.5],
+    "b": [1, 1, 2, 1, 2, 2, 1, 2],
+    "i": [1, 2, 3, 4, 5, 6, 7, 8],
+}
+
 expected_over = {
-    "average": [2.0, 3.0, 1.0, 1.0, None, 2.0],
-    "min": [2, 3, 1, 1, None, 2],
-    "max": [2, 3, 1, 1, None, 2],
-    "dense": [2, 3, 1, 1, None, 2],
-    "ordinal": [2, 3, 1, 1, None, 2],
+    "average": [2.5, 4.0, 1.5, 1.0, None, 3.0, 2.5, 1.5],
+    "min": [2, 4, 1, 1, None, 3, 2, 1],
+    "max": [3, 4, 2, 1, None, 3, 3, 2],
+    "dense": [2, 3, 1, 1, None, 2, 2, 1],
+    "ordinal": [2, 4, 1, 1, None, 3, 3, 2],
 }
 
 expected_over_desc = {
@@ -155,19 +162,18 @@ def test_rank_expr_in_over_context(
     ):
         # https://github.com/pandas-dev/pandas/issues/61896
         pytest.skip()
-    if any(x in str(constructor) for x in ("pyarrow_table", "dask", "cudf")):
-        # Pyarrow raises:
-        # > pyarrow.lib.ArrowKeyError: No function registered with name: hash_rank
-        # We can handle that to provide a better error message.
-        # cudf: https://github.com/rapidsai/cudf/issues/18159
+    if "cudf" in str(constructor):
+        # https://github.com/rapidsai/cudf/issues/18159
         request.applymarker(pytest.mark.xfail)
+    if "pyarrow_table" in str(constructor) and method == "average":
+        request.applymarker(pytest.mark.xfail(raises=ValueError))
 
     if "pandas_pyarrow" in str(constructor) and PANDAS_VERSION < (2, 1):
         pytest.skip(reason="bug in old version")
     if "duckdb" in str(constructor) and DUCKDB_VERSION < (1, 3):
         pytest.skip(reason="too old version")
 
-    df = nw.from_native(constructor(data_float))
+    df = nw.from_native(constructor(data_over))
 
     result = (
         df.with_columns(a=nw.col("a").rank(method=method).over("b")).sort("i").select("a")
@@ -195,7 +201,6 @@ def test_invalid_method_raise(constructor_eager: ConstructorEager) -> None:
 @pytest.mark.parametrize("method", rank_methods)
 @pytest.mark.parametrize("data", [data_int, data_float])
 def test_lazy_rank_expr(
-    request: pytest.FixtureRequest,
     constructor: Constructor,
     method: Literal["average", "min", "max", "dense", "ordinal"],
     data: dict[str, list[float]],
@@ -216,10 +221,6 @@ def test_lazy_rank_expr(
     if "duckdb" in str(constructor) and DUCKDB_VERSION < (1, 3):
         pytest.skip()
 
-    if "dask" in str(constructor):
-        # `rank` is not implemented in Dask
-        request.applymarker(pytest.mark.xfail)
-
     context = (
         pytest.raises(
             ValueError,
@@ -240,7 +241,6 @@ def test_lazy_rank_expr(
 @pytest.mark.parametrize("method", rank_methods)
 @pytest.mark.parametrize("data", [data_int, data_float])
 def test_lazy_rank_expr_desc(
-    request: pytest.FixtureRequest,
     constructor: Constructor,
     method: Literal["average", "min", "max", "dense", "ordinal"],
     data: dict[str, list[float]],
@@ -261,10 +261,6 @@ def test_lazy_rank_expr_desc(
     if "duckdb" in str(constructor) and DUCKDB_VERSION < (1, 3):
         pytest.skip()
 
-    if "dask" in str(constructor):
-        # `rank` is not implemented in Dask
-        request.applymarker(pytest.mark.xfail)
-
     context = (
         pytest.raises(
             ValueError,
@@ -298,12 +294,11 @@ def test_rank_expr_in_over_desc(
     ):
         # https://github.com/pandas-dev/pandas/issues/61896
         pytest.skip()
-    if any(x in str(constructor) for x in ("pyarrow_table", "dask", "cudf")):
-        # Pyarrow raises:
-        # > pyarrow.lib.ArrowKeyError: No function registered with name: hash_rank
-        # We can handle that to provide a better error message.
-        # cudf: https://github.com/rapidsai/cudf/issues/18159
+    if "cudf" in str(constructor):
+        # https://github.com/rapidsai/cudf/issues/18159
         request.applymarker(pytest.mark.xfail)
+    if "pyarrow_table" in str(constructor) and method == "average":
+        request.applymarker(pytest.mark.xfail(raises=ValueError))
 
     if "pandas_pyarrow" in str(constructor) and PANDAS_VERSION < (2, 1):
         pytest.skip(reason="bug in old version")
@@ -331,8 +326,8 @@ def test_rank_with_order_by(
         # https://github.com/pandas-dev/pandas/issues/61896
         pytest.skip()
     if "dask" in str(constructor):
-        # `rank` is not implemented in Dask
-        request.applymarker(pytest.mark.xfail)
+        reason = "Dask's `sort_values` doesn't put nulls first across partitions"
+        request.applymarker(pytest.mark.xfail(reason=reason))
     if "pandas_pyarrow" in str(constructor) and PANDAS_VERSION < (2, 1):
         pytest.skip(reason="bug in old version")
     if "polars" in str(constructor) and POLARS_VERSION < (1, 10):
@@ -384,9 +379,8 @@ def test_rank_with_order_by_and_partition_by(
     ):
         # https://github.com/pandas-dev/pandas/issues/61896
         pytest.skip()
-    if any(x in str(constructor) for x in ("dask", "pyarrow_table", "cudf")):
+    if any(x in str(constructor) for x in ("dask", "cudf")):
         # `rank` is not implemented in Dask
-        # pyarrow only supports aggregations in `over(partition_by=...)`
         # cudf: https://github.com/rapidsai/cudf/issues/18159
         request.applymarker(pytest.mark.xfail)
     if "pandas_pyarrow" in str(constructor) and PANDAS_VERSION < (2, 1):
@@ -423,3 +417,34 @@ def test_rank_with_order_by_and_partition_by(
             "c": [2, 1, 3, 1, 2, 3],
         }
         assert_equal_data(result, expected)
+
+
+@pytest.mark.parametrize("method", rank_methods)
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("npartitions", [5, 14])
+def test_rank_dask_many_partitions(
+    method: Literal["average", "min", "max", "dense", "ordinal"],
+    *,
+    descending: bool,
+    npartitions: int,
+) -> None:
+    pytest.importorskip("dask")
+    import dask.dataframe as dd
+    import pandas as pd
+
+    values = [3, 6, 1, 1, None, 6, 2, 1, 6, None, 3, 3, 8, 1]
+    pd_method = "first" if method == "ordinal" else method
+    expected = pd.Series(values, dtype="float64").rank(
+        method=pd_method, ascending=not descending
+    )
+    df = nw.from_native(
+        dd.from_dict(
+            {"a": values, "i": list(range(len(values)))}, npartitions=npartitions
+        )
+    )
+    result = (
+        df.with_columns(nw.col("a").rank(method=method, descending=descending))
+        .sort("i")
+        .select("a")
+    )
+    assert_equal_data(result, {"a": expected.tolist()})
@@ -124,7 +124,7 @@ def test_rolling_mean_expr_lazy_grouped(
         pytest.skip()
     if "pandas" in str(constructor):
         pytest.skip()
-    if any(x in str(constructor) for x in ("dask", "pyarrow_table")):
+    if "dask" in str(constructor):
         request.applymarker(pytest.mark.xfail)
     if "modin" in str(constructor):
         # unreliable
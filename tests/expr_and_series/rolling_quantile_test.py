@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from typing import Any, Literal
+
+import pytest
+
+import narwhals as nw
+from tests.utils import (
+    DUCKDB_VERSION,
+    POLARS_VERSION,
+    Constructor,
+    ConstructorEager,
+    assert_equal_data,
+)
+
+data = {"a": [None, 1, 2, None, 4, 6, 11]}
+
+kwargs = {
+    "x1": {"window_size": 3, "min_samples": 1},
+    "x2": {"window_size": 4, "min_samples": 1, "center": True},
+}
+expected_by_interpolation: dict[str, dict[str, list[Any]]] = {
+    "linear": {
+        "x1": [None, 1.0, 1.3, 1.3, 2.6, 4.6, 5.2],
+        "x2": [1.0, 1.3, 1.3, 1.6, 3.2, 5.2, 5.2],
+    },
+    "lower": {"x1": [None, 1, 1, 1, 2, 4, 4], "x2": [1, 1, 1, 1, 2, 4, 4]},
+    "higher": {"x1": [None, 1, 2, 2, 4, 6, 6], "x2": [1, 2, 2, 2, 4, 6, 6]},
+    "nearest": {"x1": [None, 1, 1, 1, 2, 4, 6], "x2": [1, 1, 1, 2, 4, 6, 6]},
+    "midpoint": {
+        "x1": [None, 1.0, 1.5, 1.5, 3.0, 5.0, 5.0],
+        "x2": [1.0, 1.5, 1.5, 1.5, 3.0, 5.0, 5.0],
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "interpolation", ["linear", "lower", "higher", "nearest", "midpoint"]
+)
+def test_rolling_quantile_expr(
+    constructor_eager: ConstructorEager,
+    interpolation: Literal["nearest", "higher", "lower", "midpoint", "linear"],
+) -> None:
+    df = nw.from_native(constructor_eager(data))
+    result = df.select(
+        **{
+            name: nw.col("a").rolling_quantile(0.3, interpolation, **values)
+            for name, values in kwargs.items()
+        }
+    )
+    assert_equal_data(result, expected_by_interpolation[interpolation])
+
+
+@pytest.mark.parametrize(
+    "interpolation", ["linear", "lower", "higher", "nearest", "midpoint"]
+)
+def test_rolling_quantile_series(
+    constructor_eager: ConstructorEager,
+    interpolation: Literal["nearest", "higher", "lower", "midpoint", "linear"],
+) -> None:
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.select(
+        **{
+            name: df["a"].rolling_quantile(0.3, interpolation, **values)
+            for name, values in kwargs.items()
+        }
+    )
+    assert_equal_data(result, expected_by_interpolation[interpolation])
+
+
+@pytest.mark.parametrize("window_size", [1, 7, 100])
+@pytest.mark.parametrize("center", [True, False])
+@pytest.mark.parametrize(
+    "interpolation", ["linear", "lower", "higher", "nearest", "midpoint"]
+)
+def test_rolling_quantile_long_series(
+    window_size: int,
+    interpolation: Literal["nearest", "higher", "lower", "midpoint", "linear"],
+    *,
+    center: bool,
+) -> None:
+    # Long enough for windows to cross the blocks which PyArrow's kernel uses.
+    pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+    rng = np.random.default_rng(0)
+    s = pd.Series(rng.integers(0, 50, 1000), dtype="float64")
+    s[rng.random(1000) < 0.1] = None
+    expected = (
+        s.rolling(window=window_size, center=center, min_periods=1)
+        .quantile(0.32, interpolation=interpolation)
+        .to_frame("a")
+    )
+    result = nw.from_native(pa.table({"a": s})).select(
+        nw.col("a").rolling_quantile(
+            0.32, interpolation, window_size, center=center, min_samples=1
+        )
+    )
+    expected_dict = nw.from_native(expected, eager_only=True).to_dict(as_series=False)
+    assert_equal_data(result, expected_dict)
+
+
+@pytest.mark.parametrize(
+    ("expected_a", "window_size", "min_samples", "center"),
+    [
+        ([None, None, 1.3, None, None, 4.6, 7.5], 2, None, False),
+        ([None, None, 1.3, None, None, 4.6, 7.5], 2, 2, False),
+        ([None, None, 1.3, 1.3, None, 4.6, 5.2], 3, 2, False),
+        ([1, None, 1.3, 1.3, 4, 4.6, 5.2], 3, 1, False),
+        ([1.3, 1, 1.3, 2, 4.6, 5.2, 7.5], 3, 1, True),
+        ([1.3, 1, 1.3, 1.3, 4.6, 5.2, 5.2], 4, 1, True),
+        ([1.3, 1.3, 1.3, 1.3, 5.2, 5.2, 5.2], 5, 1, True),
+    ],
+)
+def test_rolling_quantile_expr_lazy_grouped(
+    constructor: Constructor,
+    expected_a: list[float],
+    window_size: int,
+    min_samples: int,
+    request: pytest.FixtureRequest,
+    *,
+    center: bool,
+) -> None:
+    if ("polars" in str(constructor) and POLARS_VERSION < (1, 10)) or (
+        "duckdb" in str(constructor) and DUCKDB_VERSION < (1, 3)
+    ):
+        pytest.skip()
+    if "pandas" in str(constructor):
+        pytest.skip()
+    if any(x in str(constructor) for x in ("dask", "pyspark", "sqlframe")):
+        request.applymarker(pytest.mark.xfail)
+    if "modin" in str(constructor):
+        # unreliable
+        pytest.skip()
+    data = {
+        "a": [1, None, 2, None, 4, 6, 11],
+        "g": [1, 1, 1, 1, 2, 2, 2],
+        "b": [1, None, 2, 3, 4, 5, 6],
+        "i": list(range(7)),
+    }
+    df = nw.from_native(constructor(data))
+    result = (
+        df.with_columns(
+            nw.col("a")
+            .rolling_quantile(
+                0.3, "linear", window_size, min_samples=min_samples, center=center
+            )
+            .over("g", order_by="b")
+        )
+        .sort("i")
+        .select("a")
+    )
+    expected = {"a": expected_a}
+    assert_equal_data(result, expected)
+
+
+@pytest.mark.parametrize(
+    ("expected_a", "window_size", "min_samples", "center"),
+    [
+        ([None, None, 1.3, None, None, 4.6, 7.5], 2, None, False),
+        ([None, None, 1.3, None, None, 4.6, 7.5], 2, 2, False),
+        ([None, None, 1.3, 1.3, 2.6, 4.6, 5.2], 3, 2, False),
+        ([1, None, 1.3, 1.3, 2.6, 4.6, 5.2], 3, 1, False),
+        ([1.3, 1, 1.3, 2.6, 4.6, 5.2, 7.5], 3, 1, True),
+        ([1.3, 1, 1.3, 1.6, 3.2, 5.2, 5.2], 4, 1, True),
+        ([1.3, 1.3, 1.6, 1.9, 3.8, 5.2, 5.2], 5, 1, True),
+    ],
+)
+def test_rolling_quantile_expr_lazy_ungrouped(
+    constructor: Constructor,
+    expected_a: list[float],
+    window_size: int,
+    min_samples: int,
+    request: pytest.FixtureRequest,
+    *,
+    center: bool,
+) -> None:
+    if ("polars" in str(constructor) and POLARS_VERSION < (1, 10)) or (
+        "duckdb" in str(constructor) and DUCKDB_VERSION < (1, 3)
+    ):
+        pytest.skip()
+    if any(x in str(constructor) for x in ("pyspark", "sqlframe")):
+        request.applymarker(pytest.mark.xfail)
+    if "modin" in str(constructor):
+        # unreliable
+        pytest.skip()
+    data = {
+        "a": [1, None, 2, None, 4, 6, 11],
+        "b": [1, None, 2, 3, 4, 5, 6],
+        "i": list(range(7)),
+    }
+    df = nw.from_native(constructor(data))
+    result = (
+        df.with_columns(
+            nw.col("a")
+            .rolling_quantile(
+                0.3, "linear", window_size, min_samples=min_samples, center=center
+            )
+            .over(order_by="b")
+        )
+        .select("a", "i")
+        .sort("i")
+    )
+    expected = {"a": expected_a, "i": list(range(7))}
+    assert_equal_data(result, expected)
+
+
+def test_rolling_quantile_non_linear_sql(constructor: Constructor) -> None:
+    if not any(x in str(constructor) for x in ("duckdb", "ibis")):
+        pytest.skip()
+    df = nw.from_native(constructor({"a": [1, 2, 3], "b": [1, 2, 3]}))
+    with pytest.raises(NotImplementedError, match="linear"):
+        df.select(nw.col("a").rolling_quantile(0.3, "nearest", 2).over(order_by="b"))
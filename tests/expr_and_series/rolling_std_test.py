@@ -315,7 +315,7 @@ def test_rolling_std_expr_lazy_grouped(
         or ("pandas" in str(constructor) and PANDAS_VERSION < (1, 2))
     ):
         pytest.skip()
-    if any(x in str(constructor) for x in ("dask", "pyarrow_table")):
+    if "dask" in str(constructor):
         request.applymarker(pytest.mark.xfail)
     if "modin" in str(constructor):
         # unreliable
@@ -127,7 +127,7 @@ def test_rolling_sum_expr_lazy_grouped(
         pytest.skip()
     if "pandas" in str(constructor) and PANDAS_VERSION < (1, 2):
         pytest.skip()
-    if any(x in str(constructor) for x in ("dask", "pyarrow_table")):
+    if "dask" in str(constructor):
         request.applymarker(pytest.mark.xfail)
     if "modin" in str(constructor):
         # unreliable
@@ -298,3 +298,18 @@ def test_rolling_sum_hypothesis(center: bool, values: list[float]) -> None:  # n
     )
     expected_dict = nw.from_native(expected, eager_only=True).to_dict(as_series=False)
     assert_equal_data(result, expected_dict)
+
+
+def test_rolling_sum_nan_only_affects_its_windows(
+    constructor_eager: ConstructorEager,
+) -> None:
+    if any(x in str(constructor_eager) for x in ("pandas", "modin", "cudf")):
+        pytest.skip(reason="NaN is treated as missing")
+    df = nw.from_native(
+        constructor_eager({"a": [1.0, float("nan"), 2.0, 3.0, float("inf"), 4.0, 5.0]})
+    )
+    result = df.select(nw.col("a").rolling_sum(2))
+    expected = {
+        "a": [None, float("nan"), float("nan"), 5.0, float("inf"), float("inf"), 9.0]
+    }
+    assert_equal_data(result, expected)
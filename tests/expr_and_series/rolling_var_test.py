@@ -270,7 +270,7 @@ def test_rolling_var_expr_lazy_grouped(
         or ("pandas" in str(constructor) and PANDAS_VERSION < (1, 2))
     ):
         pytest.skip()
-    if any(x in str(constructor) for x in ("dask", "pyarrow_table")):
+    if "dask" in str(constructor):
         request.applymarker(pytest.mark.xfail)
     if "modin" in str(constructor):
         # unreliable
@@ -293,3 +293,12 @@ def test_rolling_var_expr_lazy_grouped(
     )
     expected = {"a": expected_a}
     assert_equal_data(result, expected)
+
+
+def test_rolling_var_large_offset(constructor_eager: ConstructorEager) -> None:
+    # Variances mustn't suffer from catastrophic cancellation when values are large
+    # compared to their spread.
+    offset = 1e9
+    df = nw.from_native(constructor_eager({"a": [offset + x for x in data["a"]]}))
+    result = df.select(nw.col("a").rolling_var(3))
+    assert_equal_data(result, {"a": [None, None, 1 / 3, 1, 4 / 3, 7 / 3, 3]})
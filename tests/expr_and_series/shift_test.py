@@ -51,7 +51,7 @@ def test_shift_lazy(constructor: Constructor) -> None:
 def test_shift_lazy_grouped(
     constructor: Constructor, request: pytest.FixtureRequest
 ) -> None:
-    if any(x in str(constructor) for x in ("dask", "pyarrow_table", "cudf")):
+    if any(x in str(constructor) for x in ("dask", "cudf")):
         # https://github.com/dask/dask/issues/11806
         # https://github.com/rapidsai/cudf/issues/18159
         request.applymarker(pytest.mark.xfail)
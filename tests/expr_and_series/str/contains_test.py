@@ -112,3 +112,14 @@ def test_contains_series_literal(constructor_eager: ConstructorEager) -> None:
             "literal_match": [False, False, False, False, True, None],
         }
     assert_equal_data(result, expected)
+
+
+def test_contains_categorical(constructor_eager: ConstructorEager) -> None:
+    if not any(x in str(constructor_eager) for x in ("pandas", "pyarrow_table")):
+        pytest.skip(
+            reason="only pandas and PyArrow support string methods on categoricals"
+        )
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.select(nw.col("pets").cast(nw.Categorical()).str.contains("(?i)parrot"))
+    expected = {"pets": [False, False, True, False, True, None]}
+    assert_equal_data(result, expected)
@@ -269,3 +269,48 @@ def test_to_datetime_pd_preserves_pyarrow_backend_dtype() -> None:
         result["b"].dtype, df._compliant_frame._implementation
     )
     assert result_dtype == dtype_backend
+
+
+def test_pyarrow_infer_datetime_larger_sample() -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow as pa
+
+    from narwhals._arrow.utils import parse_datetime_format
+
+    data = pa.chunked_array(
+        [[None] + ["2024-01-01 00:00:00"] * 10 + ["2024-01-01T01:00"]]
+    )
+    assert parse_datetime_format(data) == "%Y-%m-%d %H:%M:%S"
+    with pytest.raises(ValueError, match=re.escape("Found multiple separator values")):
+        parse_datetime_format(data, sample_size=20)
+
+
+def test_infer_datetime_format_cached() -> None:
+    from narwhals._datetime_format import _infer_datetime_format, infer_datetime_format
+
+    sample = ["2024-01-02T03:04:05Z", "2024-01-02T03:04:05Z", "2024-02-02T03:04:05Z"]
+    assert infer_datetime_format(sample) == "%Y-%m-%dT%H:%M:%S%z"
+    hits = _infer_datetime_format.cache_info().hits
+    assert infer_datetime_format(reversed(sample)) == "%Y-%m-%dT%H:%M:%S%z"
+    assert infer_datetime_format(["2025-02-03T04:05:06Z"]) == "%Y-%m-%dT%H:%M:%S%z"
+    assert _infer_datetime_format.cache_info().hits == hits + 2
+    # Values of the same shape, whose days can't be months, are inferred separately.
+    assert infer_datetime_format(["01/02/2024"]) == "%d/%m/%Y"
+    assert infer_datetime_format(["01/13/2024"]) == "%m/%d/%Y"
+    assert infer_datetime_format(["2024-01-02+01:00"]) == "%Y-%m-%d%z"
+    with pytest.raises(ValueError, match="multiple timezone values"):
+        infer_datetime_format(["2024-01-02+01:00", "2024-01-02+02:00"])
+
+
+def test_pandas_to_datetime_sample_size() -> None:
+    pytest.importorskip("pandas")
+    import pandas as pd
+
+    series = nw.from_native(
+        pd.Series(["2024-01-01 00:00:00"] * 10 + ["2024-01-01T01:00"]), series_only=True
+    )
+    compliant = series._compliant_series
+    assert compliant.str._infer_datetime_format(10) == "%Y-%m-%d %H:%M:%S"
+    assert compliant.str._infer_datetime_format(20) is None  # Mixed separators.
+    result = series.head(10)._compliant_series.str.to_datetime(None, sample_size=20)
+    assert result.native.iloc[-1] == pd.Timestamp("2024-01-01")
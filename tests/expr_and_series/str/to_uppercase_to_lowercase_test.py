@@ -78,3 +78,20 @@ def test_str_to_lowercase_series(
 
     result_series = df["a"].str.to_lowercase()
     assert_equal_data({"a": result_series}, expected)
+
+
+def test_str_to_uppercase_categorical(constructor_eager: ConstructorEager) -> None:
+    if not any(x in str(constructor_eager) for x in ("pandas", "pyarrow_table")):
+        pytest.skip(
+            reason="only pandas and PyArrow support string methods on categoricals"
+        )
+    data = {"a": ["foo", "Foo", None, "bar", "foo"]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    upper = nw.col("a").cast(nw.Categorical()).str.to_uppercase()
+    result = df.select(upper, b=nw.concat_str(upper, nw.lit("!")))
+    assert result.schema == {"a": nw.String(), "b": nw.String()}
+    expected = {
+        "a": ["FOO", "FOO", None, "BAR", "FOO"],
+        "b": ["FOO!", "FOO!", None, "BAR!", "FOO!"],
+    }
+    assert_equal_data(result, expected)
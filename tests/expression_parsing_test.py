@@ -1,10 +1,26 @@
 from __future__ import annotations
 
+import math
+import weakref
+from decimal import Decimal
+from typing import Any
+
 import pytest
 
 import narwhals as nw
+from narwhals._expression_parsing import (
+    CompiledExprCache,
+    _structural_key,
+    common_subexpression_scope,
+)
 from narwhals.exceptions import InvalidOperationError
-from tests.utils import DUCKDB_VERSION, POLARS_VERSION, Constructor, assert_equal_data
+from tests.utils import (
+    DUCKDB_VERSION,
+    POLARS_VERSION,
+    Constructor,
+    ConstructorEager,
+    assert_equal_data,
+)
 
 
 @pytest.mark.parametrize(
@@ -134,3 +150,126 @@ def test_rank_with_order_by_pushdown() -> None:
     )
     expected = {"a": [1, 1, 2], "res": [3.0, 2.0, 4.0]}
     assert_equal_data(result, expected)
+
+
+def test_common_subexpression_elimination(constructor_eager: ConstructorEager) -> None:
+    data = {"a": [1.0, 2.0, 3.0], "b": [0.1, 0.2, 0.3]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    charge = nw.col("a") * (1 - nw.col("b"))
+    exprs = {"x": charge, "y": charge * 2, "z": charge.sum()}
+    expected = {**data, "x": [0.9, 1.6, 2.1], "y": [1.8, 3.2, 4.2], "z": [4.6, 4.6, 4.6]}
+    assert_equal_data(df.with_columns(**exprs), expected)
+    if "polars" in str(constructor_eager):
+        # Polars does its own common subexpression elimination.
+        return
+
+    memo: dict[Any, Any] = {}
+    compliant = df._compliant_frame
+    ces = [
+        expr._to_compliant_expr(df.__narwhals_namespace__(), memo)
+        for expr in exprs.values()
+    ]
+    # `charge` is only built once, and is shared by all three expressions.
+    shared = ces[0]
+    assert shared._is_common_subexpr
+    assert not ces[1]._is_common_subexpr
+    n_calls = 0
+    call = shared._call
+
+    def counting_call(df: Any) -> Any:
+        nonlocal n_calls
+        n_calls += 1
+        return call(df)
+
+    shared._call = counting_call
+    with common_subexpression_scope():
+        for ce in ces:
+            ce(compliant)
+    assert n_calls == 1
+    # Outside of the scope, nothing is cached.
+    shared(compliant)
+    assert n_calls == 2
+
+
+def test_common_subexpression_elimination_distinguishes_literals(
+    constructor: Constructor,
+) -> None:
+    df = nw.from_native(constructor({"a": [1, 2, 3]}))
+    result = df.select(
+        x=nw.col("a") + nw.lit(1),
+        y=nw.col("a") + nw.lit(1.5),
+        z=nw.col("a") == nw.lit(True, nw.Boolean()).cast(nw.Int64()),
+    )
+    expected = {"x": [2, 3, 4], "y": [2.5, 3.5, 4.5], "z": [True, False, False]}
+    assert_equal_data(result, expected)
+
+
+@pytest.mark.parametrize("zeros", [(0.0, -0.0), (-0.0, 0.0)])
+def test_common_subexpression_elimination_signed_zero(
+    constructor_eager: ConstructorEager, zeros: tuple[float, float]
+) -> None:
+    df = nw.from_native(constructor_eager({"a": [1.0, 2.0]}), eager_only=True)
+    result = df.select(x=1 / (nw.col("a") * zeros[0]), y=1 / (nw.col("a") * zeros[1]))
+    expected = {
+        name: [math.copysign(math.inf, zero)] * 2 for name, zero in zip("xy", zeros)
+    }
+    assert_equal_data(result, expected)
+
+
+def test_compiled_expr_cache(constructor_eager: ConstructorEager) -> None:
+    df = nw.from_native(constructor_eager({"a": [1, 2, 3]}), eager_only=True)
+    cache = CompiledExprCache(maxsize=2)
+    ns = df.__narwhals_namespace__()
+    exprs = [nw.col("a") * 2, (nw.col("a") * 2).sum().alias("b")]
+    first, second = cache(exprs, ns)
+    assert cache(exprs, ns)[1] is second
+    assert cache([nw.col("a") * 2, (nw.col("a") * 2).sum().alias("b")], ns)[0] is first
+    assert cache(exprs[:1], ns)[0] is not first
+    assert cache.cache_info() == (2, 2, 2, 2)
+    cache([nw.col("a") + 1], ns)
+    assert cache.cache_info().currsize == 2
+    # Least-recently used entry was evicted.
+    assert cache(exprs, ns)[0] is not first
+    assert cache.cache_info() == (2, 4, 2, 2)
+    # Expressions holding unhashable data aren't cached.
+    series = nw.new_series("s", [1, 2, 3], nw.Int64, backend=df.implementation)
+    assert (
+        cache([nw.col("a") + series], ns)[0] is not cache([nw.col("a") + series], ns)[0]
+    )
+    assert cache.cache_info() == (2, 4, 2, 2)
+    # Nor are expressions holding functions, which the cache would keep alive.
+
+    def function(s: Any) -> Any:
+        return s
+
+    ref = weakref.ref(function)
+    cache([nw.col("a").map_batches(function)], ns)
+    assert cache.cache_info() == (2, 4, 2, 2)
+    del function
+    assert ref() is None
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 2, 0)
+
+
+@pytest.mark.parametrize(
+    ("left", "right"),
+    [
+        (nw.lit(1), nw.lit(True)),
+        (nw.col("a").fill_null(1), nw.col("a").fill_null(1.0)),
+        (nw.col("a").cast(nw.Int64()), nw.col("a").cast(nw.Int32())),
+        (nw.col("a").is_in([1, 2]), nw.col("a").is_in([1, 3])),
+        (nw.col("a") * 0.0, nw.col("a") * -0.0),
+        (nw.lit(Decimal("1.0")), nw.lit(Decimal("1.00"))),
+    ],
+)
+def test_structural_key(left: nw.Expr, right: nw.Expr) -> None:
+    key = _structural_key(left, by_identity=False)
+    assert key == _structural_key(left, by_identity=False)
+    assert key != _structural_key(right, by_identity=False)
+
+
+def test_compiled_expr_cache_signed_zero(constructor_eager: ConstructorEager) -> None:
+    # Equal literals which behave differently mustn't share a cache entry.
+    df = nw.from_native(constructor_eager({"a": [1.0, 2.0]}), eager_only=True)
+    assert_equal_data(df.select(x=1 / (nw.col("a") * 0.0)), {"x": [math.inf] * 2})
+    assert_equal_data(df.select(x=1 / (nw.col("a") * -0.0)), {"x": [-math.inf] * 2})
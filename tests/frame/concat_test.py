@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from typing import Literal
 
 import pytest
 
@@ -83,3 +84,19 @@ def test_concat_diagonal(
 
     with pytest.raises(ValueError, match="No items"):
         nw.concat([], how="diagonal")
+
+
+@pytest.mark.parametrize("how", ["vertical", "diagonal"])
+def test_concat_iterator(
+    constructor_eager: ConstructorEager, how: Literal["vertical", "diagonal"]
+) -> None:
+    data = {"a": [1, 3, 2], "b": [4, 4, 6]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+
+    result = nw.concat((df[i : i + 1] for i in range(len(df))), how=how)
+    assert_equal_data(result, data)
+
+    with pytest.raises(ValueError, match="No items"):
+        nw.concat(iter([]), how=how)
+    with pytest.raises(TypeError, match="should either all be eager, or all lazy"):
+        nw.concat(iter([df, df.lazy()]), how=how)
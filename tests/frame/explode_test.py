@@ -35,7 +35,7 @@ def test_explode_single_col(
     column: str,
     expected_values: list[int | None],
 ) -> None:
-    if any(backend in str(constructor) for backend in ("dask", "cudf", "pyarrow_table")):
+    if any(backend in str(constructor) for backend in ("dask", "cudf")):
         request.applymarker(pytest.mark.xfail)
 
     if "pandas" in str(constructor):
@@ -86,7 +86,7 @@ def test_explode_multiple_cols(
 ) -> None:
     if any(
         backend in str(constructor)
-        for backend in ("dask", "cudf", "pyarrow_table", "duckdb", "pyspark", "ibis")
+        for backend in ("dask", "cudf", "duckdb", "pyspark", "ibis")
     ):
         request.applymarker(pytest.mark.xfail)
 
@@ -108,7 +108,7 @@ def test_explode_multiple_cols(
 def test_explode_shape_error(
     request: pytest.FixtureRequest, constructor: Constructor
 ) -> None:
-    if any(backend in str(constructor) for backend in ("dask", "cudf", "pyarrow_table")):
+    if any(backend in str(constructor) for backend in ("dask", "cudf")):
         request.applymarker(pytest.mark.xfail)
 
     if "pandas" in str(constructor):
@@ -132,7 +132,7 @@ def test_explode_shape_error(
 def test_explode_invalid_operation_error(
     request: pytest.FixtureRequest, constructor: Constructor
 ) -> None:
-    if any(x in str(constructor) for x in ("pyarrow_table", "dask")):
+    if any(x in str(constructor) for x in ("dask",)):
         request.applymarker(pytest.mark.xfail)
 
     if "polars" in str(constructor) and POLARS_VERSION < (0, 20, 6):
@@ -218,3 +218,30 @@ def test_filter_seq_iterable_all_false(constructor: Constructor, predicates: Any
     expected: dict[str, list[Any]] = {"a": [], "b": [], "z": []}
     predicate = (p for p in predicates)
     assert_equal_data(df.filter(predicate), expected)
+
+
+def test_filter_fused_pyarrow() -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow as pa
+
+    data = {"a": [1, 3, None, 2], "b": [4, 4, 6, None]}
+    df = nw.from_native(pa.table(data))
+    result = df.filter(nw.col("a") > 1, nw.col("b") < 6)
+    assert_equal_data(result, {"a": [3], "b": [4]})
+    result = df.filter(~nw.col("a").is_in([3]) & ~nw.col("a").is_null())
+    assert_equal_data(result, {"a": [1, 2], "b": [4, None]})
+
+
+def test_filter_fused_numexpr(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numexpr")
+    pd = pytest.importorskip("pandas")
+
+    monkeypatch.setenv("NARWHALS_USE_NUMEXPR", "1")
+    # Re-importing pandas (as some other tests do) can reset this option.
+    with pd.option_context("compute.use_numexpr", True):
+        data = {"a": [1, 3, 2, 4], "b": [4.0, 4.0, 6.0, float("nan")]}
+        df = nw.from_native(pd.DataFrame(data))
+        result = df.filter(nw.col("a") > 1, nw.col("b") < 6)
+        assert_equal_data(result, {"a": [3], "b": [4.0]})
+        result = df.filter(~(nw.col("b") >= 5))
+        assert_equal_data(result, {"a": [1, 3, 4], "b": [4.0, 4.0, float("nan")]})
@@ -70,7 +70,53 @@ def test_invalid_group_by_dask() -> None:
     df_dask = dd.from_dict(data, npartitions=1)
 
     with pytest.raises(ValueError, match=r"Non-trivial complex aggregation found"):
-        nw.from_native(df_dask).group_by("a").agg(nw.col("b").abs().min())
+        nw.from_native(df_dask).group_by("a").agg(
+            (nw.col("b") - nw.col("c").mean()).mean()
+        )
+
+
+def test_group_by_decomposed(constructor: Constructor) -> None:
+    data = {
+        "a": [1, 1, 3, 3, 3],
+        "b": [4.12, 4.0, 6.5, None, 1.0],
+        "c": [7.0, 8.0, 9.0, -1.0, 2.0],
+    }
+    df = nw.from_native(constructor(data))
+    result = (
+        df.group_by("a")
+        .agg(
+            nw.col("b").round(1).mean(),
+            ((nw.col("b") * nw.col("c")).sum() / nw.col("c").sum()).alias("w"),
+            nw.col("b", "c").abs().max().name.suffix("_max"),
+            (nw.len() * 2).alias("len"),
+            nw.sum_horizontal(nw.col("b").min(), nw.col("c").max()).alias("h"),
+            (nw.col("c") ** 2).sum().sqrt().alias("norm"),
+        )
+        .sort("a")
+    )
+    expected = {
+        "a": [1, 3],
+        "b": [4.05, 3.75],
+        "w": [4.056, 6.05],
+        "b_max": [4.12, 6.5],
+        "c_max": [8.0, 9.0],
+        "len": [4, 6],
+        "h": [12.0, 10.0],
+        "norm": [113**0.5, 86**0.5],
+    }
+    assert_equal_data(result, expected)
+
+
+def test_group_by_decomposed_expr_keys(constructor: Constructor) -> None:
+    data = {"a": [1, 1, 3], "b": [4, 5, 6], "c": [1, 2, 3]}
+    df = nw.from_native(constructor(data))
+    result = (
+        df.group_by(nw.col("a") * 2)
+        .agg((nw.col("b") - nw.col("c")).max(), (nw.col("a").sum() + 1).alias("d"))
+        .sort("a")
+    )
+    expected = {"a": [2, 6], "b": [3, 3], "d": [3, 4]}
+    assert_equal_data(result, expected)
 
 
 def test_group_by_iter(constructor_eager: ConstructorEager) -> None:
@@ -95,6 +141,18 @@ def test_group_by_iter(constructor_eager: ConstructorEager) -> None:
     assert sorted(keys) == sorted(expected_keys)
 
 
+def test_group_by_iter_multiple_keys(constructor_eager: ConstructorEager) -> None:
+    # Keys whose string representations would concatenate to the same value.
+    data = {"a": ["1", "12", "1", "12"], "b": ["23", "3", "23", "4"], "c": [1, 2, 3, 4]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = dict(df.group_by("a", "b"))
+    assert sorted(result) == [("1", "23"), ("12", "3"), ("12", "4")]
+    assert_equal_data(
+        result[("1", "23")], {"a": ["1", "1"], "b": ["23", "23"], "c": [1, 3]}
+    )
+    assert_equal_data(result[("12", "4")], {"a": ["12"], "b": ["4"], "c": [4]})
+
+
 def test_group_by_iter_non_str_pandas() -> None:
     pytest.importorskip("pandas")
     import pandas as pd
@@ -210,6 +268,47 @@ def test_group_by_median(constructor: Constructor) -> None:
     assert_equal_data(result, expected)
 
 
+def test_group_by_quantile(
+    constructor: Constructor, request: pytest.FixtureRequest
+) -> None:
+    if any(x in str(constructor) for x in ("pyarrow_table", "pyspark")):
+        request.applymarker(pytest.mark.xfail)
+    data = {"a": [1, 1, 1, 1, 2, 2, 2], "b": [5, 4, None, 6, 7, 3, 2]}
+    result = (
+        nw.from_native(constructor(data))
+        .group_by("a")
+        .agg(nw.col("b").quantile(0.75, interpolation="linear"))
+        .sort("a")
+    )
+    expected = {"a": [1, 2], "b": [5.5, 5.0]}
+    assert_equal_data(result, expected)
+
+
+def test_group_by_quantile_with_other_aggregations(
+    constructor: Constructor, request: pytest.FixtureRequest
+) -> None:
+    if any(x in str(constructor) for x in ("pyarrow_table", "pyspark")):
+        request.applymarker(pytest.mark.xfail)
+    data = {"a": [1, 1, 1, 1, 2, 2, 2, 3], "b": [5, 4, None, 6, 7, 3, 2, None]}
+    result = (
+        nw.from_native(constructor(data))
+        .group_by("a")
+        .agg(
+            c=nw.col("b").sum(),
+            b=nw.col("b").quantile(0.25, interpolation="linear"),
+            d=nw.col("b").median(),
+        )
+        .sort("a")
+    )
+    expected = {
+        "a": [1, 2, 3],
+        "c": [15, 12, 0],
+        "b": [4.5, 2.5, None],
+        "d": [5.0, 3.0, None],
+    }
+    assert_equal_data(result, expected)
+
+
 def test_group_by_n_unique_w_missing(constructor: Constructor) -> None:
     if "duckdb" in str(constructor) and DUCKDB_VERSION < (1, 3):
         pytest.skip()
@@ -255,8 +354,14 @@ def test_group_by_empty_result_pandas() -> None:
     df = nw.from_native(df_any, eager_only=True)
     with pytest.raises(ValueError, match="No results"):
         df.filter(nw.col("a") < 0).group_by("a").agg(
-            nw.col("b").sum().round(2).alias("c")
+            (nw.col("b") - nw.col("b").mean()).sum().alias("c")
         )
+    result = (
+        df.filter(nw.col("a") < 0)
+        .group_by("a")
+        .agg(nw.col("b").sum().round(2).alias("c"))
+    )
+    assert_equal_data(result, {"a": [], "c": []})
 
 
 def test_group_by_simple_named(constructor: Constructor) -> None:
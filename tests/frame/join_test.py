@@ -502,7 +502,7 @@ def test_joinasof_numeric(
     strategy: Literal["backward", "forward", "nearest"],
     expected: dict[str, list[Any]],
 ) -> None:
-    if any(x in str(constructor) for x in ("pyarrow_table", "cudf", "pyspark")):
+    if any(x in str(constructor) for x in ("cudf", "pyspark")):
         request.applymarker(pytest.mark.xfail)
     if (
         "duckdb" in str(constructor) or "ibis" in str(constructor)
@@ -573,7 +573,7 @@ def test_joinasof_time(
     strategy: Literal["backward", "forward", "nearest"],
     expected: dict[str, list[Any]],
 ) -> None:
-    if any(x in str(constructor) for x in ("pyarrow_table", "cudf", "pyspark")):
+    if any(x in str(constructor) for x in ("cudf", "pyspark")):
         request.applymarker(pytest.mark.xfail)
     if (
         "duckdb" in str(constructor) or "ibis" in str(constructor)
@@ -616,7 +616,7 @@ def test_joinasof_time(
 
 
 def test_joinasof_by(constructor: Constructor, request: pytest.FixtureRequest) -> None:
-    if any(x in str(constructor) for x in ("pyarrow_table", "cudf", "pyspark")):
+    if any(x in str(constructor) for x in ("cudf", "pyspark")):
         request.applymarker(pytest.mark.xfail)
     if PANDAS_VERSION < (2, 1) and (
         ("pandas_pyarrow" in str(constructor)) or ("pandas_nullable" in str(constructor))
@@ -651,7 +651,7 @@ def test_joinasof_by(constructor: Constructor, request: pytest.FixtureRequest) -
 def test_joinasof_suffix(
     constructor: Constructor, request: pytest.FixtureRequest
 ) -> None:
-    if any(x in str(constructor) for x in ("pyarrow_table", "cudf", "pyspark")):
+    if any(x in str(constructor) for x in ("cudf", "pyspark")):
         request.applymarker(pytest.mark.xfail)
     if PANDAS_VERSION < (2, 1) and (
         ("pandas_pyarrow" in str(constructor)) or ("pandas_nullable" in str(constructor))
@@ -670,6 +670,68 @@ def test_joinasof_suffix(
     assert_equal_data(result.sort(by="antananarivo"), expected)
 
 
+@pytest.mark.parametrize(
+    ("strategy", "expected"),
+    [
+        ("backward", [1, None, 3, None, None]),
+        ("forward", [None, 2, 1, None, None]),
+        ("nearest", [1, 2, 1, None, None]),
+    ],
+)
+def test_joinasof_unsorted_pyarrow(
+    strategy: Literal["backward", "forward", "nearest"], expected: list[Any]
+) -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow as pa
+
+    df = nw.from_native(
+        pa.table(
+            {
+                "antananarivo": [9, 2, 5, None, 4],
+                "bob": ["x", "y", "x", "x", None],
+                "c": [1, 2, 3, 4, 5],
+            }
+        )
+    )
+    df_right = nw.from_native(
+        pa.table(
+            {
+                "antananarivo": [6, 3, 1, None, 2],
+                "bob": ["x", "y", "x", "x", None],
+                "d": [1, 2, 3, 4, 5],
+            }
+        )
+    )
+    result = df.join_asof(df_right, on="antananarivo", by="bob", strategy=strategy)
+    expected_data = {
+        "antananarivo": [9, 2, 5, None, 4],
+        "bob": ["x", "y", "x", "x", None],
+        "c": [1, 2, 3, 4, 5],
+        "d": expected,
+    }
+    assert_equal_data(result, expected_data)
+
+
+@pytest.mark.parametrize("strategy", ["backward", "forward", "nearest"])
+def test_joinasof_empty_chunks_pyarrow(
+    strategy: Literal["backward", "forward", "nearest"],
+) -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow as pa
+
+    def empty(*names: str) -> nw.DataFrame[pa.Table]:
+        # Columns without any chunks, e.g. as converted from empty Polars frames.
+        return nw.from_native(
+            pa.table({name: pa.chunked_array([], pa.int64()) for name in names})
+        )
+
+    result = empty("a", "b", "c").join_asof(
+        empty("a", "b", "d"), on="a", by="b", strategy=strategy
+    )
+    assert_equal_data(result, {"a": [], "b": [], "c": [], "d": []})
+    assert result.schema == {name: nw.Int64() for name in "abcd"}
+
+
 @pytest.mark.parametrize("strategy", ["back", "furthest"])
 def test_joinasof_not_implemented(
     constructor: Constructor, strategy: Literal["backward", "forward"]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from contextlib import nullcontext as does_not_raise
-from typing import Any
+from typing import Any, Literal
 
 import pytest
 
@@ -120,7 +120,7 @@ def test_pivot(
     index: str | list[str],
     request: pytest.FixtureRequest,
 ) -> None:
-    if any(x in str(constructor_eager) for x in ("pyarrow_table", "modin")):
+    if any(x in str(constructor_eager) for x in ("modin",)):
         request.applymarker(pytest.mark.xfail)
     if "polars" in str(constructor_eager) and POLARS_VERSION < (1, 0):
         # not implemented
@@ -148,7 +148,7 @@ def test_pivot(
 def test_pivot_no_agg(
     request: Any, constructor_eager: ConstructorEager, data_: Any, context: Any
 ) -> None:
-    if any(x in str(constructor_eager) for x in ("pyarrow_table", "modin")):
+    if any(x in str(constructor_eager) for x in ("modin",)):
         request.applymarker(pytest.mark.xfail)
     if "polars" in str(constructor_eager) and POLARS_VERSION < (1, 0):
         # not implemented
@@ -172,7 +172,7 @@ def test_pivot_sort_columns(
     sort_columns: Any,
     expected: list[str],
 ) -> None:
-    if any(x in str(constructor_eager) for x in ("pyarrow_table", "modin")):
+    if any(x in str(constructor_eager) for x in ("modin",)):
         request.applymarker(pytest.mark.xfail)
     if "polars" in str(constructor_eager) and POLARS_VERSION < (1, 0):
         # not implemented
@@ -220,7 +220,7 @@ def test_pivot_sort_columns(
 def test_pivot_names_out(
     request: Any, constructor_eager: ConstructorEager, kwargs: Any, expected: list[str]
 ) -> None:
-    if any(x in str(constructor_eager) for x in ("pyarrow_table", "modin")):
+    if any(x in str(constructor_eager) for x in ("modin",)):
         request.applymarker(pytest.mark.xfail)
     if "polars" in str(constructor_eager) and POLARS_VERSION < (1, 0):
         # not implemented
@@ -243,7 +243,7 @@ def test_pivot_no_index_no_values(constructor_eager: ConstructorEager) -> None:
 def test_pivot_no_index(
     constructor_eager: ConstructorEager, request: pytest.FixtureRequest
 ) -> None:
-    if any(x in str(constructor_eager) for x in ("pyarrow_table", "modin")):
+    if any(x in str(constructor_eager) for x in ("modin",)):
         request.applymarker(pytest.mark.xfail)
     if "polars" in str(constructor_eager) and POLARS_VERSION < (1, 0):
         # not implemented
@@ -258,3 +258,26 @@ def test_pivot_no_index(
         "b": [None, 2.0, 4.0, None],
     }
     assert_equal_data(result, expected)
+
+
+@pytest.mark.parametrize(
+    ("aggregate_function", "expected_a", "expected_b"),
+    [("sum", [0, 2], [1, 0]), ("len", [1, 1], [1, 0])],
+)
+def test_pivot_sum_len_nulls(
+    constructor_eager: ConstructorEager,
+    aggregate_function: Literal["sum", "len"],
+    expected_a: list[int],
+    expected_b: list[int],
+) -> None:
+    if not any(x in str(constructor_eager) for x in ("pyarrow_table", "polars")):
+        pytest.skip(reason="pandas gives NaN for missing combinations")
+    if "polars" in str(constructor_eager) and POLARS_VERSION < (1, 0):
+        pytest.skip()
+    # The cell for `ix=1, on="a"` only holds a null, whereas `ix=2, on="b"` is missing.
+    data = {"ix": [1, 1, 2], "on": ["a", "b", "a"], "v": [None, 1, 2]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.pivot(
+        on="on", index="ix", values="v", aggregate_function=aggregate_function
+    ).sort("ix")
+    assert_equal_data(result, {"ix": [1, 2], "a": expected_a, "b": expected_b})
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Literal
 import pytest
 
 import narwhals as nw
+import narwhals.selectors as ncs
 from narwhals.exceptions import PerformanceWarning
 from tests.utils import PANDAS_VERSION, POLARS_VERSION, ConstructorPandasLike
 
@@ -82,6 +83,75 @@ def test_string_disguised_as_object() -> None:
     assert result["a"] == nw.String
 
 
+def test_schema_derived(constructor_pandas_like: ConstructorPandasLike) -> None:
+    class Foo: ...
+
+    data = {"a": [1, 2], "b": ["x", "y"], "c": [Foo(), Foo()], "d": [1.5, None]}
+    df = nw.from_native(constructor_pandas_like(data), eager_only=True)
+    assert df.schema == {
+        "a": nw.Int64(),
+        "b": nw.String(),
+        "c": nw.Object(),
+        "d": nw.Float64(),
+    }
+    results = [
+        df.with_columns(nw.col("a").cast(nw.String()), e=nw.lit(1)),
+        df.select(nw.col("b", "c"), nw.col("a").alias("d"), e=nw.col("d") > 1),
+        df.rename({"a": "z", "c": "a"}),
+        df.drop("b"),
+        df.select("d", "a"),
+    ]
+    for result in results:
+        # Derived from `df`'s schema, should be the same as if computed from scratch.
+        assert result.schema == nw.from_native(result.to_native()).schema
+
+
+@pytest.mark.filterwarnings("ignore:Determining|Resolving.*")
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_schema_propagated(constructor: Constructor, *, prefetch: bool) -> None:
+    data = {"a": [1, 2, 3], "b": [4.0, 5.0, None], "c": ["x", "y", "x"]}
+    df = nw.from_native(constructor(data)).lazy()
+    other = nw.from_native(constructor({"a": [1, 2], "d": ["p", "q"]})).lazy()
+    if prefetch:
+        # Derived frames know all the dtypes which could be inferred.
+        df.collect_schema()
+        other.collect_schema()
+    results = [
+        df.select(
+            "a",
+            nw.col("b").alias("z"),
+            (nw.col("a") > 1).alias("e"),
+            nw.col("c").str.to_uppercase(),
+            nw.lit(1, nw.Int32()).alias("f"),
+        ),
+        df.with_columns(nw.col("a").cast(nw.String()), g=nw.col("b").is_null()),
+        df.with_columns(nw.col("a").max().over("c").alias("m")).select(~ncs.string()),
+        df.rename({"a": "z"}).drop("b").filter(nw.col("z") > 1).sort("z"),
+        df.join(other, on="a", how="left").unique(["a"]),
+        df.join(other, on="a", how="inner").drop_nulls(),
+        df.group_by("c").agg(nw.col("a").min(), nw.col("b").max().alias("bm")),
+    ]
+    for result in results:
+        # Should be the same as if computed from scratch by the engine.
+        expected = nw.from_native(result.to_native())
+        assert result.columns == expected.columns
+        assert result.collect_schema() == expected.collect_schema()
+
+
+def test_schema_native_mutated() -> None:
+    pytest.importorskip("pandas")
+    import pandas as pd
+
+    native = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    df = nw.from_native(native, eager_only=True)
+    assert df.schema == {"a": nw.Int64(), "b": nw.String()}
+    native["c"] = [1.5, 2.5]
+    native["a"] = native["a"].astype(str)
+    assert df.schema == {"a": nw.String(), "b": nw.String(), "c": nw.Float64()}
+    assert df.select(ncs.numeric()).columns == ["c"]
+    assert df.drop("b").schema == {"a": nw.String(), "c": nw.Float64()}
+
+
 def test_actual_object(
     request: pytest.FixtureRequest, constructor_eager: ConstructorEager
 ) -> None:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
 
 import narwhals as nw
@@ -112,3 +114,197 @@ def test_with_columns_missing_column(
 
     with pytest.raises(ColumnNotFoundError, match=msg):
         maybe_collect(df.with_columns(d=nw.col("c") + 1))
+
+
+def test_with_columns_fused_elementwise_pyarrow() -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow as pa
+
+    data = {"a": [1, 3, None], "b": [4.0, 4.5, 6.0], "c": ["x", "y", None]}
+    df = nw.from_native(pa.table(data))
+    exprs = [
+        ((nw.col("a") + 1) * nw.col("b")).alias("arith"),
+        (1 - nw.col("a")).alias("rsub"),
+        ((nw.col("a") > 1) & (nw.col("b") < 6)).alias("cmp"),
+        (~nw.col("a").is_between(1, 2, closed="left")).alias("between"),
+        nw.col("c").is_in(["x", "z"]).alias("is_in"),
+        nw.col("a").cast(nw.Float64()).abs().is_null().alias("cast"),
+        nw.col("a").cum_sum().alias("not_fused"),
+    ]
+    compliant = df._compliant_frame
+    plx = compliant.__narwhals_namespace__()
+    fused = [
+        expr._to_compliant_expr(plx)._to_pc_expression() is not None for expr in exprs
+    ]
+    assert fused == [True, True, True, True, True, True, False]
+    result = df.with_columns(exprs)
+    expected = {
+        **data,
+        "arith": [8.0, 18.0, None],
+        "rsub": [0, -2, None],
+        "cmp": [False, True, False],
+        "between": [False, True, None],
+        "is_in": [True, False, False],
+        "cast": [False, False, True],
+        "not_fused": [1, 4, None],
+    }
+    assert_equal_data(result, expected)
+    assert result.schema == {
+        **df.schema,
+        "arith": nw.Float64(),
+        "rsub": nw.Int64(),
+        "cmp": nw.Boolean(),
+        "between": nw.Boolean(),
+        "is_in": nw.Boolean(),
+        "cast": nw.Boolean(),
+        "not_fused": nw.Int64(),
+    }
+    # Invalid operations still raise the same errors as without fusion.
+    with pytest.raises(pa.ArrowNotImplementedError):
+        df.select(nw.col("c") + 1)
+
+
+def test_with_columns_fused_elementwise_numexpr(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numexpr")
+    pd = pytest.importorskip("pandas")
+
+    monkeypatch.setenv("NARWHALS_USE_NUMEXPR", "1")
+    # Re-importing pandas (as some other tests do) can reset this option.
+    with pd.option_context("compute.use_numexpr", True):
+        data = {
+            "a b": [1, 3, -2],
+            "b": [4.0, float("nan"), -6.0],
+            "c": [True, False, True],
+        }
+        df = nw.from_native(pd.DataFrame(data), eager_only=True)
+        exprs = [
+            ((nw.col("a b") + 1) * nw.col("b")).alias("arith"),
+            (1 - nw.col("a b")).alias("rsub"),
+            ((nw.col("a b") > 1) | nw.col("c")).alias("cmp"),
+            (~nw.col("a b").is_between(1, 2, closed="left")).alias("between"),
+            (nw.col("b") != 4).alias("ne"),
+            nw.col("b").abs().alias("abs"),
+            nw.col("a b").abs().alias("not_fused"),
+        ]
+        compliant = df._compliant_frame
+        plx = compliant.__narwhals_namespace__()
+        fused = [
+            expr._to_compliant_expr(plx)._evaluate_numexpr(compliant) is not None
+            for expr in exprs
+        ]
+        assert fused == [True, True, True, True, True, True, False]
+        expected = {
+            **data,
+            "arith": [8.0, float("nan"), 6.0],
+            "rsub": [0, -2, 3],
+            "cmp": [True, True, True],
+            "between": [False, True, True],
+            "ne": [False, True, True],
+            "abs": [4.0, float("nan"), 6.0],
+            "not_fused": [1, 3, 2],
+        }
+        result = df.with_columns(exprs)
+        assert_equal_data(result, expected)
+        assert result.schema == {
+            **df.schema,
+            "arith": nw.Float64(),
+            "rsub": nw.Int64(),
+            "cmp": nw.Boolean(),
+            "between": nw.Boolean(),
+            "ne": nw.Boolean(),
+            "abs": nw.Float64(),
+            "not_fused": nw.Int64(),
+        }
+        with pd.option_context("compute.use_numexpr", False):
+            assert exprs[0]._to_compliant_expr(plx)._evaluate_numexpr(compliant) is None
+            assert_equal_data(df.with_columns(exprs), expected)
+        with monkeypatch.context() as mp:
+            # Fusing is opt-in.
+            mp.delenv("NARWHALS_USE_NUMEXPR")
+            assert exprs[0]._to_compliant_expr(plx)._evaluate_numexpr(compliant) is None
+            assert_equal_data(df.with_columns(exprs), expected)
+        # Nullable dtypes aren't fused.
+        df = nw.from_native(pd.DataFrame(data).convert_dtypes(), eager_only=True)
+        assert (
+            exprs[0]._to_compliant_expr(plx)._evaluate_numexpr(df._compliant_frame)
+            is None
+        )
+
+
+def test_with_columns_fused_numexpr_subexpressions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    numexpr = pytest.importorskip("numexpr")
+    pd = pytest.importorskip("pandas")
+
+    evaluated: list[str] = []
+    evaluate = numexpr.evaluate
+
+    def spy(expression: str, *args: Any, **kwargs: Any) -> Any:
+        evaluated.append(expression)
+        return evaluate(expression, *args, **kwargs)
+
+    monkeypatch.setenv("NARWHALS_USE_NUMEXPR", "1")
+    monkeypatch.setattr(numexpr, "evaluate", spy)
+    data = {"a": [1, 2, 3, 4], "b": [1.5, 2.0, 3.0, 4.0], "k": [1, 1, 2, 2]}
+    df = nw.from_native(pd.DataFrame(data), eager_only=True)
+    with pd.option_context("compute.use_numexpr", True):
+        result = df.with_columns(
+            prod=(nw.col("a") * nw.col("b")).sum(),
+            cum=(nw.col("a") + nw.col("b")).cum_sum().over("k"),
+            centred=(nw.col("a") * 2).abs() - nw.col("b").mean(),
+        )
+    expected = {
+        **data,
+        "prod": [30.5] * 4,
+        "cum": [2.5, 6.5, 6.0, 14.0],
+        "centred": [-0.625, 1.375, 3.375, 5.375],
+    }
+    assert_equal_data(result, expected)
+    assert sorted(evaluated) == ["(_0 * (2))", "(_0 * _1)", "(_0 + _1)"]
+
+
+def test_with_columns_fused_narrow_dtypes_pyarrow() -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow as pa
+
+    df = nw.from_native(
+        pa.table(
+            {
+                "a": pa.array([1, 2], pa.int32()),
+                "u": pa.array([1, 2], pa.uint8()),
+                "f": pa.array([1.5, 2.0], pa.float32()),
+            }
+        ),
+        eager_only=True,
+    )
+    exprs = {
+        "a": nw.col("a") + 1,
+        "u": nw.col("u") + 10,
+        "f": nw.col("f") * 2.0,
+        "rsub": 1 - nw.col("a"),
+        "lit": nw.lit(1, nw.Int8()) + nw.col("u"),
+    }
+    plx = df._compliant_frame.__narwhals_namespace__()
+    assert all(
+        expr._to_compliant_expr(plx)._to_pc_expression() is not None
+        for expr in exprs.values()
+    )
+    result = df.select(**exprs)
+    # Same data types as without fusion, where literals are upcast like in `pc.add`.
+    assert result.schema == {
+        "a": nw.Int64(),
+        "u": nw.Int64(),
+        "f": nw.Float64(),
+        "rsub": nw.Int64(),
+        "lit": nw.Int16(),
+    }
+    assert result.schema["a"] == (df["a"] + 1).dtype
+    expected = {
+        "a": [2, 3],
+        "u": [11, 12],
+        "f": [3.0, 4.0],
+        "rsub": [0, -1],
+        "lit": [2, 3],
+    }
+    assert_equal_data(result, expected)
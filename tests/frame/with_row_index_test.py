@@ -93,3 +93,32 @@ def test_with_row_index_lazy_meaner_examples(
     result = df.with_row_index(name="index", order_by=order_by).sort("b")
     expected = {"index": expected_index, **data}
     assert_equal_data(result, expected)
+
+
+def test_with_row_index_dask_many_partitions() -> None:
+    pytest.importorskip("dask")
+    import dask.dataframe as dd
+
+    data = {"a": [5, 3, 9, 3, 7, 2, 9, 0, 6, 5, 11], "i": list(range(11))}
+    df = nw.from_native(dd.from_dict(data, npartitions=4))
+    result = (
+        df.with_row_index("idx", order_by="i")
+        .select("idx", "a", "i")
+        .with_row_index("desc", order_by=["a", "i"])
+        .sort("i")
+    )
+    expected = {
+        "desc": [4, 2, 8, 3, 7, 1, 9, 0, 6, 5, 10],
+        "idx": list(range(11)),
+        **data,
+    }
+    assert_equal_data(result, expected)
+    result = df.with_columns(
+        first=nw.col("a").is_first_distinct().over(order_by="i"),
+        last=nw.col("a").is_last_distinct().over(order_by="i"),
+    ).sort("i")
+    expected_first = [True, True, True, False, True, True, False, True, True, False, True]
+    expected_last = [False, False, False, True, True, True, True, True, True, True, True]
+    assert_equal_data(
+        result.select("first", "last"), {"first": expected_first, "last": expected_last}
+    )
@@ -214,10 +214,7 @@ def test_set_ops(
     expected: list[str],
     request: pytest.FixtureRequest,
 ) -> None:
-    if (
-        any(x in str(constructor) for x in ("duckdb", "sqlframe", "ibis"))
-        and not expected
-    ):
+    if "ibis" in str(constructor) and not expected:
         # https://github.com/narwhals-dev/narwhals/issues/2469
         request.applymarker(pytest.mark.xfail)
     df = nw.from_native(constructor(data))
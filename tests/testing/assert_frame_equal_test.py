@@ -226,14 +226,38 @@ def test_check_row_order_nested_only(
         reason = "Unsupported List type"
         request.applymarker(pytest.mark.xfail(reason=reason))
 
-    data = {"b": [["x", "y"], ["x", "z"]]}
+    data = {"i": [0, 1, 2], "b": [["x", "y"], ["x", "z"], ["x", "y"]]}
 
     b_expr = nw.col("b").cast(nw.List(nw.String()))
-    left = nw.from_native(constructor(data)).select(b_expr)
+    frame = nw.from_native(constructor(data)).with_columns(b_expr)
+    left = frame.sort("i").select("b")
+    right = frame.sort("i", descending=True).select("b")
+    assert_frame_equal(left, right, check_row_order=False)
+
+    other_data = {"b": [["x", "y"], ["x", "z"], ["y", "x"]]}
+    other = nw.from_native(constructor(other_data)).select(b_expr)
+    with _assertion_error("rows do not match"):
+        assert_frame_equal(left, other, check_row_order=False)
+
+
+def test_check_row_order_unmatched_rows(constructor: Constructor) -> None:
+    data = {"a": [1, 1, 2, 3, 3], "b": [1.5, 1.5, 2.5, None, 3.5]}
+    left = nw.from_native(constructor(data))
+    right = nw.from_native(
+        constructor({"a": [3, 1, 2, 3, 1], "b": [3.5, 1.5 + 1e-9, 2.5, None, 1.5]})
+    )
+    assert_frame_equal(left, right, check_row_order=False)
+
+    with _assertion_error('value mismatch for column "b"'):
+        assert_frame_equal(left, right, check_row_order=False, check_exact=True)
+
 
-    msg = "`check_row_order=False` is not supported (yet) with only nested data type."
-    with pytest.raises(NotImplementedError, match=re.escape(msg)):
-        assert_frame_equal(left, left, check_row_order=False)
+def test_check_row_order_mixed_object_column() -> None:
+    # PyArrow can't key these rows, so they get sorted instead.
+    pd = pytest.importorskip("pandas")
+    left = nw.from_native(pd.DataFrame({"a": [1, "x"], "b": [1, 2]}))
+    right = nw.from_native(pd.DataFrame({"a": ["x", 1], "b": [2, 1]}))
+    assert_frame_equal(left, right, check_row_order=False)
 
 
 def test_self_equal(constructor: Constructor, testing_data: Data) -> None:
@@ -255,6 +255,27 @@ def test_numeric(
             does_not_raise(),
             nw.Array(nw.Float64(), 2),
         ),
+        (
+            [[1, 2], [3], [], [4, None]],
+            [[1], [2, 3], [], [4, None]],
+            True,
+            _assertion_error("nested value mismatch"),
+            nw.List(nw.Int64()),
+        ),
+        (
+            [[[1, 2], []], [[3]], [], [[4, None]]],
+            [[[1, 2], []], [[3]], [], [[4, None]]],
+            True,
+            does_not_raise(),
+            nw.List(nw.List(nw.Int64())),
+        ),
+        (
+            [[[1, 2], []], [[3]], [], [[4, None]]],
+            [[[1, 2], []], [[3]], [], [[None, 4]]],
+            True,
+            _assertion_error("nested value mismatch"),
+            nw.List(nw.List(nw.Int64())),
+        ),
     ],
 )
 def test_list_like(
@@ -345,6 +366,20 @@ def test_struct(
         assert_series_equal(left, right, check_names=False, check_exact=check_exact)
 
 
+def test_list_like_unnamed_pandas() -> None:
+    pd = pytest.importorskip("pandas")
+    pa = pytest.importorskip("pyarrow")
+    if PANDAS_VERSION < (2, 2):  # pragma: no cover
+        pytest.skip(reason="Pandas too old for nested dtypes")
+
+    dtype = pd.ArrowDtype(pa.list_(pa.int64()))
+    left = series_from_native(pd.Series([[1, 2], None, [3]], dtype=dtype))
+    right = series_from_native(pd.Series([[1, 2], None, [4]], dtype=dtype))
+    assert_series_equal(left, left)
+    with _assertion_error("nested value mismatch"):
+        assert_series_equal(left, right)
+
+
 def test_non_nw_series() -> None:
     pytest.importorskip("pandas")
 
@@ -1162,11 +1162,7 @@ def test_dtype___slots__(dtype: DType) -> None:
         dtype.i_also_dont_exist = 528329  # type: ignore[attr-defined]
 
 
-def test_any_value_expr(constructor: Constructor, request: pytest.FixtureRequest) -> None:
-    if "dask" in str(constructor):
-        reason = "sample does not allow n, use frac instead"
-        request.applymarker(pytest.mark.xfail(reason=reason))
-
+def test_any_value_expr(constructor: Constructor) -> None:
     data = {
         "a": [1, 1, 1, 2, 2, 3],
         "b": [1, 2, 3, 4, 5, 6],
@@ -511,11 +511,7 @@ def test_mode_different_lengths(constructor_eager: ConstructorEager) -> None:
         df.select(nw_v2.col("a", "b").mode())
 
 
-def test_any_value_expr(constructor: Constructor, request: pytest.FixtureRequest) -> None:
-    if "dask" in str(constructor):
-        reason = "sample does not allow n, use frac instead"
-        request.applymarker(pytest.mark.xfail(reason=reason))
-
+def test_any_value_expr(constructor: Constructor) -> None:
     data = {
         "a": [1, 1, 1, 2, 2, 3],
         "b": [1, 2, 3, 4, 5, 6],
@@ -0,0 +1,262 @@
+"""Time the TPC-H queries with each backend, and compare timings against a baseline.
+
+From this folder, after generating the data for each scale factor:
+
+    python -m benchmark run --scale-factor 0.1 1 --repeats 5 --output results.json
+    python -m benchmark compare baseline.json results.json --threshold 0.1
+
+Each (scale factor, backend, query) is measured in a fresh process, so that its
+peak RSS isn't shared with the other measurements.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import platform
+import pstats
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from execute import (
+    BACKEND_NAMESPACE_KWARGS_MAP,
+    DEFAULT_SCALE_FACTOR,
+    DUCKDB_SKIPS,
+    QUERY_DATA_PATH_MAP,
+    data_dir,
+    run_query,
+)
+
+import narwhals as nw
+
+NARWHALS_DIR = str(Path(nw.__file__).parent)
+
+
+def narwhals_overhead(profiler: cProfile.Profile) -> tuple[float, float]:
+    """Return the time spent in Narwhals' own code, and the total profiled time.
+
+    Only the time spent in functions defined in Narwhals counts as overhead. Time
+    spent in the native engine (including the C functions called from Narwhals)
+    does not.
+    """
+    stats: dict[tuple[str, int, str], tuple[Any, ...]] = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+    overhead = sum(
+        tottime
+        for (filename, *_), (_, _, tottime, *_) in stats.items()
+        if filename.startswith(NARWHALS_DIR)
+    )
+    return overhead, sum(tottime for (_, _, tottime, *_) in stats.values())
+
+
+def peak_rss_mb() -> float | None:
+    if sys.platform == "win32":
+        return None
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # `ru_maxrss` is in bytes on macOS, and in kilobytes elsewhere.
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def measure(
+    query_id: str, backend: str, scale_factor: float, repeats: int
+) -> dict[str, Any]:
+    directory = data_dir(scale_factor)
+    # Warm up, so that imports and first-time initialisation aren't timed.
+    run_query(query_id, backend, directory)
+
+    times = []
+    for _ in range(repeats):
+        start = perf_counter()
+        run_query(query_id, backend, directory)
+        times.append(perf_counter() - start)
+
+    # Profiling slows everything down, so it gets a run of its own.
+    profiler = cProfile.Profile()
+    profiler.runcall(run_query, query_id, backend, directory)
+    overhead, profiled = narwhals_overhead(profiler)
+
+    return {
+        "times_s": times,
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "narwhals_overhead_s": overhead,
+        "narwhals_overhead_fraction": overhead / profiled if profiled else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def measure_in_subprocess(
+    query_id: str, backend: str, scale_factor: float, repeats: int
+) -> dict[str, Any]:
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "benchmark",
+            "measure",
+            query_id,
+            backend,
+            f"--scale-factor={scale_factor}",
+            f"--repeats={repeats}",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        return {"error": lines[-1] if lines else f"exit code {result.returncode}"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_benchmarks(
+    query_ids: list[str], backends: list[str], scale_factors: list[float], repeats: int
+) -> dict[str, Any]:
+    results = []
+    for scale_factor in scale_factors:
+        for backend in backends:
+            for query_id in query_ids:
+                if backend in {"duckdb", "sqlframe"} and query_id in DUCKDB_SKIPS:
+                    continue
+                print(f"Running {query_id} with {backend=} at {scale_factor=}")  # noqa: T201
+                measurement = measure_in_subprocess(
+                    query_id, backend, scale_factor, repeats
+                )
+                if "error" in measurement:
+                    print(f"  failed: {measurement['error']}")  # noqa: T201
+                else:
+                    print(f"  median: {measurement['median_s']:.4f}s")  # noqa: T201
+                results.append(
+                    {
+                        "scale_factor": scale_factor,
+                        "backend": backend,
+                        "query": query_id,
+                        **measurement,
+                    }
+                )
+    return {
+        "metadata": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "narwhals_version": nw.__version__,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "backend_versions": {
+                backend: getattr(
+                    BACKEND_NAMESPACE_KWARGS_MAP[backend][0], "__version__", None
+                )
+                for backend in backends
+            },
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[str]:
+    """Print how the median times changed, and return the regressed measurements.
+
+    A measurement regresses if its median time is more than `threshold` (relative)
+    slower than in the baseline, or if it failed while the baseline didn't.
+    """
+
+    def key(result: dict[str, Any]) -> str:
+        return (
+            f"{result['query']} with {result['backend']} at sf={result['scale_factor']:g}"
+        )
+
+    baseline_results = {key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        name = key(result)
+        if (before := baseline_results.get(name)) is None or "error" in before:
+            continue
+        if "error" in result:
+            print(f"{name}: failed ({result['error']})")  # noqa: T201
+            regressions.append(name)
+            continue
+        ratio = result["median_s"] / before["median_s"]
+        line = f"{name}: {before['median_s']:.4f}s -> {result['median_s']:.4f}s ({ratio:.2f}x)"
+        if ratio > 1 + threshold:
+            line += " REGRESSION"
+            regressions.append(name)
+        print(line)  # noqa: T201
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the TPC-H queries.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Time the queries with each backend.")
+    run_parser.add_argument(
+        "--queries", nargs="+", default=list(QUERY_DATA_PATH_MAP), metavar="QUERY"
+    )
+    run_parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=list(BACKEND_NAMESPACE_KWARGS_MAP),
+        choices=list(BACKEND_NAMESPACE_KWARGS_MAP),
+        metavar="BACKEND",
+    )
+    run_parser.add_argument(
+        "--scale-factor", nargs="+", type=float, default=[DEFAULT_SCALE_FACTOR]
+    )
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--output", type=Path, default=Path("results.json"))
+    run_parser.add_argument(
+        "--baseline", type=Path, help="Results to compare the new results against."
+    )
+    run_parser.add_argument("--threshold", type=float, default=0.1)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare results against a baseline."
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    measure_parser = subparsers.add_parser(
+        "measure", help="Measure a single query, and print the results as JSON."
+    )
+    measure_parser.add_argument("query")
+    measure_parser.add_argument("backend", choices=list(BACKEND_NAMESPACE_KWARGS_MAP))
+    measure_parser.add_argument(
+        "--scale-factor", type=float, default=DEFAULT_SCALE_FACTOR
+    )
+    measure_parser.add_argument("--repeats", type=int, default=5)
+
+    args = parser.parse_args()
+
+    if args.command == "measure":
+        measurement = measure(args.query, args.backend, args.scale_factor, args.repeats)
+        print(json.dumps(measurement))  # noqa: T201
+        return
+
+    if args.command == "run":
+        current = run_benchmarks(
+            args.queries, args.backends, args.scale_factor, args.repeats
+        )
+        args.output.write_text(json.dumps(current, indent=2))
+        if args.baseline is None:
+            return
+        baseline = json.loads(args.baseline.read_text())
+    else:
+        baseline = json.loads(args.baseline.read_text())
+        current = json.loads(args.current.read_text())
+
+    if regressions := compare_results(baseline, current, args.threshold):
+        print(f"\n{len(regressions)} regression(s) found.")  # noqa: T201
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
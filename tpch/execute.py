@@ -18,6 +18,7 @@ if TYPE_CHECKING:
 pl.Config.set_fmt_float("full")
 
 DATA_DIR = Path("data")
+DEFAULT_SCALE_FACTOR = 0.1
 LINEITEM_PATH = DATA_DIR / "lineitem.parquet"
 REGION_PATH = DATA_DIR / "region.parquet"
 NATION_PATH = DATA_DIR / "nation.parquet"
@@ -120,30 +121,41 @@ QUERY_DATA_PATH_MAP = {
 }
 
 
-def execute_query(query_id: str) -> None:
+def data_dir(scale_factor: float = DEFAULT_SCALE_FACTOR) -> Path:
+    if scale_factor == DEFAULT_SCALE_FACTOR:
+        return DATA_DIR
+    return DATA_DIR / f"sf{scale_factor:g}"
+
+
+def run_query(query_id: str, backend: str, directory: Path = DATA_DIR) -> pl.DataFrame:
     query_module = import_module(f"tpch.queries.{query_id}")
-    data_paths = QUERY_DATA_PATH_MAP[query_id]
+    native_namespace, kwargs = BACKEND_NAMESPACE_KWARGS_MAP[backend]
+    return (
+        query_module.query(
+            *(
+                nw.scan_parquet(
+                    str(directory / path.name), backend=native_namespace, **kwargs
+                )
+                for path in QUERY_DATA_PATH_MAP[query_id]
+            )
+        )
+        .lazy()
+        .collect(backend=nw.Implementation.POLARS)
+        .to_native()
+    )
+
 
+def execute_query(query_id: str) -> None:
     expected = pl.read_parquet(DATA_DIR / f"result_{query_id}.parquet")
 
-    for backend, (native_namespace, kwargs) in BACKEND_NAMESPACE_KWARGS_MAP.items():
+    for backend in BACKEND_NAMESPACE_KWARGS_MAP:
         if backend in {"duckdb", "sqlframe"} and query_id in DUCKDB_SKIPS:
             print(f"\nSkipping {query_id} for {backend}")  # noqa: T201
             continue
 
         print(f"\nRunning {query_id} with {backend=}")  # noqa: T201
         try:
-            result: pl.DataFrame = (
-                query_module.query(
-                    *(
-                        nw.scan_parquet(str(path), backend=native_namespace, **kwargs)
-                        for path in data_paths
-                    )
-                )
-                .lazy()
-                .collect(backend=nw.Implementation.POLARS)
-                .to_native()
-            )
+            result = run_query(query_id, backend)
         except NarwhalsError as exc:
             msg = f"Query {query_id} with {backend=} failed with the following error in Narwhals:\n{exc}"
             raise RuntimeError(msg) from exc
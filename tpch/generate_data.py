@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import argparse
 import io
-from pathlib import Path
 
 import duckdb
 import pyarrow as pa
 import pyarrow.csv as pc
 import pyarrow.parquet as pq
+from execute import DEFAULT_SCALE_FACTOR, data_dir
 
-data_path = Path("data")
-data_path.mkdir(exist_ok=True)
+parser = argparse.ArgumentParser(description="Generate the TPC-H data and answers.")
+parser.add_argument(
+    "--scale-factor",
+    type=float,
+    default=DEFAULT_SCALE_FACTOR,
+    help="Data other than the default scale factor is written to 'data/sf<scale-factor>'.",
+)
+SCALE_FACTOR = parser.parse_args().scale_factor
 
-SCALE_FACTOR = 0.1
+data_path = data_dir(SCALE_FACTOR)
+data_path.mkdir(parents=True, exist_ok=True)
 con = duckdb.connect(database=":memory:")
 con.execute("INSTALL tpch; LOAD tpch")
 con.execute(f"CALL dbgen(sf={SCALE_FACTOR})")
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+
+
+def test_benchmark_against_itself(tmp_path: Path) -> None:
+    output = tmp_path / "results.json"
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "benchmark",
+            "run",
+            "--queries=q1",
+            "--backends=polars[lazy]",
+            "--repeats=2",
+            f"--output={output}",
+            f"--baseline={output}",
+            "--threshold=0",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=ROOT_PATH,
+    )
+    assert result.returncode == 0, result.stderr
+    (measurement,) = json.loads(output.read_text())["results"]
+    assert measurement["query"] == "q1"
+    assert len(measurement["times_s"]) == 2
+    assert measurement["narwhals_overhead_s"] > 0